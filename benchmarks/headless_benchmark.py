@@ -0,0 +1,101 @@
+"""
+Headless Engine Benchmark
+
+Runs the full engine pipeline (systems, bridge, Aether composition and Hemera encoding into a
+null sink) for N ticks without a terminal or sleeping, over a scrolling tilemap and a field of
+moving sprites, and prints the throughput and per-stage timings. The run is seeded, so the same
+arguments always simulate and render the same frames.
+
+Usage:
+    python -m benchmarks.headless_benchmark [ticks] [sprites] [--no-encode]
+"""
+
+import sys
+
+import numpy as np
+
+from nyx.moirai_ecs.component.texture_components import TextureComponent
+from nyx.moirai_ecs.component.transform_components import (
+    DimensionsComponent,
+    PositionComponent,
+    VelocityComponent,
+    ZIndexComponent,
+)
+from nyx.moirai_ecs.system.movement_system import MovementSystem
+from nyx.nyx_engine.nyx_engine import NyxEngine
+
+
+def build_scene(engine: NyxEngine, sprites: int, h: int = 360, w: int = 480, seed: int = 0):
+    """Give the engine a random 16-tile background and `sprites` sprites bouncing around the window.
+
+    Args:
+        engine (NyxEngine): The engine.
+        sprites (int): The number of sprites.
+        h (int, optional): The window height. Defaults to 360.
+        w (int, optional): The window width. Defaults to 480.
+        seed (int, optional): The scene seed. Defaults to 0.
+    """
+    rng = np.random.default_rng(seed)
+    tile_d = 32
+    tiles = {
+        tile_id: rng.integers(16, 256, (tile_d, tile_d), dtype=np.uint8) for tile_id in range(16)
+    }
+    engine.tilemap_manager.set_tileset(tiles, tile_d)
+    engine.tilemap_manager.set_tilemap(rng.integers(0, 16, (h // tile_d + 2, w // tile_d + 2)))
+    engine.add_system(MovementSystem(interpolate_render=True))
+
+    textures = [
+        TextureComponent(rng.integers(1, 256, (8, 8), dtype=np.uint8)) for _ in range(4)
+    ]
+    for texture in textures:
+        engine.entity_manager.spawn_many(
+            {
+                "position": PositionComponent(),
+                "velocity": VelocityComponent(),
+                "dimensions": DimensionsComponent(8, 8),
+                "z-index": ZIndexComponent(1),
+                "texture": texture,
+            },
+            sprites // len(textures),
+            overrides={
+                "position": {
+                    "x_pos": rng.uniform(0, w - 8, sprites // len(textures)),
+                    "y_pos": rng.uniform(0, h - 8, sprites // len(textures)),
+                },
+                "velocity": {
+                    "x_vel": rng.uniform(-60, 60, sprites // len(textures)),
+                    "y_vel": rng.uniform(-60, 60, sprites // len(textures)),
+                },
+            },
+        )
+
+
+def bounce(engine: NyxEngine, h: int = 360, w: int = 480):
+    """Reverse the velocity of the sprites leaving the window, then trigger the systems."""
+    positions = engine.component_registry["position"]
+    velocities = engine.component_registry["velocity"]
+    rows = positions.rows_of(velocities.dense_entity_ids)
+    x, y = positions.column("x_pos")[rows], positions.column("y_pos")[rows]
+    x_vel, y_vel = velocities.column("x_vel"), velocities.column("y_vel")
+    x_vel[(x < 0) | (x > w - 8)] *= -1
+    y_vel[(y < 0) | (y > h - 8)] *= -1
+    engine.tilemap_manager.pos_x += 1
+    engine.trigger_systems()
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    ticks = int(args[0]) if args else 600
+    sprites = int(args[1]) if len(args) > 1 else 1_000
+    engine = NyxEngine()
+    build_scene(engine, sprites)
+    report = engine.run_headless(
+        ticks,
+        window_h=360,
+        window_w=480,
+        update=lambda: bounce(engine),
+        encode="--no-encode" not in sys.argv,
+    )
+    print(f"{sprites} sprites")
+    print(report.format())
+    engine.scheduler.shutdown()
@@ -0,0 +1,147 @@
+"""
+Memory Benchmark
+
+Builds N entities with a typical sprite component set (position, velocity, dimensions, z-index and
+a shared texture) and reports the bytes per entity of:
+
+- `__dict__` objects: the entity and component classes as they were before `__slots__` (same
+  `__init__`, no slots).
+- slotted objects: the current `NyxEntity` and component classes.
+- the engine: `spawn_many` into the columnar component stores (numeric components live in NumPy
+  columns; only the texture component and the `NyxEntity` remain Python objects).
+
+It also times the per-entity attribute reads done by `AetherBridgeSystem` (texture lookups) for
+both object layouts, and full `MovementSystem`/`AetherBridgeSystem` updates on the engine.
+
+Usage:
+    python -m benchmarks.memory_benchmark [entity_count]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from nyx.moirai_ecs.component.base_components import NyxComponent
+from nyx.moirai_ecs.component.texture_components import TextureComponent
+from nyx.moirai_ecs.component.transform_components import (
+    DimensionsComponent,
+    PositionComponent,
+    VelocityComponent,
+    ZIndexComponent,
+)
+from nyx.moirai_ecs.entity.nyx_entity import NyxEntity
+from nyx.moirai_ecs.system.aether_bridge_system import AetherBridgeSystem
+from nyx.moirai_ecs.system.movement_system import MovementSystem
+from nyx.nyx_engine.nyx_engine import NyxEngine
+
+COMPONENT_CLASSES = (
+    PositionComponent,
+    VelocityComponent,
+    DimensionsComponent,
+    ZIndexComponent,
+    TextureComponent,
+)
+
+
+def dict_variant(cls: type) -> type:
+    """Build a `__dict__`-backed twin of a slotted class (same `__init__` and methods)."""
+    namespace = {
+        name: value
+        for name, value in vars(cls).items()
+        if name not in ("__slots__", "__dict__", "__weakref__")
+        and not isinstance(value, type(PositionComponent.x_pos))
+    }
+    return type(f"Dict{cls.__name__}", (), namespace)
+
+
+def build_objects(entity_count: int, classes: Dict[type, type]) -> List[tuple]:
+    """Build `entity_count` entities and their components as Python objects."""
+    texture = np.ones((3, 8), dtype=np.uint8)
+    entity_class = classes[NyxEntity]
+    return [
+        (
+            entity_class("laser", entity_id=entity_id),
+            classes[PositionComponent](entity_id % 400, entity_id % 300),
+            classes[VelocityComponent](600, 0),
+            classes[DimensionsComponent](3, 8),
+            classes[ZIndexComponent](4),
+            classes[TextureComponent](texture),
+        )
+        for entity_id in range(entity_count)
+    ]
+
+
+def build_engine(engine: NyxEngine, entity_count: int) -> np.ndarray:
+    """Spawn `entity_count` sprite entities into the engine's columnar component stores."""
+    ids = np.arange(entity_count)
+    return engine.entity_manager.spawn_many(
+        {
+            "position": PositionComponent(),
+            "velocity": VelocityComponent(600, 0),
+            "dimensions": DimensionsComponent(3, 8),
+            "z-index": ZIndexComponent(4),
+            "texture": TextureComponent(np.ones((3, 8), dtype=np.uint8)),
+        },
+        entity_count,
+        overrides={"position": {"x_pos": ids % 400, "render_x_pos": ids % 400}},
+        friendly_name="laser",
+    )
+
+
+def measure(build: Callable[[], object], entity_count: int):
+    """Return what `build` produced and the bytes it allocated per entity."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, (after - before) / entity_count
+
+
+def time_per_call(func: Callable[[], object], repeats: int = 5) -> float:
+    """Return the best wall time of `func` over `repeats` calls, in seconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    entity_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    slotted = {cls: cls for cls in (NyxEntity, *COMPONENT_CLASSES)}
+    dict_backed = {cls: dict_variant(cls) for cls in slotted}
+    assert all(not hasattr(cls, "__slots__") for cls in dict_backed.values())
+    assert issubclass(PositionComponent, NyxComponent)
+
+    print(f"{entity_count} entities, bytes per entity:")
+    results = {}
+    for label, classes in (("__dict__ objects", dict_backed), ("slotted objects", slotted)):
+        results[label], per_entity = measure(
+            lambda classes=classes: build_objects(entity_count, classes), entity_count
+        )
+        print(f"  {label:18s} {per_entity:8.1f}")
+    engine = NyxEngine()
+    _, per_entity = measure(lambda: build_engine(engine, entity_count), entity_count)
+    print(f"  {'engine (columnar)':18s} {per_entity:8.1f}")
+
+    print("Texture attribute reads (as in AetherBridgeSystem):")
+    for label, objects in results.items():
+        textures = [entity[5] for entity in objects]
+        read_time = time_per_call(lambda: [component.texture for component in textures])
+        print(f"  {label:18s} {read_time / entity_count * 1e9:8.1f} ns/entity")
+
+    print("System updates on the engine entities:")
+    for label, system in (
+        ("MovementSystem", MovementSystem().attach(engine)),
+        ("AetherBridgeSystem", AetherBridgeSystem().attach(engine)),
+    ):
+        update_time = time_per_call(system.update)
+        print(f"  {label:18s} {update_time * 1000:8.3f} ms/update")
@@ -0,0 +1,51 @@
+"""
+Movement Benchmark
+
+Times one vectorized `MovementSystem` update over N moving entities stored in the columnar
+position/velocity component stores, against the 60 Hz tick budget.
+
+Usage:
+    python -m benchmarks.movement_benchmark [entity_count]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from nyx.moirai_ecs.component.transform_components import PositionComponent, VelocityComponent
+from nyx.moirai_ecs.system.movement_system import MovementSystem
+from nyx.nyx_engine.nyx_engine import NyxEngine
+
+
+def populate(engine: NyxEngine, entity_count: int):
+    """Give `entity_count` entities a position and a velocity component."""
+    component_manager = engine.component_manager
+    rng = np.random.default_rng(0)
+    for entity_id, (x, y, x_vel, y_vel) in enumerate(rng.uniform(-100, 100, (entity_count, 4))):
+        component_manager.add_component(entity_id, "position", PositionComponent(x, y))
+        component_manager.add_component(entity_id, "velocity", VelocityComponent(x_vel, y_vel))
+
+
+if __name__ == "__main__":
+    entity_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    engine = NyxEngine()
+    populate(engine, entity_count)
+    budget = 1 / 60
+
+    for label, system in (
+        ("float", MovementSystem().attach(engine)),
+        ("fixed-point", MovementSystem(fixed_point=True).attach(engine)),
+    ):
+        repeats = 50
+        # Warm up (first-touch page faults and caches after populating)
+        for _ in range(repeats):
+            system.update()
+        start = time.perf_counter()
+        for _ in range(repeats):
+            system.update()
+        update_time = (time.perf_counter() - start) / repeats
+        print(
+            f"{label:12s} {entity_count} entities: {update_time * 1000:.3f} ms/update "
+            f"({update_time / budget:.1%} of a 60 Hz tick)"
+        )
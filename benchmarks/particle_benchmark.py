@@ -0,0 +1,66 @@
+"""
+Particle Pool Benchmark
+
+Measures the per-frame cost of integrating and rasterizing a full particle pool, and checks it
+against the 60 Hz frame budget.
+
+Usage:
+    python -m benchmarks.particle_benchmark [particles] [frames]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from nyx.aether_renderer.particle_pool import ParticlePool
+
+
+def run_benchmark(particles: int = 100_000, frames: int = 300, h: int = 360, w: int = 480):
+    """Keep a pool full of particles (re-emitting the expired ones) and time update + rasterize.
+
+    Args:
+        particles (int, optional): The pool capacity. Defaults to 100_000.
+        frames (int, optional): The number of frames to time. Defaults to 300.
+        h (int, optional): The layer height. Defaults to 360.
+        w (int, optional): The layer width. Defaults to 480.
+
+    Returns:
+        float: The mean time per frame, in seconds.
+    """
+    rng = np.random.default_rng(0)
+    dt = 1 / 60
+    pool = ParticlePool(particles, y_accel=9.8)
+
+    def refill():
+        n = pool.capacity - pool.count
+        pool.emit(
+            rng.uniform(0, w, n),
+            rng.uniform(0, h, n),
+            rng.uniform(-30, 30, n),
+            rng.uniform(-30, 30, n),
+            rng.uniform(0.5, 3.0, n),
+            rng.integers(16, 256, n),
+        )
+
+    layer = np.zeros((h, w), dtype=np.uint8)
+    refill()
+    elapsed = 0.0
+    for _ in range(frames):
+        start = time.perf_counter()
+        pool.update(dt)
+        layer.fill(0)
+        pool.rasterize(layer)
+        elapsed += time.perf_counter() - start
+        refill()
+    return elapsed / frames
+
+
+if __name__ == "__main__":
+    particle_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    frame_count = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    mean = run_benchmark(particle_count, frame_count)
+    budget = 1 / 60
+    print(f"particles:       {particle_count}")
+    print(f"mean frame time: {mean * 1000:.3f} ms")
+    print(f"60 Hz budget:    {budget * 1000:.3f} ms ({mean / budget:.1%} used)")
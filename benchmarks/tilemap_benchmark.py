@@ -0,0 +1,54 @@
+"""
+Tilemap Fill Benchmark
+
+Compares filling a reference tilemap with one slice assignment per tile against the vectorized
+`Tileset.fill` gathers.
+
+Usage:
+    python -m benchmarks.tilemap_benchmark [tiles_h] [tiles_w] [tile_d]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from nyx.aether_renderer.tileset import Tileset
+
+
+def loop_fill(tiles: dict, ref_tilemap: np.ndarray, tile_d: int) -> np.ndarray:
+    """The original per-tile fill: a dictionary lookup and slice assignment per tile."""
+    h, w = ref_tilemap.shape
+    filled = np.zeros((h * tile_d, w * tile_d), dtype=np.uint8)
+    for y in range(h):
+        for x in range(w):
+            filled[y * tile_d : (y + 1) * tile_d, x * tile_d : (x + 1) * tile_d] = tiles[
+                ref_tilemap[y, x]
+            ]
+    return filled
+
+
+def time_call(function, repeats: int) -> float:
+    """Return the mean time of `repeats` calls to `function`, in seconds."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function()
+    return (time.perf_counter() - start) / repeats
+
+
+if __name__ == "__main__":
+    tiles_h = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    tiles_w = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    tile_d = int(sys.argv[3]) if len(sys.argv) > 3 else 32
+
+    rng = np.random.default_rng(0)
+    tiles = {i: rng.integers(0, 256, (tile_d, tile_d), dtype=np.uint8) for i in range(16)}
+    ref_tilemap = rng.integers(0, 16, (tiles_h, tiles_w)).astype(np.uint8)
+    tileset = Tileset.from_dict(tiles)
+    buffer = tileset.fill(ref_tilemap)
+
+    loop_time = time_call(lambda: loop_fill(tiles, ref_tilemap, tile_d), 5)
+    gather_time = time_call(lambda: tileset.fill(ref_tilemap, out=buffer), 20)
+    print(f"tilemap:        {tiles_h}x{tiles_w} tiles of {tile_d}px")
+    print(f"per-tile loop:  {loop_time * 1000:.3f} ms")
+    print(f"vector fill:    {gather_time * 1000:.3f} ms ({loop_time / gather_time:.1f}x)")
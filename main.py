@@ -1,11 +1,8 @@
-from datetime import datetime
 from random import randint
-import time
 from typing import Dict, List
 
 import numpy as np
 
-from nyx.aether_renderer.tilemap_manager import TilemapManager
 from nyx.moirai_ecs.component.texture_components import TextureComponent
 from nyx.moirai_ecs.component.transform_components import (
     DimensionsComponent,
@@ -13,7 +10,9 @@ from nyx.moirai_ecs.component.transform_components import (
     VelocityComponent,
     ZIndexComponent,
 )
+from nyx.moirai_ecs.entity.entity_pool import EntityPool
 from nyx.moirai_ecs.system.movement_system import MovementSystem
+from nyx.nyx_engine.game_loop import GameLoop
 from nyx.nyx_engine.nyx_engine import NyxEngine
 from nyx.nyx_engine.utils.nyx_asset_import import NyxAssetImport
 
@@ -35,9 +34,9 @@ def generate_spacebg_tilemap(
     value_start: int,
     value_end: int,
 ):
-    return np.random.randint(
-        value_start, value_end, size=(height, width), dtype=np.uint8
-    )
+    # Tile IDs beyond 255 (large/atlas tilesets) need 16-bit reference tilemaps
+    dtype = np.uint8 if value_end <= 256 else np.uint16
+    return np.random.randint(value_start, value_end, size=(height, width), dtype=dtype)
 
 
 def generate_spaceship(engine: NyxEngine):
@@ -47,7 +46,11 @@ def generate_spaceship(engine: NyxEngine):
         "dimensions": DimensionsComponent(24, 24),
         "z-index": ZIndexComponent(3),
         "velocity": VelocityComponent(0, 100),
-        "texture": TextureComponent(texture=NyxAssetImport.open_asset("spaceship")),
+        "texture": TextureComponent(
+            region=engine.texture_atlas.add(
+                "spaceship", NyxAssetImport.open_asset("spaceship")
+            )
+        ),
     }
     for comp_name, comp in spaceship_comps.items():
         engine.component_manager.add_component(
@@ -112,7 +115,8 @@ if __name__ == "__main__":
     # Start the engine
     engine.hemera_term_fx.run_line_profile = line_profiling
     # Add required systems to loop
-    engine.add_system(MovementSystem())
+    # Render positions are interpolated between game updates when a frame falls between them
+    engine.add_system(MovementSystem(interpolate_render=True))
 
     # Set rendering window
     engine.aether_renderer.dimensions.window_h = window_height
@@ -127,9 +131,6 @@ if __name__ == "__main__":
     # Make tilemap
     tilemap = generate_spacebg_tilemap(tilemap_h, tilemap_w, tile_start, tile_end)
     tilemap_manager.set_tilemap(tilemap)
-    # Prerender tilemap
-    tilemap_manager.render()
-    rendered_tilemap = TilemapManager.rendered_tilemap
 
     # Create a planet:
     # planet_id, planet_dimensions, planet_position, planet_velocity = generate_planet(
@@ -154,12 +155,18 @@ if __name__ == "__main__":
         "dimensions": DimensionsComponent(8, 3),
         "z-index": ZIndexComponent(4),
         "velocity": VelocityComponent(600, 0),
-        "texture": TextureComponent(laser_texture),
+        "texture": TextureComponent(
+            region=engine.texture_atlas.add("laser", laser_texture)
+        ),
     }
+    # Culled lasers are released back to the pool and reused by later shots
+    laser_pool = EntityPool(
+        engine.entity_manager, laser_comps, capacity=16, friendly_name="laser"
+    )
 
-    # Start loop
-    while True:
-        start_time = datetime.now()
+    def game_tick():
+        """Advance the game by one fixed step: game logic, systems, then off-screen culling."""
+        global fire_counter, fire_interval, tilemap, tilemap_interval
 
         # Spaceship moves up and down
         if spaceship_position.render_y_pos >= (
@@ -180,15 +187,19 @@ if __name__ == "__main__":
 
         # Fire lasers randomly
         if fire_counter == fire_interval:
-            laser_comps["position"] = PositionComponent(
-                spaceship_position.render_x_pos + 10,
-                spaceship_position.render_y_pos + (spaceship_velocity.y_vel // 100),
+            laser_x = spaceship_position.render_x_pos + 10
+            laser_y = spaceship_position.render_y_pos + (spaceship_velocity.y_vel // 100)
+            laser_pool.acquire(
+                1,
+                overrides={
+                    "position": {
+                        "x_pos": laser_x,
+                        "render_x_pos": laser_x,
+                        "y_pos": laser_y,
+                        "render_y_pos": laser_y,
+                    }
+                },
             )
-            laser_id = engine.entity_manager.create_entity("laser").entity_id
-            for comp_name, comp in laser_comps.items():
-                engine.component_manager.add_component(
-                    entity_id=laser_id, component_name=comp_name, component=comp
-                )
             fire_interval = randint(1, 10)
             fire_counter = 0
         fire_counter += 1
@@ -203,15 +214,18 @@ if __name__ == "__main__":
         else:
             tilemap_manager.pos_x += 1
         tilemap_interval += 1
-        tilemap_manager.render()
 
         # Loop systems
         engine.trigger_systems()
-        # Generate frame
-        engine.render_frame()
         # Cull off-screen entities
         engine.kill_entities()
-        sleep_time = engine.sec_per_game_loop - (datetime.now() - start_time).seconds
-        time.sleep(sleep_time)
-
 
+    # Start loop: fixed-rate game updates, frames rendered at the engine's FPS target
+    game_loop = GameLoop(
+        update=game_tick,
+        render=engine.render_frame,
+        update_interval=engine.sec_per_game_loop,
+        render_interval=engine.sec_per_frame,
+        max_catch_up_steps=engine.max_catch_up_steps,
+    )
+    game_loop.run()
@@ -1,10 +1,9 @@
 from collections import deque
-from datetime import datetime
-import time
 from typing import Deque
 import numpy as np
 from nyx.hemera_term_fx.hemera_term_fx import HemeraTermFx
 from nyx.hemera_term_fx.term_utils import TerminalUtils
+from nyx.nyx_engine.game_loop import FramePacer
 from nyx.nyx_engine.utils.nyx_asset_import import NyxAssetImport
 
 
@@ -82,11 +81,10 @@ if __name__ == "__main__":
     frame_i = 0
     frame_count = len(frame_imports)
     fps = 15
-    sleep_len = 1 / fps
-    start_time = datetime.now()
+    # Frames are paced to absolute deadlines, so sleep overshoot does not accumulate
+    frame_pacer = FramePacer(1 / fps)
     while True:
-        start_time = datetime.now()
         new_frame = frame_imports.popleft()
         frame_imports.append(new_frame)
         hemera_term_api.print(new_frame)
-        time.sleep(sleep_len - (datetime.now() - start_time).seconds)
+        frame_pacer.wait()
@@ -25,11 +25,18 @@ class AetherDimensions:
         effective_window_h: The final height used by the renderer/program (in printing characters).
         effective_window_w: The final width used by the renderer/program (in printing characters).
 
+        render_scale: The integer downscale factor of the internal render resolution (1 = native).
+        render_h: The internal render height, before upscaling to the effective window.
+        render_w: The internal render width, before upscaling to the effective window.
+
+        headless: If the terminal is ignored: the requested window is used as the terminal size
+            (headless runs, where there is no TTY to measure).
+
     Methods:
         update: Update the dimensions of the rendered frames.
     """
 
-    def __init__(self, window_h: int = 0, window_w: int = 0):
+    def __init__(self, window_h: int = 0, window_w: int = 0, headless: bool = False):
         """Initialize placeholder values and trigger an update to populate them."""
         # Terminal Size
         self.term_size_h: int = 0
@@ -40,6 +47,12 @@ class AetherDimensions:
         # Actual Render Dimensions
         self.effective_window_h: int = 0
         self.effective_window_w: int = 0
+        # Internal Render Dimensions (dynamic resolution scaling)
+        self.render_scale: int = 1
+        self.render_h: int = 0
+        self.render_w: int = 0
+        # No terminal to measure
+        self.headless: bool = headless
 
         self.update()
 
@@ -48,9 +61,13 @@ class AetherDimensions:
         self._set_terminal_size()
         self._set_effective_window()
         self._truncate_odd_last_row()
+        self._set_render_size()
 
     def _set_terminal_size(self):
-        """Pad and store the current terminal size dimensions."""
+        """Pad and store the current terminal size dimensions (the requested window, if headless)."""
+        if self.headless:
+            self.term_size_h, self.term_size_w = self.window_h, self.window_w
+            return
         terminal_size_y, terminal_size_x = TerminalUtils.get_terminal_dimensions()
         padding_h = 4
         padding_w = 2
@@ -84,6 +101,14 @@ class AetherDimensions:
         if self.effective_window_h % 2 != 0:
             self.effective_window_h -= 1
 
+    def _set_render_size(self):
+        """Set the internal render size from the effective window and the render scale. Partial
+        blocks are rounded up so the upscaled frame always covers the effective window.
+        """
+        scale = max(1, int(self.render_scale))
+        self.render_h = -(-self.effective_window_h // scale)
+        self.render_w = -(-self.effective_window_w // scale)
+
     def _window_is_set(self) -> bool:
         """Check if the window has been set by the program.
 
@@ -15,11 +15,15 @@ Mythology:
     untainted essence that fills the heavens.
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
 from nyx.aether_renderer.aether_dimensions import AetherDimensions
+from nyx.aether_renderer.palette_lut import PaletteLUT
+from nyx.aether_renderer.particle_pool import ParticlePool
+from nyx.aether_renderer.resolution_scaler import ResolutionScaler
+from nyx.aether_renderer.tilemap_manager import TilemapManager
 
 
 class AetherRenderer:
@@ -33,10 +37,22 @@ class AetherRenderer:
         layered_entities (Dict[int, List[Tuple[int, int, np.ndarray]]]): The entities to render.
         layered_frames (Dict[int, np.ndarray]): The subframes for each z-index layer.
         merged_frame (np.ndarray): The final merged frame to be printed.
+        resolution_scaler (ResolutionScaler): The frame-time controller for the internal render
+            scale. Disabled by default (always native resolution).
+        post_process_lut (np.ndarray): The palette LUT applied to the merged frame, or None.
+        particle_pools (Dict[int, List[ParticlePool]]): The particle pools drawn on each z-index.
+        tilemap_layers (Dict[int, TilemapManager]): The tilemap drawn on each z-index.
+        opaque_z_index (Optional[int]): The highest z-index covered by an opaque tilemap this
+            frame; lower layers are not merged once the frame has no color-0 pixels left there.
 
     Methods:
         accept_entities: Receive and store the list of entities to render from AetherBridgeSystem.
         render: Trigger a render of the current entities list held by Aether.
+        set_post_process_lut: Set the palette LUT applied to every merged frame.
+        add_particle_pool: Draw a particle pool on a z-index layer.
+        add_tilemap: Draw a tilemap on its z-index layer.
+        remove_tilemap: Stop drawing a tilemap.
+        scroll_tilemaps: Scroll every tilemap layer by its parallax factor.
     """
 
     def __init__(self, window_h: int = 0, window_w: int = 0):
@@ -62,6 +78,19 @@ class AetherRenderer:
         # Background color
         self.background_color_code = 0
 
+        # Dynamic resolution scaling (disabled until `resolution_scaler.enabled` is set)
+        self.resolution_scaler = ResolutionScaler()
+
+        # Whole-frame palette effect (None = no post-processing)
+        self.post_process_lut: Optional[np.ndarray] = None
+
+        # Particle pools, drawn on top of the sprites of their layer
+        self.particle_pools: Dict[int, List[ParticlePool]] = {}
+
+        # Tilemap layers, each keeping its own render cache
+        self.tilemap_layers: Dict[int, TilemapManager] = {}
+        self.opaque_z_index: Optional[int] = None
+
     def accept_entities(self, entities: Dict[int, List[Tuple[int, int, np.ndarray]]]):
         """Receive and store the list of entities to render from AetherBridgeSystem
 
@@ -78,24 +107,90 @@ class AetherRenderer:
             np.ndarray: The merged, 2D frame with uint8 datatype.
         """
         self.layered_frames = {}
-        if not self.layered_entities:
+        if not self.layered_entities and not self.particle_pools and not self.tilemap_layers:
             raise ValueError("AetherRenderer has no layers to render.")
+        if self.resolution_scaler.enabled:
+            self.dimensions.render_scale = self.resolution_scaler.scale
         self.dimensions.update()
         self._new_merged_frame()
-        self._process_tilemap_component()
+        self._process_tilemap_layers()
         self._process_layers()
+        self._process_particles()
         self._merge_layers()
         self._apply_bg_color()
+        self._apply_post_process()
+        self._upscale_frame()
         return self.merged_frame
 
+    def set_post_process_lut(self, lut: Optional[np.ndarray]):
+        """Set the palette LUT applied to every merged frame (see `PaletteLUT`). Identity LUTs are
+        dropped so they cost nothing per frame.
+
+        Args:
+            lut (Optional[np.ndarray]): A (256,) uint8 LUT, or None to disable post-processing.
+
+        Raises:
+            ValueError: If the LUT is not a (256,) uint8 array.
+        """
+        if lut is not None:
+            PaletteLUT.validate(lut)
+            if PaletteLUT.is_identity(lut):
+                lut = None
+        self.post_process_lut = lut
+
+    def add_particle_pool(self, pool: ParticlePool, z_index: int):
+        """Draw a particle pool on a z-index layer every frame.
+
+        Args:
+            pool (ParticlePool): The particle pool to draw.
+            z_index (int): The layer to draw the particles on.
+        """
+        self.particle_pools.setdefault(z_index, []).append(pool)
+
+    def add_tilemap(self, tilemap: TilemapManager):
+        """Draw a tilemap on its z-index layer every frame (replacing any tilemap on that layer).
+
+        Args:
+            tilemap (TilemapManager): The tilemap layer to draw.
+        """
+        self.tilemap_layers[tilemap.z_index] = tilemap
+
+    def remove_tilemap(self, tilemap: TilemapManager):
+        """Stop drawing a tilemap.
+
+        Args:
+            tilemap (TilemapManager): The tilemap layer to remove.
+
+        Raises:
+            KeyError: If the tilemap is not registered on its z-index.
+        """
+        if self.tilemap_layers.get(tilemap.z_index) is not tilemap:
+            raise KeyError(f"No such tilemap on z-index {tilemap.z_index}.")
+        del self.tilemap_layers[tilemap.z_index]
+
+    def scroll_tilemaps(self, scroll_x: float, scroll_y: float):
+        """Scroll every tilemap layer to a camera/world offset scaled by the layer's parallax.
+
+        Args:
+            scroll_x (float): The horizontal scroll offset in pixels.
+            scroll_y (float): The vertical scroll offset in pixels.
+        """
+        for tilemap in self.tilemap_layers.values():
+            tilemap.set_scroll(scroll_x, scroll_y)
+
+    @property
+    def render_scale(self) -> int:
+        """The integer downscale factor of the internal render resolution (1 = native)."""
+        return self.dimensions.render_scale
+
     def _new_merged_frame(self):
         """Create a new/blank merged frame (2D ndarray) of the correct dimensions for the z-index
         layers to collapse into.
         """
         self.merged_frame = np.zeros(
             (
-                self.dimensions.effective_window_h,
-                self.dimensions.effective_window_w,
+                self.dimensions.render_h,
+                self.dimensions.render_w,
             ),
             dtype=np.uint8,
         )
@@ -104,15 +199,28 @@ class AetherRenderer:
         """Iterate through each z-index layer and process entities/components by calling a specific
         system from the MorosECS and directing them to the appropriate subframe to write to.
         """
+        scale = self.dimensions.render_scale
         for z_index, entity_list in self.layered_entities.items():
-            self._new_subframe(z_index)
+            subframe = self._writable_subframe(z_index)
             for entity in entity_list:
                 # Get frame/dimensions
-                frame_w = self.dimensions.effective_window_w
-                frame_h = self.dimensions.effective_window_h
-                subframe = self.layered_frames[z_index]
+                frame_w = self.dimensions.render_w
+                frame_h = self.dimensions.render_h
                 # Get texture
                 x, y, texture = entity
+                if isinstance(x, np.ndarray):
+                    self._blit_batch(subframe, x, y, texture, scale)
+                    continue
+                if scale > 1:
+                    x, y, texture = self._scale_sprite(x, y, texture, scale)
+                # Clip sprites hanging off the left/top edges (negative offsets would otherwise
+                # slice from the end of the frame)
+                if x < 0:
+                    texture = texture[:, -x:]
+                    x = 0
+                if y < 0:
+                    texture = texture[-y:, :]
+                    y = 0
                 h, w = texture.shape
                 # Limit w and h to fit within the frame boundaries
                 w = min(w, frame_w - x)
@@ -121,18 +229,135 @@ class AetherRenderer:
                 if w > 0 and h > 0:
                     subframe[y : y + h, x : x + w] = texture[:h, :w]
 
+    def _process_particles(self):
+        """Rasterize every particle pool into its z-index layer (one scatter per pool)."""
+        scale = self.dimensions.render_scale
+        for z_index, pools in self.particle_pools.items():
+            subframe = self._writable_subframe(z_index)
+            for pool in pools:
+                pool.rasterize(subframe, scale)
+
+    def _writable_subframe(self, z_index: int) -> np.ndarray:
+        """Get the subframe of a z-index for drawing, creating it if needed.
+
+        Note:
+            Tilemap layers are views of the tilemap's render cache, which must never be drawn
+            into, so a borrowed buffer is copied before the first sprite/particle is drawn on it.
+        """
+        subframe = self.layered_frames.get(z_index)
+        if subframe is None:
+            self._new_subframe(z_index)
+        elif subframe.base is not None:
+            self.layered_frames[z_index] = subframe.copy()
+        return self.layered_frames[z_index]
+
     def _new_subframe(self, z_index: int = 0):
         """Create a new/blank 2D ndarray for each z-index/priority/layer and insert that subframe
         into the subframe dict with its z-indice as the key value.
         """
         self.layered_frames[z_index] = np.zeros(
             (
-                self.dimensions.effective_window_h,
-                self.dimensions.effective_window_w,
+                self.dimensions.render_h,
+                self.dimensions.render_w,
             ),
             dtype=np.uint8,
         )
 
+    @staticmethod
+    def _scale_sprite(
+        x: int, y: int, texture: np.ndarray, scale: int
+    ) -> Tuple[int, int, np.ndarray]:
+        """Map a sprite from window coordinates to the internal render resolution.
+
+        The texture is point-sampled on the same pixel grid as the internal frame: internal pixel
+        (iy, ix) samples window pixel (iy * scale, ix * scale), so sprites stay aligned with the
+        tilemap and with each other at any scale.
+
+        Args:
+            x (int): The x-position of the sprite in window pixels.
+            y (int): The y-position of the sprite in window pixels.
+            texture (np.ndarray): The full-resolution sprite texture.
+            scale (int): The integer render scale.
+
+        Returns:
+            Tuple[int, int, np.ndarray]: The internal position and the sampled texture view.
+        """
+        internal_x = -(-x // scale)
+        internal_y = -(-y // scale)
+        return (
+            internal_x,
+            internal_y,
+            texture[internal_y * scale - y :: scale, internal_x * scale - x :: scale],
+        )
+
+    @staticmethod
+    def _blit_batch(
+        subframe: np.ndarray,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        texture: np.ndarray,
+        scale: int = 1,
+    ):
+        """Composite many copies of one texture into a subframe with a single scatter.
+
+        The (n, rows, cols) target pixel coordinates of all sprites are built by broadcasting, the
+        pixels outside the subframe are masked out, and the remaining texture pixels are written
+        with one fancy-index assignment. As with single sprites, later sprites overwrite earlier
+        ones, and sprites are point-sampled on the internal pixel grid when `scale` > 1.
+
+        Args:
+            subframe (np.ndarray): The layer to draw into (internal resolution).
+            xs (np.ndarray): The x-positions of the sprites, in window pixels.
+            ys (np.ndarray): The y-positions of the sprites, in window pixels.
+            texture (np.ndarray): The texture shared by every sprite.
+            scale (int, optional): The integer render scale. Defaults to 1.
+        """
+        frame_h, frame_w = subframe.shape
+        tex_h, tex_w = texture.shape
+        # Internal-resolution rows/cols covered by each sprite
+        rows = (-(-ys // scale))[:, None] + np.arange(-(-tex_h // scale))
+        cols = (-(-xs // scale))[:, None] + np.arange(-(-tex_w // scale))
+        # Texture row/col sampled by each internal row/col
+        tex_rows = rows * scale - ys[:, None]
+        tex_cols = cols * scale - xs[:, None]
+
+        valid_rows = (rows >= 0) & (rows < frame_h) & (tex_rows < tex_h)
+        valid_cols = (cols >= 0) & (cols < frame_w) & (tex_cols < tex_w)
+        valid = valid_rows[:, :, None] & valid_cols[:, None, :]
+        if not valid.any():
+            return
+
+        shape = valid.shape
+        if scale == 1:
+            pixels = np.broadcast_to(texture, shape)
+        else:
+            pixels = texture[
+                np.minimum(tex_rows, tex_h - 1)[:, :, None],
+                np.minimum(tex_cols, tex_w - 1)[:, None, :],
+            ]
+        subframe[
+            np.broadcast_to(rows[:, :, None], shape)[valid],
+            np.broadcast_to(cols[:, None, :], shape)[valid],
+        ] = pixels[valid]
+
+    def _upscale_frame(self):
+        """Integer-upscale the internal merged frame to the effective window dimensions.
+
+        Note:
+            The upscale is a single copy of a broadcast view: each internal pixel is broadcast to a
+            (scale x scale) block without intermediate `np.repeat` arrays.
+        """
+        scale = self.dimensions.render_scale
+        if scale == 1:
+            return
+        h, w = self.merged_frame.shape
+        blocks = np.broadcast_to(
+            self.merged_frame[:, None, :, None], (h, scale, w, scale)
+        )
+        self.merged_frame = blocks.reshape(h * scale, w * scale)[
+            : self.dimensions.effective_window_h, : self.dimensions.effective_window_w
+        ]
+
     def _merge_layers(self):
         """Merge each z-index subframe (2D ndarray) into the merged frame (2D ndarray) by filling
         transparencies (np.uint8(0)) while iterating the z-indices from high to low.
@@ -149,6 +374,9 @@ class AetherRenderer:
             merged_frame = np.where(
                 merged_frame == 0, subframe_stack[z_index], merged_frame
             )
+            # Nothing below an opaque tilemap can show through, unless it left color-0 holes
+            if z_index == self.opaque_z_index and merged_frame.all():
+                break
 
         # Update the instance's reference to the new ndarray (due to np.where creating a new frame)
         self.merged_frame = merged_frame
@@ -160,17 +388,35 @@ class AetherRenderer:
         if self.background_color_code != 0:
             self.merged_frame[self.merged_frame == 0] = self.background_color_code
 
-    def _process_tilemap_component(self):
-        """Process a `TilemapComponent` by its associated `MorosSystem`.
+    def _apply_post_process(self):
+        """Remap every pixel of the merged frame through the post-process LUT, in place.
 
-        Args:
-            component (TilemapComponent): The component holding a tilemap array.
+        Note:
+            Applied before upscaling, so the gather only touches the internal-resolution pixels.
         """
-        from nyx.nyx_engine.nyx_engine import NyxEngine
-        engine = NyxEngine()
-        frame_w = self.dimensions.effective_window_w
-        frame_h = self.dimensions.effective_window_h
+        if self.post_process_lut is not None:
+            np.take(
+                self.post_process_lut, self.merged_frame, out=self.merged_frame, mode="clip"
+            )
 
-        self.layered_frames[0] = engine.tilemap_manager.rendered_tilemap[
-            :frame_h, :frame_w
-        ]
+    def _process_tilemap_layers(self):
+        """Render every tilemap layer and insert it (as a view of its cache) into its z-index.
+
+        Note:
+            Each tilemap keeps its own render cache; a layer whose integer offset did not change
+            since the last frame is reused without any copying or recompositing. Tilemaps are
+            composed directly at the internal render resolution.
+        """
+        frame_w = self.dimensions.render_w
+        frame_h = self.dimensions.render_h
+        self.opaque_z_index = None
+
+        for z_index, tilemap in self.tilemap_layers.items():
+            if not tilemap.is_ready:
+                continue
+            tilemap.render()
+            self.layered_frames[z_index] = tilemap.rendered_tilemap[:frame_h, :frame_w]
+            if not tilemap.transparent and (
+                self.opaque_z_index is None or z_index > self.opaque_z_index
+            ):
+                self.opaque_z_index = z_index
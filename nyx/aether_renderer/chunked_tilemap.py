@@ -0,0 +1,262 @@
+"""
+Chunked Tilemap Module
+
+This module streams large world tilemaps from disk. The world is a 2D array of tile IDs stored as a
+`.npy` file and opened as a read-only memory map; it is split into fixed-size square chunks that are
+copied into memory lazily when the viewport first needs them, prefetched on a background thread in
+the direction of motion, and evicted least-recently-used. Resident memory is bounded by
+`max_chunks * chunk_size ** 2` tile IDs, independent of the size of the world.
+
+A `ChunkedTilemap` can be passed to `TilemapManager.set_tilemap` in place of a NumPy array; like an
+in-memory tilemap, the world wraps around at its edges.
+
+Classes:
+    ChunkedTilemap: A lazily loaded, LRU-cached, chunked view of a memory-mapped tilemap.
+"""
+
+import os
+import queue
+import threading
+from collections import OrderedDict
+from typing import Optional, Set, Tuple
+
+import numpy as np
+
+
+class ChunkedTilemap:
+    """A lazily loaded, LRU-cached, chunked view of a memory-mapped tilemap.
+
+    Attributes:
+        source (np.ndarray): The full (h, w) tilemap, normally a read-only `np.memmap`.
+        chunk_size (int): The height/width of a chunk in tiles.
+        max_chunks (int): The maximum number of chunks kept in memory.
+        chunks (OrderedDict): The resident chunks keyed by (chunk_row, chunk_col), oldest first.
+        chunks_loaded (int): The number of chunks read from the source so far.
+        chunks_evicted (int): The number of chunks dropped by the LRU so far.
+        nbytes (int): The bytes used by the resident chunks.
+        max_nbytes (int): The upper bound on `nbytes`, for sizing the chunk cache.
+
+    Methods:
+        open: Open a `.npy` tilemap file as a memory-mapped chunked tilemap.
+        save: Write a tilemap array to a `.npy` file.
+        get_chunk: Get a chunk, loading it if it is not resident.
+        get_block: Get the tile IDs of a block of (wrapping) world tiles.
+        prefetch: Queue the chunks ahead of a moving viewport for background loading.
+        close: Stop the prefetch thread.
+    """
+
+    def __init__(
+        self,
+        source: np.ndarray,
+        chunk_size: int = 64,
+        max_chunks: int = 64,
+        prefetch: bool = True,
+    ):
+        """Initialize the chunked tilemap over a 2D tile ID array.
+
+        Args:
+            source (np.ndarray): The full (h, w) tilemap (an `np.memmap` for disk streaming).
+            chunk_size (int, optional): The height/width of a chunk in tiles. Defaults to 64.
+            max_chunks (int, optional): The maximum number of resident chunks. Defaults to 64.
+            prefetch (bool, optional): If chunks ahead of the viewport are loaded on a background
+                thread. Defaults to True.
+
+        Raises:
+            ValueError: If the source is not 2D or the chunk/cache sizes are not positive.
+        """
+        if source.ndim != 2:
+            raise ValueError("Chunked tilemaps must be 2D arrays of tile IDs.")
+        if chunk_size <= 0 or max_chunks <= 0:
+            raise ValueError("The chunk size and the maximum number of chunks must be positive.")
+        self.source = source
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.chunks: "OrderedDict[Tuple[int, int], np.ndarray]" = OrderedDict()
+        self.chunks_loaded = 0
+        self.chunks_evicted = 0
+
+        self._lock = threading.Lock()
+        self._pending: Set[Tuple[int, int]] = set()
+        self._requests: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+        if prefetch:
+            self._requests = queue.Queue()
+            self._worker = threading.Thread(target=self._prefetch_worker, daemon=True)
+            self._worker.start()
+
+    @classmethod
+    def open(
+        cls,
+        path: str,
+        chunk_size: int = 64,
+        max_chunks: int = 64,
+        prefetch: bool = True,
+    ) -> "ChunkedTilemap":
+        """Open a `.npy` tilemap file as a memory-mapped chunked tilemap.
+
+        Args:
+            path (str): The path to the `.npy` file.
+            chunk_size (int, optional): The height/width of a chunk in tiles. Defaults to 64.
+            max_chunks (int, optional): The maximum number of resident chunks. Defaults to 64.
+            prefetch (bool, optional): If background prefetching is enabled. Defaults to True.
+
+        Returns:
+            ChunkedTilemap: The chunked tilemap.
+        """
+        return cls(np.load(path, mmap_mode="r"), chunk_size, max_chunks, prefetch)
+
+    @staticmethod
+    def save(path: str, tilemap: np.ndarray):
+        """Write a tilemap array to a `.npy` file that can be streamed with `open`.
+
+        Args:
+            path (str): The path to the `.npy` file.
+            tilemap (np.ndarray): The (h, w) tile IDs.
+        """
+        np.save(os.fspath(path), tilemap)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """The (h, w) size of the world in tiles."""
+        return self.source.shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        """The dtype of the tile IDs."""
+        return self.source.dtype
+
+    @property
+    def nbytes(self) -> int:
+        """The bytes used by the resident chunks."""
+        with self._lock:
+            return sum(chunk.nbytes for chunk in self.chunks.values())
+
+    @property
+    def max_nbytes(self) -> int:
+        """The upper bound on the bytes used by the resident chunks (`max_chunks` full chunks)."""
+        return self.max_chunks * self.chunk_size**2 * self.source.dtype.itemsize
+
+    @property
+    def chunk_grid(self) -> Tuple[int, int]:
+        """The number of chunk rows and columns covering the world."""
+        h, w = self.source.shape
+        return -(-h // self.chunk_size), -(-w // self.chunk_size)
+
+    def get_chunk(self, chunk_row: int, chunk_col: int) -> np.ndarray:
+        """Get a chunk, loading it from the source if it is not resident.
+
+        Args:
+            chunk_row (int): The chunk row.
+            chunk_col (int): The chunk column.
+
+        Returns:
+            np.ndarray: The chunk's tile IDs (chunks on the far edges of the world may be smaller
+                than `chunk_size`).
+        """
+        key = (chunk_row, chunk_col)
+        with self._lock:
+            chunk = self.chunks.get(key)
+            if chunk is not None:
+                self.chunks.move_to_end(key)
+                return chunk
+        return self._load_chunk(key)
+
+    def get_block(self, world_rows: np.ndarray, world_cols: np.ndarray) -> np.ndarray:
+        """Get the tile IDs of a block of world tiles; the world wraps around at its edges.
+
+        Args:
+            world_rows (np.ndarray): The world tile rows of the block.
+            world_cols (np.ndarray): The world tile columns of the block.
+
+        Returns:
+            np.ndarray: The (rows, cols) tile IDs.
+        """
+        h, w = self.source.shape
+        size = self.chunk_size
+        rows = np.asarray(world_rows) % h
+        cols = np.asarray(world_cols) % w
+        chunk_rows, chunk_cols = rows // size, cols // size
+        block = np.empty((rows.size, cols.size), dtype=self.source.dtype)
+
+        # One gather per chunk touched by the block
+        for chunk_row in np.unique(chunk_rows):
+            in_row = np.flatnonzero(chunk_rows == chunk_row)
+            for chunk_col in np.unique(chunk_cols):
+                in_col = np.flatnonzero(chunk_cols == chunk_col)
+                chunk = self.get_chunk(int(chunk_row), int(chunk_col))
+                block[np.ix_(in_row, in_col)] = chunk[
+                    np.ix_(rows[in_row] % size, cols[in_col] % size)
+                ]
+        return block
+
+    def prefetch(
+        self, tile_y: int, tile_x: int, view_h: int, view_w: int, dir_y: int, dir_x: int
+    ):
+        """Queue the chunks one chunk ahead of a moving viewport for background loading.
+
+        Args:
+            tile_y (int): The top world tile row of the viewport.
+            tile_x (int): The left world tile column of the viewport.
+            view_h (int): The height of the viewport in tiles.
+            view_w (int): The width of the viewport in tiles.
+            dir_y (int): The vertical direction of motion (-1, 0 or 1).
+            dir_x (int): The horizontal direction of motion (-1, 0 or 1).
+        """
+        if self._requests is None or (dir_y == 0 and dir_x == 0):
+            return
+        ahead_y = tile_y + int(np.sign(dir_y)) * self.chunk_size
+        ahead_x = tile_x + int(np.sign(dir_x)) * self.chunk_size
+        grid_h, grid_w = self.chunk_grid
+        h, w = self.source.shape
+        rows = np.unique((np.arange(ahead_y, ahead_y + view_h) % h) // self.chunk_size)
+        cols = np.unique((np.arange(ahead_x, ahead_x + view_w) % w) // self.chunk_size)
+        with self._lock:
+            for chunk_row in rows:
+                for chunk_col in cols:
+                    key = (int(chunk_row) % grid_h, int(chunk_col) % grid_w)
+                    if key in self.chunks or key in self._pending:
+                        continue
+                    self._pending.add(key)
+                    self._requests.put(key)
+
+    def close(self):
+        """Stop the prefetch thread (resident chunks stay usable)."""
+        if self._worker is not None:
+            self._requests.put(None)
+            self._worker.join()
+            self._worker = None
+            self._requests = None
+
+    def _load_chunk(self, key: Tuple[int, int]) -> np.ndarray:
+        """Copy a chunk out of the source and insert it into the LRU."""
+        size = self.chunk_size
+        chunk_row, chunk_col = key
+        chunk = np.array(
+            self.source[
+                chunk_row * size : (chunk_row + 1) * size,
+                chunk_col * size : (chunk_col + 1) * size,
+            ]
+        )
+        chunk.flags.writeable = False
+        with self._lock:
+            # Another thread may have loaded the chunk while this one was reading
+            resident = self.chunks.get(key)
+            if resident is not None:
+                self.chunks.move_to_end(key)
+                return resident
+            self.chunks[key] = chunk
+            self.chunks_loaded += 1
+            while len(self.chunks) > self.max_chunks:
+                self.chunks.popitem(last=False)
+                self.chunks_evicted += 1
+        return chunk
+
+    def _prefetch_worker(self):
+        """Load queued chunks until a `None` request is received."""
+        while True:
+            key = self._requests.get()
+            if key is None:
+                return
+            self._load_chunk(key)
+            with self._lock:
+                self._pending.discard(key)
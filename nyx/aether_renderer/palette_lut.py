@@ -0,0 +1,189 @@
+"""
+Palette Lookup Table Module
+
+This module builds 256-entry uint8 lookup tables (LUTs) over the ANSI 256-color palette. A LUT
+remaps every color code of a finished frame in one vectorized gather, which makes whole-frame color
+effects (fades, damage flashes, night tints, palette cycling) independent of the number of sprites.
+
+LUTs are composable: `compose(a, b)` produces a single LUT equivalent to applying `a` and then `b`,
+so stacked effects still cost one gather per frame. Builders are cached per effect parameter and
+return read-only arrays, so they can be called every frame without rebuilding the table.
+
+Color code 0 is the engine's empty/transparent pixel and is never remapped by the effect builders.
+
+Classes:
+    PaletteLUT: A collection of static methods that build and combine palette lookup tables.
+"""
+
+from functools import lru_cache
+from typing import Dict
+
+import numpy as np
+
+
+def _build_ansi_rgb() -> np.ndarray:
+    """Build the (256, 3) RGB approximation of the xterm 256-color palette."""
+    rgb = np.zeros((256, 3), dtype=np.float64)
+    rgb[:16] = [
+        (0, 0, 0), (128, 0, 0), (0, 128, 0), (128, 128, 0),
+        (0, 0, 128), (128, 0, 128), (0, 128, 128), (192, 192, 192),
+        (128, 128, 128), (255, 0, 0), (0, 255, 0), (255, 255, 0),
+        (0, 0, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255),
+    ]
+    levels = np.array([0, 95, 135, 175, 215, 255], dtype=np.float64)
+    cube = np.arange(216)
+    rgb[16:232, 0] = levels[cube // 36]
+    rgb[16:232, 1] = levels[(cube // 6) % 6]
+    rgb[16:232, 2] = levels[cube % 6]
+    rgb[232:] = (8 + 10 * np.arange(24))[:, None]
+    return rgb
+
+
+ANSI_RGB = _build_ansi_rgb()
+
+
+class PaletteLUT:
+    """A collection of static methods that build and combine palette lookup tables.
+
+    Methods:
+        identity(): Return the identity LUT.
+        is_identity(): Check if a LUT leaves every color unchanged.
+        compose(): Combine LUTs into a single LUT applied left to right.
+        from_mapping(): Build a LUT from a sparse {color: new_color} mapping.
+        fade(): Scale the brightness of every color.
+        tint(): Blend every color towards a target color.
+        cycle(): Rotate a range of color codes (palette cycling).
+        validate(): Ensure a LUT is a 256-entry uint8 array.
+    """
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def identity() -> np.ndarray:
+        """Return the identity LUT (every color maps to itself).
+
+        Returns:
+            np.ndarray: The read-only identity LUT.
+        """
+        return PaletteLUT._freeze(np.arange(256, dtype=np.uint8))
+
+    @staticmethod
+    def is_identity(lut: np.ndarray) -> bool:
+        """Check if a LUT leaves every color unchanged.
+
+        Args:
+            lut (np.ndarray): The LUT to check.
+
+        Returns:
+            bool: If the LUT is the identity.
+        """
+        return lut is PaletteLUT.identity() or np.array_equal(lut, PaletteLUT.identity())
+
+    @staticmethod
+    def compose(*luts: np.ndarray) -> np.ndarray:
+        """Combine LUTs into a single LUT equivalent to applying them from left to right.
+
+        Args:
+            *luts (np.ndarray): The LUTs to combine.
+
+        Returns:
+            np.ndarray: The composed, read-only LUT.
+        """
+        result = PaletteLUT.identity()
+        for lut in luts:
+            PaletteLUT.validate(lut)
+            result = lut[result]
+        return PaletteLUT._freeze(result)
+
+    @staticmethod
+    def from_mapping(mapping: Dict[int, int]) -> np.ndarray:
+        """Build a LUT from a sparse {color: new_color} mapping; other colors are unchanged.
+
+        Args:
+            mapping (Dict[int, int]): The color codes to replace.
+
+        Returns:
+            np.ndarray: The read-only LUT.
+        """
+        lut = np.arange(256, dtype=np.uint8)
+        for color, new_color in mapping.items():
+            lut[color] = new_color
+        return PaletteLUT._freeze(lut)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def fade(level: float) -> np.ndarray:
+        """Scale the brightness of every color (0.0 = black, 1.0 = unchanged).
+
+        Args:
+            level (float): The brightness multiplier, clamped to [0, 1].
+
+        Returns:
+            np.ndarray: The read-only LUT.
+        """
+        level = min(max(level, 0.0), 1.0)
+        if level == 1.0:
+            return PaletteLUT.identity()
+        return PaletteLUT._from_rgb(ANSI_RGB * level)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def tint(color_code: int, strength: float) -> np.ndarray:
+        """Blend every color towards a target color (e.g. red for a damage flash, dark blue for a
+        night tint).
+
+        Args:
+            color_code (int): The ANSI color code to blend towards.
+            strength (float): The blend amount, clamped to [0, 1] (1 = every color is the target).
+
+        Returns:
+            np.ndarray: The read-only LUT.
+        """
+        strength = min(max(strength, 0.0), 1.0)
+        if strength == 0.0:
+            return PaletteLUT.identity()
+        target = ANSI_RGB[color_code]
+        return PaletteLUT._from_rgb(ANSI_RGB + (target - ANSI_RGB) * strength)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def cycle(start: int, end: int, shift: int) -> np.ndarray:
+        """Rotate the color codes in [start, end] by `shift` positions (palette cycling).
+
+        Args:
+            start (int): The first color code of the cycled range.
+            end (int): The last color code of the cycled range (inclusive).
+            shift (int): The number of positions to rotate by.
+
+        Returns:
+            np.ndarray: The read-only LUT.
+        """
+        lut = np.arange(256, dtype=np.uint8)
+        lut[start : end + 1] = np.roll(lut[start : end + 1], -shift)
+        return PaletteLUT._freeze(lut)
+
+    @staticmethod
+    def _from_rgb(rgb: np.ndarray) -> np.ndarray:
+        """Map a (256, 3) array of target RGB values to the nearest extended palette colors."""
+        # Only the 6x6x6 cube and the grayscale ramp are used as targets; the 16 system colors are
+        # themed differently by each terminal.
+        candidates = ANSI_RGB[16:]
+        distances = ((rgb[:, None, :] - candidates[None, :, :]) ** 2).sum(axis=2)
+        lut = (np.argmin(distances, axis=1) + 16).astype(np.uint8)
+        lut[0] = 0
+        return PaletteLUT._freeze(lut)
+
+    @staticmethod
+    def validate(lut: np.ndarray):
+        """Ensure a LUT is a 256-entry uint8 array.
+
+        Raises:
+            ValueError: If the LUT has the wrong shape or dtype.
+        """
+        if not isinstance(lut, np.ndarray) or lut.shape != (256,) or lut.dtype != np.uint8:
+            raise ValueError("Palette LUTs must be NumPy arrays of shape (256,) and 'uint8'.")
+
+    @staticmethod
+    def _freeze(lut: np.ndarray) -> np.ndarray:
+        """Mark a LUT read-only so cached tables cannot be modified by callers."""
+        lut.flags.writeable = False
+        return lut
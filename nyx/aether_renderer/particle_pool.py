@@ -0,0 +1,160 @@
+"""
+Particle Pool Module
+
+This module stores particles (star fields, sparks, explosions) as NumPy columns instead of ECS
+entities. All particles of a pool are integrated with a handful of vectorized operations and drawn
+into an Aether layer with a single fancy-index scatter, so the per-particle Python cost is zero.
+
+Classes:
+    ParticlePool: Fixed-capacity, struct-of-arrays particle storage with swap-remove recycling.
+"""
+
+import numpy as np
+
+
+class ParticlePool:
+    """Fixed-capacity, struct-of-arrays particle storage with swap-remove recycling.
+
+    Live particles are always packed in rows [0, count). When particles expire, the live particles
+    from the end of the pool are moved into the freed rows, so the pool never has holes and no
+    memory is allocated after construction. Positions are screen pixels and velocities are pixels
+    per second.
+
+    Attributes:
+        capacity (int): The maximum number of live particles.
+        count (int): The current number of live particles.
+        x_pos (np.ndarray): The x-coordinate of each particle (float32).
+        y_pos (np.ndarray): The y-coordinate of each particle (float32).
+        x_vel (np.ndarray): The x-velocity of each particle (float32).
+        y_vel (np.ndarray): The y-velocity of each particle (float32).
+        lifetime (np.ndarray): The remaining lifetime of each particle in seconds (float32).
+        color (np.ndarray): The ANSI color code of each particle (uint8).
+        x_accel (float): A constant x-acceleration applied to every particle (e.g. wind).
+        y_accel (float): A constant y-acceleration applied to every particle (e.g. gravity).
+
+    Methods:
+        emit: Add particles to the pool.
+        update: Integrate the particles and recycle the expired ones.
+        rasterize: Draw the live particles into a frame/layer.
+        clear: Remove all particles.
+    """
+
+    def __init__(self, capacity: int, x_accel: float = 0.0, y_accel: float = 0.0):
+        """Allocate the particle columns.
+
+        Args:
+            capacity (int): The maximum number of live particles.
+            x_accel (float, optional): Constant x-acceleration. Defaults to 0.0.
+            y_accel (float, optional): Constant y-acceleration. Defaults to 0.0.
+        """
+        self.capacity = capacity
+        self.count = 0
+        self.x_pos = np.zeros(capacity, dtype=np.float32)
+        self.y_pos = np.zeros(capacity, dtype=np.float32)
+        self.x_vel = np.zeros(capacity, dtype=np.float32)
+        self.y_vel = np.zeros(capacity, dtype=np.float32)
+        self.lifetime = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros(capacity, dtype=np.uint8)
+        self.x_accel = x_accel
+        self.y_accel = y_accel
+
+    def __len__(self) -> int:
+        return self.count
+
+    def emit(self, x_pos, y_pos, x_vel=0.0, y_vel=0.0, lifetime=1.0, color=15) -> int:
+        """Add particles to the pool. Every argument is a scalar or an array; they are broadcast to
+        a common length. Particles that do not fit in the remaining capacity are dropped.
+
+        Args:
+            x_pos (float | np.ndarray): The x-coordinate(s).
+            y_pos (float | np.ndarray): The y-coordinate(s).
+            x_vel (float | np.ndarray, optional): The x-velocity(s). Defaults to 0.0.
+            y_vel (float | np.ndarray, optional): The y-velocity(s). Defaults to 0.0.
+            lifetime (float | np.ndarray, optional): The lifetime(s) in seconds; `np.inf` never
+                expires. Defaults to 1.0.
+            color (int | np.ndarray, optional): The ANSI color code(s). Defaults to 15.
+
+        Returns:
+            int: The number of particles added.
+        """
+        columns = np.broadcast_arrays(
+            *(np.asarray(arg) for arg in (x_pos, y_pos, x_vel, y_vel, lifetime, color))
+        )
+        requested = columns[0].size
+        n = min(requested, self.capacity - self.count)
+        if n <= 0:
+            return 0
+        start, end = self.count, self.count + n
+        for column, values in zip(
+            (self.x_pos, self.y_pos, self.x_vel, self.y_vel, self.lifetime, self.color),
+            columns,
+        ):
+            column[start:end] = values.reshape(-1)[:n]
+        self.count = end
+        return n
+
+    def update(self, dt: float) -> int:
+        """Integrate velocity/position, age the particles and recycle the expired ones.
+
+        Args:
+            dt (float): The elapsed time in seconds.
+
+        Returns:
+            int: The number of particles that expired.
+        """
+        n = self.count
+        if n == 0:
+            return 0
+        x_vel, y_vel = self.x_vel[:n], self.y_vel[:n]
+        if self.x_accel:
+            x_vel += self.x_accel * dt
+        if self.y_accel:
+            y_vel += self.y_accel * dt
+        self.x_pos[:n] += x_vel * dt
+        self.y_pos[:n] += y_vel * dt
+        lifetime = self.lifetime[:n]
+        lifetime -= dt
+        return self._recycle(np.flatnonzero(lifetime <= 0))
+
+    def rasterize(self, frame: np.ndarray, scale: int = 1):
+        """Draw the live particles into a frame/layer with a single fancy-index scatter.
+
+        Args:
+            frame (np.ndarray): The 2D uint8 layer to draw into.
+            scale (int, optional): The integer render scale of the layer. Defaults to 1.
+        """
+        n = self.count
+        if n == 0:
+            return
+        frame_h, frame_w = frame.shape
+        xs = np.floor(self.x_pos[:n] / scale).astype(np.intp)
+        ys = np.floor(self.y_pos[:n] / scale).astype(np.intp)
+        visible = (xs >= 0) & (xs < frame_w) & (ys >= 0) & (ys < frame_h)
+        frame[ys[visible], xs[visible]] = self.color[:n][visible]
+
+    def clear(self):
+        """Remove all particles."""
+        self.count = 0
+
+    def _recycle(self, dead: np.ndarray) -> int:
+        """Swap-remove the particles at the (sorted) row indices in `dead`.
+
+        Note:
+            The k dead rows that are below the new end of the pool are refilled with the live rows
+            found in the last k slots, so only O(k) values move.
+        """
+        k = dead.size
+        if k == 0:
+            return 0
+        new_count = self.count - k
+        holes = dead[dead < new_count]
+        if holes.size:
+            tail_alive = np.ones(k, dtype=bool)
+            tail_alive[dead[dead >= new_count] - new_count] = False
+            movers = np.flatnonzero(tail_alive) + new_count
+            for column in (
+                self.x_pos, self.y_pos, self.x_vel, self.y_vel, self.lifetime, self.color
+            ):
+                column[holes] = column[movers]
+        self.count = new_count
+        return k
@@ -0,0 +1,163 @@
+"""
+Dynamic Resolution Scaling Module
+
+This module holds the frame-time controller that decides the internal render scale used by
+AetherRenderer. When frames take longer than the frame budget, the scale is increased (rendering
+at a coarser internal resolution that is then integer-upscaled to the window); when there is
+headroom again, the scale is lowered back towards native resolution.
+
+Classes:
+    ResolutionScaler: Frame-time controller that drives the internal render scale.
+"""
+
+from typing import Dict, Optional
+
+
+class ResolutionScaler:
+    """Frame-time controller that drives the internal render scale of AetherRenderer.
+
+    The controller keeps an exponential moving average of the frame time and compares it to the
+    frame budget. The scale only changes after the average has stayed outside of the hysteresis
+    band for `settle_frames` consecutive frames, which prevents oscillating between two scales.
+
+    Attributes:
+        enabled (bool): If the controller is allowed to change the render scale.
+        frame_budget (Optional[float]): The target time per frame, in seconds. NyxEngine derives it
+            from its `sec_per_frame`; while None, the scale is never changed.
+        min_scale (int): The finest allowed scale (1 = native resolution).
+        max_scale (int): The coarsest allowed scale.
+        upscale_threshold (float): Ratio of the budget above which the scale is increased.
+        downscale_threshold (float): Ratio of the budget below which the scale is decreased.
+        settle_frames (int): Consecutive frames outside the band required to change the scale.
+        smoothing (float): EMA weight of the newest frame time (0 < smoothing <= 1).
+        scale (int): The current integer render scale.
+        last_frame_time (float): The most recently recorded frame time, in seconds.
+        avg_frame_time (float): The smoothed frame time, in seconds.
+        scale_changes (int): The number of times the scale has changed.
+
+    Methods:
+        record_frame: Feed a measured frame time to the controller and return the new scale.
+        reset: Return to native resolution and clear the frame-time history.
+        get_telemetry: Return the current controller state as a dictionary.
+    """
+
+    def __init__(
+        self,
+        frame_budget: Optional[float] = None,
+        min_scale: int = 1,
+        max_scale: int = 4,
+        upscale_threshold: float = 1.1,
+        downscale_threshold: float = 0.6,
+        settle_frames: int = 10,
+        smoothing: float = 0.2,
+        enabled: bool = False,
+    ):
+        """Initialize the controller at native resolution.
+
+        Args:
+            frame_budget (Optional[float], optional): Target seconds per frame. Defaults to None
+                (set by the owner, e.g. from the engine's frame rate).
+            min_scale (int, optional): Finest allowed scale. Defaults to 1.
+            max_scale (int, optional): Coarsest allowed scale. Defaults to 4.
+            upscale_threshold (float, optional): Budget ratio that triggers a coarser scale.
+                Defaults to 1.1.
+            downscale_threshold (float, optional): Budget ratio that triggers a finer scale.
+                Defaults to 0.6.
+            settle_frames (int, optional): Frames outside the band before changing scale. Defaults
+                to 10.
+            smoothing (float, optional): EMA weight of the newest frame. Defaults to 0.2.
+            enabled (bool, optional): If the controller may change the scale. Defaults to False.
+
+        Raises:
+            ValueError: If the scale bounds or thresholds are invalid.
+        """
+        if min_scale < 1 or max_scale < min_scale:
+            raise ValueError(
+                f"Invalid scale bounds (min_scale={min_scale}, max_scale={max_scale})."
+            )
+        if not 0 < downscale_threshold < upscale_threshold:
+            raise ValueError(
+                "Thresholds must satisfy 0 < downscale_threshold < upscale_threshold."
+            )
+        self.enabled = enabled
+        self.frame_budget = frame_budget
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+        self.upscale_threshold = upscale_threshold
+        self.downscale_threshold = downscale_threshold
+        self.settle_frames = settle_frames
+        self.smoothing = smoothing
+
+        self.scale: int = min_scale
+        self.last_frame_time: float = 0.0
+        self.avg_frame_time: float = 0.0
+        self.scale_changes: int = 0
+        self._frames_over: int = 0
+        self._frames_under: int = 0
+
+    def record_frame(self, frame_time: float) -> int:
+        """Feed a measured frame time to the controller and return the (possibly new) scale.
+
+        Args:
+            frame_time (float): The time taken by the scale-dependent work of the last frame, in
+                seconds.
+
+        Returns:
+            int: The render scale to use for the next frame.
+        """
+        self.last_frame_time = frame_time
+        if self.avg_frame_time == 0.0:
+            self.avg_frame_time = frame_time
+        else:
+            self.avg_frame_time += self.smoothing * (frame_time - self.avg_frame_time)
+
+        if not self.enabled or self.frame_budget is None:
+            return self.scale
+
+        ratio = self.avg_frame_time / self.frame_budget
+        if ratio > self.upscale_threshold and self.scale < self.max_scale:
+            self._frames_over += 1
+            self._frames_under = 0
+            if self._frames_over >= self.settle_frames:
+                self._change_scale(self.scale + 1)
+        elif ratio < self.downscale_threshold and self.scale > self.min_scale:
+            self._frames_under += 1
+            self._frames_over = 0
+            if self._frames_under >= self.settle_frames:
+                self._change_scale(self.scale - 1)
+        else:
+            self._frames_over, self._frames_under = 0, 0
+        return self.scale
+
+    def reset(self):
+        """Return to native resolution and clear the frame-time history."""
+        self.scale = self.min_scale
+        self.last_frame_time, self.avg_frame_time = 0.0, 0.0
+        self._frames_over, self._frames_under = 0, 0
+
+    def get_telemetry(self) -> Dict[str, float]:
+        """Return the current controller state as a dictionary.
+
+        Returns:
+            Dict[str, float]: The scale, frame times, budget and number of scale changes.
+        """
+        return {
+            "render_scale": self.scale,
+            "last_frame_time": self.last_frame_time,
+            "avg_frame_time": self.avg_frame_time,
+            "frame_budget": self.frame_budget,
+            "scale_changes": self.scale_changes,
+        }
+
+    def _change_scale(self, new_scale: int):
+        """Apply a new scale and restart the settle counters.
+
+        Note:
+            The moving average is reset to the value the new scale is expected to produce (frame
+            cost roughly follows the pixel count), so a single change does not immediately trigger
+            another one in the same direction.
+        """
+        self.avg_frame_time *= (self.scale / new_scale) ** 2
+        self.scale = new_scale
+        self.scale_changes += 1
+        self._frames_over, self._frames_under = 0, 0
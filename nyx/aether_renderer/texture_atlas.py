@@ -0,0 +1,206 @@
+"""
+Texture Atlas Module
+
+This module packs many small textures into a few large, contiguous uint8 pages. Components then
+reference a region of a page instead of owning their own array, and every sprite that shares a
+region can be composited by AetherRenderer in one batched, vectorized blit.
+
+Classes:
+    AtlasRegion: A rectangular region of an atlas page holding one texture.
+    TextureAtlas: Packs registered textures into atlas pages with a shelf packer.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class AtlasRegion:
+    """A rectangular region of an atlas page holding one texture.
+
+    Attributes:
+        name (str): The name the texture was registered under.
+        page_index (int): The index of the atlas page holding the texture.
+        x (int): The x-coordinate of the region in the page.
+        y (int): The y-coordinate of the region in the page.
+        height (int): The height of the region in pixels.
+        width (int): The width of the region in pixels.
+        texture (np.ndarray): A (height, width) view into the atlas page (no copy).
+    """
+
+    __slots__ = ("name", "page_index", "x", "y", "height", "width", "texture")
+
+    def __init__(
+        self, name: str, page: np.ndarray, page_index: int, x: int, y: int, height: int, width: int
+    ):
+        self.name = name
+        self.page_index = page_index
+        self.x, self.y = x, y
+        self.height, self.width = height, width
+        self.texture: np.ndarray = page[y : y + height, x : x + width]
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """The (height, width) of the region."""
+        return self.height, self.width
+
+    def __repr__(self):
+        return (
+            f"<AtlasRegion: name={self.name}, page={self.page_index}, x={self.x}, y={self.y}, "
+            f"height={self.height}, width={self.width}>"
+        )
+
+
+class _Shelf:
+    """A horizontal strip of a page, filled from left to right."""
+
+    __slots__ = ("y", "height", "x_cursor")
+
+    def __init__(self, y: int, height: int):
+        self.y = y
+        self.height = height
+        self.x_cursor = 0
+
+
+class TextureAtlas:
+    """Packs registered textures into one or more contiguous atlas pages with a shelf packer.
+
+    Each page is split into horizontal shelves. A texture is placed on the shelf that wastes the
+    least height while still having enough width left; if none fits, a new shelf is opened below the
+    last one, and if the page is full, a new page is allocated. Textures larger than a page get a
+    dedicated page of their own size.
+
+    Attributes:
+        page_h (int): The height of a standard atlas page.
+        page_w (int): The width of a standard atlas page.
+        pages (List[np.ndarray]): The uint8 atlas pages.
+        regions (Dict[str, AtlasRegion]): The packed regions keyed by texture name.
+
+    Methods:
+        add: Pack a single texture and return its region.
+        add_many: Pack several textures, tallest first, for a tighter fit.
+        get_region: Fetch a packed region by name.
+    """
+
+    def __init__(self, page_h: int = 256, page_w: int = 256):
+        """Initialize an empty atlas.
+
+        Args:
+            page_h (int, optional): The height of a standard page. Defaults to 256.
+            page_w (int, optional): The width of a standard page. Defaults to 256.
+        """
+        self.page_h = page_h
+        self.page_w = page_w
+        self.pages: List[np.ndarray] = []
+        self.regions: Dict[str, AtlasRegion] = {}
+        self._shelves: List[List[_Shelf]] = []
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.regions
+
+    def add(self, name: str, texture: np.ndarray) -> AtlasRegion:
+        """Pack a single texture into the atlas and return its region. Registering the same name
+        twice returns the existing region.
+
+        Args:
+            name (str): The unique name of the texture.
+            texture (np.ndarray): The 2D uint8 texture to pack.
+
+        Raises:
+            ValueError: If the texture is not a 2D uint8 NumPy array.
+
+        Returns:
+            AtlasRegion: The region holding the packed texture.
+        """
+        if name in self.regions:
+            return self.regions[name]
+        if (
+            not isinstance(texture, np.ndarray)
+            or texture.dtype != np.uint8
+            or texture.ndim != 2
+        ):
+            raise ValueError("Atlas textures must be 2D NumPy arrays of type 'uint8'.")
+
+        h, w = texture.shape
+        page_index, x, y = self._allocate(h, w)
+        page = self.pages[page_index]
+        page[y : y + h, x : x + w] = texture
+        region = AtlasRegion(name, page, page_index, x, y, h, w)
+        self.regions[name] = region
+        return region
+
+    def add_many(self, textures: Dict[str, np.ndarray]) -> Dict[str, AtlasRegion]:
+        """Pack several textures, tallest first, which keeps shelves tight.
+
+        Args:
+            textures (Dict[str, np.ndarray]): The textures to pack keyed by name.
+
+        Returns:
+            Dict[str, AtlasRegion]: The packed regions keyed by name.
+        """
+        order = sorted(textures, key=lambda name: textures[name].shape[0], reverse=True)
+        for name in order:
+            self.add(name, textures[name])
+        return {name: self.regions[name] for name in textures}
+
+    def get_region(self, name: str) -> AtlasRegion:
+        """Fetch a packed region by name.
+
+        Args:
+            name (str): The name the texture was registered under.
+
+        Raises:
+            KeyError: If no texture is registered under that name.
+
+        Returns:
+            AtlasRegion: The packed region.
+        """
+        if name not in self.regions:
+            raise KeyError(f'Texture="{name}" not found in the texture atlas.')
+        return self.regions[name]
+
+    def _allocate(self, h: int, w: int) -> Tuple[int, int, int]:
+        """Find space for an (h, w) texture and return its (page_index, x, y)."""
+        # Oversized textures get a dedicated page, marked as full by a single filled shelf
+        if h > self.page_h or w > self.page_w:
+            page_index = self._new_page(h, w)
+            full_shelf = _Shelf(0, h)
+            full_shelf.x_cursor = w
+            self._shelves[page_index].append(full_shelf)
+            return page_index, 0, 0
+
+        for page_index, shelves in enumerate(self._shelves):
+            position = self._place_on_page(page_index, shelves, h, w)
+            if position is not None:
+                return page_index, position[0], position[1]
+
+        page_index = self._new_page(self.page_h, self.page_w)
+        x, y = self._place_on_page(page_index, self._shelves[page_index], h, w)
+        return page_index, x, y
+
+    def _place_on_page(
+        self, page_index: int, shelves: List[_Shelf], h: int, w: int
+    ) -> Optional[Tuple[int, int]]:
+        """Place a texture on the best-fitting shelf of a page, opening a new shelf if needed."""
+        page_h, page_w = self.pages[page_index].shape
+        best: Optional[_Shelf] = None
+        for shelf in shelves:
+            if shelf.height >= h and page_w - shelf.x_cursor >= w:
+                if best is None or shelf.height < best.height:
+                    best = shelf
+        if best is None:
+            next_y = shelves[-1].y + shelves[-1].height if shelves else 0
+            if page_h - next_y < h or page_w < w:
+                return None
+            best = _Shelf(next_y, h)
+            shelves.append(best)
+
+        x = best.x_cursor
+        best.x_cursor += w
+        return x, best.y
+
+    def _new_page(self, h: int, w: int) -> int:
+        """Allocate a new, zeroed page and return its index."""
+        self.pages.append(np.zeros((h, w), dtype=np.uint8))
+        self._shelves.append([])
+        return len(self.pages) - 1
@@ -4,13 +4,27 @@ Tilemap Manager Module
 This module holds the assets needed for a tilemap (textures, reference array, relative position) and
 uses that information to construct the rendered tilemap for the frame.
 
+The visible part of the (infinitely wrapping) tilemap is kept pre-rendered in a pixel cache that is
+one tile larger than the frame in each direction. The cache is addressed as a toroidal ring buffer:
+world tile (ty, tx) always lives in cache slot (ty % cache_tiles_h, tx % cache_tiles_w). Scrolling
+therefore only rasterizes the newly exposed tile rows/columns into the slots that just left the
+view, and the frame is produced from the cache with at most four slice copies.
+
+Every `TilemapManager` is an independent tilemap layer. Layers are registered on the renderer with
+`AetherRenderer.add_tilemap`, each on its own z-index and with its own parallax factor, so several
+tilemaps (e.g. a distant star field behind a scrolling nebula) can be stacked.
+
 Classes:
     TilemapManager: Manages the rendering of a tilemap onto a frame.
 """
 
-from math import ceil
+from math import ceil, floor
+from typing import Dict, Optional, Sequence, Tuple, Union
+
 import numpy as np
 from nyx.aether_renderer.aether_dimensions import AetherDimensions
+from nyx.aether_renderer.chunked_tilemap import ChunkedTilemap
+from nyx.aether_renderer.tileset import Tileset
 
 
 class TilemapManager:
@@ -18,12 +32,20 @@ class TilemapManager:
     reference tilemap and then culling the rendered tilemap to fit the frame.
 
     Attributes:
+        z_index: The renderer layer the tilemap is drawn on.
+        parallax: The scroll factor applied by `set_scroll` (1.0 = moves with the camera, 0.5 =
+            half as fast, 0.0 = fixed to the screen).
+        transparent: If tile pixels of color 0 show the layers below. Opaque (`False`) is a hint
+            that the layer covers the frame: the renderer skips merging the lower layers when the
+            frame has no color-0 pixels left after merging it.
         background_color: The color code for the background of the tilemap.
-        ref_tilemap: The reference tilemap array.
-        rendered_tilemap: The rendered tilemap array.
-        tilemap_position: The position of the tilemap in the frame.
+        ref_tilemap: The reference tilemap array, or a disk-streamed `ChunkedTilemap`. It is never
+            modified by rendering.
+        rendered_tilemap: The rendered tilemap array, exactly the size of the internal render frame
+            (the frame sampled every `render_scale` pixels).
         tile_dimensions: The dimensions of the tiles in pixels.
         tileset_textures: The textures for the tiles in the tileset.
+        tileset: The contiguous tileset array store used to fill the tilemap.
         tile_d: The dimensions of the tiles in pixels.
         dimensions: The dimensions of the frame in pixels.
         frame_h: The height of the frame in pixels.
@@ -34,37 +56,59 @@ class TilemapManager:
         frame_tiles_w: The width of the frame in tiles.
         pos_x: The x-coordinate of the tilemap in pixels.
         pos_y: The y-coordinate of the tilemap in pixels.
-        ref_pos_x: The x-coordinate of the tilemap in tiles.
-        ref_pos_y: The y-coordinate of the tilemap in tiles.
-        rolled_ref_tilemap: The reference tilemap array rolled to the current position.
-        tile_roll_x: The relative x-coordinate of the tilemap in tiles.
-        tile_roll_y: The relative y-coordinate of the tilemap in tiles.
-        filled_tilemap: The reference tilemap array filled with the tileset textures.
-        rel_pos_x: The relative x-coordinate of the tilemap in pixels.
-        rel_pos_y: The relative y-coordinate of the tilemap in pixels.
-        rel_pos_end_x: The relative end x-coordinate of the tilemap in pixels.
-        rel_pos_end_y: The relative end y-coordinate of the tilemap in pixels.
+        ref_pos_x: The x-coordinate of the first visible tile column (in tiles).
+        ref_pos_y: The y-coordinate of the first visible tile row (in tiles).
+        cache_tiles_h: The height of the ring cache in tiles (frame tiles + 1).
+        cache_tiles_w: The width of the ring cache in tiles (frame tiles + 1).
+        tile_cache: The pre-rendered ring cache pixels.
+        cached_tile_ids: The tile ID held in each slot of the ring cache.
+        cache_origin: The (ref_pos_y, ref_pos_x) the ring cache currently covers, or None when it
+            must be fully rebuilt.
+        composed_offset: The (pos_y, pos_x) `rendered_tilemap` was composed at.
+        composed_scale: The render scale `rendered_tilemap` was composed at.
+        composed_frame: The (frame_h, frame_w) `rendered_tilemap` was composed for.
+        filled_tilemap: The pixels composed from the ring cache (a reused buffer at native scale).
+        tiles_rasterized: The number of tiles rasterized by the last render (0 = cache reused).
+        animated_slots: The flat ring cache slots currently holding an animated tile ID.
+        tiles_animated: The number of tile cells rewritten by the last `animate` call.
 
     Methods:
         render: Render the tilemap onto the frame.
         set_tilemap: Set the reference tilemap array.
         set_tileset: Set the tileset textures for the tilemap.
-        _upll_ref_tilemap: Slice the ref. tilemap array to fit the frame.
+        set_scroll: Position the tilemap from a camera/world scroll offset and its parallax.
+        animate: Advance the animated tiles and rewrite only their cached cells.
+        invalidate: Force a full rebuild of the ring cache on the next render.
+        is_ready: If both a tilemap and a tileset are set.
     """
 
-    background_color = None
-    ref_tilemap = None
-    rendered_tilemap = None
-    tilemap_position = (0, 0)
-    tile_dimensions = 32
-    tileset_textures = {}
-
-    def __init__(self, dimensions: AetherDimensions):
+    def __init__(
+        self,
+        dimensions: AetherDimensions,
+        z_index: int = 0,
+        parallax: float = 1.0,
+        transparent: bool = True,
+    ):
         """Initialize the tilemap manager with the frame dimensions and placeholder variables.
 
         Args:
             dimensions (AetherDimensions): The dimensions of the frame.
+            z_index (int, optional): The renderer layer to draw on. Defaults to 0.
+            parallax (float, optional): The scroll factor used by `set_scroll`. Defaults to 1.0.
+            transparent (bool, optional): If the layer may have color-0 holes showing the layers
+                below. Defaults to True.
         """
+        # Layer settings
+        self.z_index = z_index
+        self.parallax = parallax
+        self.transparent = transparent
+        # Assets
+        self.background_color = None
+        self.ref_tilemap: Optional[Union[np.ndarray, ChunkedTilemap]] = None
+        self.rendered_tilemap: Optional[np.ndarray] = None
+        self.tile_dimensions = 32
+        self.tileset_textures = {}
+        self.tileset: Optional[Tileset] = None
         # Placeholder variables
         self.tile_d = 0
         self.dimensions = dimensions
@@ -73,46 +117,144 @@ class TilemapManager:
         self.frame_tiles_h, self.frame_tiles_w = 0, 0
         self.pos_x, self.pos_y = 0, 0
         self.ref_pos_x, self.ref_pos_y = 0, 0
-        self.rolled_ref_tilemap = None
-        self.tile_roll_x, self.tile_roll_y = 0, 0
-        self.rolled_x, self.rolled_y = 0, 0
-        self.filled_tilemap = None
-        self.rel_pos_x, self.rel_pos_y = 0, 0
-        self.rel_pos_end_x, self.rel_pos_end_y = 0, 0
-
-
-    def render(self):
-        """Render the tilemap onto the frame."""
+        # Ring cache
+        self.cache_tiles_h, self.cache_tiles_w = 0, 0
+        self.tile_cache: Optional[np.ndarray] = None
+        self.cached_tile_ids: Optional[np.ndarray] = None
+        self.cache_origin: Optional[Tuple[int, int]] = None
+        self.composed_offset: Optional[Tuple[int, int]] = None
+        self.composed_scale = 1
+        self.composed_frame: Optional[Tuple[int, int]] = None
+        self.filled_tilemap: Optional[np.ndarray] = None
+        self.tiles_rasterized = 0
+        # Animated tiles
+        self.animated_slots = np.empty(0, dtype=np.intp)
+        self.tiles_animated = 0
+
+    @property
+    def is_ready(self) -> bool:
+        """If both a tilemap and a tileset are set (the layer can be rendered)."""
+        return self.ref_tilemap is not None and self.tileset is not None
+
+    def render(self) -> bool:
+        """Render the tilemap onto the frame.
+
+        Returns:
+            bool: If `rendered_tilemap` was recomposited. A layer whose integer offset, assets,
+                frame size and render scale are unchanged keeps its previous frame untouched.
+        """
         self._update_calcs()
-        self._resize_ref_array()
-        self._fill_ref_tilemap()
-        self._roll_rendered_tilemap()
-        self._cull_rendered_tilemap()
+        self.tiles_rasterized = 0
+        stale = self._cache_is_stale()
+        scale = max(1, int(self.dimensions.render_scale))
+        if (
+            not stale
+            and self.composed_offset == (self.pos_y, self.pos_x)
+            and self.composed_scale == scale
+        ):
+            return False
+        if isinstance(self.ref_tilemap, ChunkedTilemap):
+            self._prefetch_chunks()
+        if stale:
+            self._rebuild_cache()
+        else:
+            self._scroll_cache()
+        self._compose_frame(scale)
 
-        TilemapManager.rendered_tilemap = self.filled_tilemap
+        self.composed_offset = (self.pos_y, self.pos_x)
+        self.composed_scale = scale
+        self.composed_frame = (self.frame_h, self.frame_w)
+        self.rendered_tilemap = self.filled_tilemap
+        return True
 
-    def set_tilemap(self, tilemap: np.ndarray):
+    def set_tilemap(self, tilemap: Union[np.ndarray, ChunkedTilemap]):
         """Set the reference tilemap array.
 
         Args:
-            tilemap (np.ndarray): The reference tilemap array.
+            tilemap (Union[np.ndarray, ChunkedTilemap]): The reference tilemap array, or a chunked
+                tilemap streamed from disk.
         """
-        TilemapManager.ref_tilemap = tilemap
-
-    def set_tileset(self, tileset: dict, tile_dimension: int = 32):
+        self.ref_tilemap = tilemap
+        self.invalidate()
+
+    def set_tileset(
+        self,
+        tileset: dict,
+        tile_dimension: int = 32,
+        animations: Optional[Dict[int, Tuple[Sequence[np.ndarray], float]]] = None,
+    ):
         """Set the tileset textures for the tilemap.
 
         Args:
             tileset (dict): The textures for the tiles in the tileset.
             tile_dimension (int, optional): The dimensions of the tiles in pixels. Defaults to 32.
+            animations (Optional[Dict[int, Tuple[Sequence[np.ndarray], float]]], optional): The
+                animated tiles as {tile_id: (frame textures, seconds per frame)}. Defaults to None.
+
+        Raises:
+            ValueError: If the textures are not `tile_dimension` pixels square.
+        """
+        new_tileset = Tileset.from_dict(tileset, animations)
+        if new_tileset.tile_d != tile_dimension:
+            raise ValueError(
+                f"Tile textures are {new_tileset.tile_d}px, expected {tile_dimension}px."
+            )
+        self.tileset_textures = tileset
+        self.tileset = new_tileset
+        self.tile_dimensions = tile_dimension
+        self.invalidate()
+
+    def set_scroll(self, scroll_x: float, scroll_y: float):
+        """Position the tilemap from a camera/world scroll offset scaled by its parallax factor.
+
+        Args:
+            scroll_x (float): The horizontal scroll offset in pixels.
+            scroll_y (float): The vertical scroll offset in pixels.
+        """
+        self.pos_x = floor(scroll_x * self.parallax)
+        self.pos_y = floor(scroll_y * self.parallax)
+
+    def animate(self, dt: float) -> int:
+        """Advance the animated tiles and rewrite only the cached cells showing a tile whose frame
+        changed, in both the ring cache and the composed frame. The cost scales with the number of
+        visible animated tile instances, not with the size of the map or the screen.
+
+        Args:
+            dt (float): The elapsed time in seconds.
+
+        Returns:
+            int: The number of tile cells rewritten.
         """
-        TilemapManager.tileset_textures = tileset
-        TilemapManager.tile_dimensions = tile_dimension
+        self.tiles_animated = 0
+        if self.tileset is None or not self.tileset.is_animated:
+            return 0
+        changed_ids = self.tileset.advance(dt)
+        if changed_ids.size == 0 or self.cache_origin is None or self.animated_slots.size == 0:
+            return 0
+        slot_ids = self.cached_tile_ids.reshape(-1)[self.animated_slots]
+        changed = np.isin(slot_ids, changed_ids)
+        if not changed.any():
+            return 0
+        slots, tile_ids = self.animated_slots[changed], slot_ids[changed]
+        textures = self.tileset.textures[self.tileset.lookup[tile_ids]]
+
+        d = self.tile_d
+        slot_rows, slot_cols = np.divmod(slots, self.cache_tiles_w)
+        cache_tiles = self.tile_cache.reshape(self.cache_tiles_h, d, self.cache_tiles_w, d)
+        cache_tiles[slot_rows, :, slot_cols, :] = textures
+        if self.composed_offset is not None:
+            self._patch_frame(slot_rows, slot_cols, textures)
+        self.tiles_animated = slots.size
+        return self.tiles_animated
+
+    def invalidate(self):
+        """Force a full rebuild of the ring cache on the next render."""
+        self.cache_origin = None
 
     def _update_calcs(self):
         """Update the instance variable calculations for the tilemap rendering."""
         # Get the tile dimensions
-        self.tile_d = TilemapManager.tile_dimensions
+        self.tile_d = self.tile_dimensions
 
         # Get the frame size in pixels
         self.frame_h, self.frame_w = (
@@ -124,111 +266,201 @@ class TilemapManager:
             ceil(self.frame_h / self.tile_d),
             ceil(self.frame_w / self.tile_d),
         )
+        # A frame that does not start on a tile boundary overlaps one extra partial tile
+        self.cache_tiles_h, self.cache_tiles_w = (
+            self.frame_tiles_h + 1,
+            self.frame_tiles_w + 1,
+        )
         # Get the size of the reference tilemap in tiles
-        self.ref_tiles_h, self.ref_tiles_w = TilemapManager.ref_tilemap.shape
+        self.ref_tiles_h, self.ref_tiles_w = self.ref_tilemap.shape
 
-        # Convert the position of the tilemap to tiles (Floor because we need the partial tile to start the tilemap)
+        # Convert the position of the tilemap to tiles (Floor because we need the partial tile to
+        # start the tilemap)
         self.ref_pos_x, self.ref_pos_y = (
             self.pos_x // self.tile_d,
             self.pos_y // self.tile_d,
         )
 
-        # Calculate the relative position of the reference tilemap in tiles
-        self.tile_roll_x = self.ref_pos_x % self.ref_tiles_w
-        self.tile_roll_y = self.ref_pos_y % self.ref_tiles_h
-
-        # Calculate the relative position of the filled tilemap in pixels
-        self.rel_pos_x = self.pos_x % self.tile_d
-        self.rel_pos_y = self.pos_y % self.tile_d
-        if self.pos_x % self.tile_d == 0:
-            1 + 1
-
-    def _resize_ref_array(self):
-        """Resize the reference tilemap array to fit the frame."""
-        # Overall strategy:
-        # 1. Roll the reference tilemap array to the current position to prepare for tiling and
-        #    slicing.
-        # 2. Repeat the rolled tilemap array to exceed the frame size without slicing.
-        # 3. Slice the current reference tilemap array to fit the frame, including partial tiles as
-        #    whole tiles. This also trims the repeated tilemap array to only the visible tiles.
-        # 4. Replace the reference tilemap with the culled tilemap for use in rendering.
-
-        # Check if the tilemap is repositioned
-        if self.tile_roll_x != 0 or self.tile_roll_y != 0:
-            self._roll_ref_tilemap()
-        else:
-            self.rolled_ref_tilemap = TilemapManager.ref_tilemap
-
-        # Check if the tilemap is smaller than the frame
-        if (
-            self.ref_tiles_h < self.frame_tiles_h
-            or self.ref_tiles_w < self.frame_tiles_w
-        ):
-            self._expand_ref_tilemap()
+    def _cache_is_stale(self) -> bool:
+        """Check if the ring cache must be rebuilt (new tilemap/tileset, resized frame, or a
+        scroll of at least a full cache in one step).
+        """
+        if self.cache_origin is None or self.tile_cache is None:
+            return True
+        if self.cached_tile_ids.shape != (self.cache_tiles_h, self.cache_tiles_w):
+            return True
+        if self.tile_cache.shape[0] != self.cache_tiles_h * self.tile_d:
+            return True
+        # A resize within the same tile count still changes the composed frame's pixel size
+        if self.composed_frame != (self.frame_h, self.frame_w):
+            return True
+        origin_y, origin_x = self.cache_origin
+        return (
+            abs(self.ref_pos_y - origin_y) >= self.cache_tiles_h
+            or abs(self.ref_pos_x - origin_x) >= self.cache_tiles_w
+        )
 
-        if (self.ref_tiles_h > self.frame_tiles_h) or (
-            self.ref_tiles_w > self.frame_tiles_w
-        ):
-            self._cull_ref_tilemap()
-
-        # Store the culled tilemap for rendering
-        TilemapManager.ref_tilemap = self.rolled_ref_tilemap
-
-    def _roll_ref_tilemap(self):
-        """Roll the reference tilemap array to the current position."""
-        # - Convert rightward position (movement to the right) to leftward roll and vice versa
-        # - Convert downward position (movement downward) to upward roll and vice versa
-        roll_x = self.tile_roll_x - self.rolled_x
-        roll_y = self.tile_roll_y - self.rolled_y
-        self.rolled_ref_tilemap = np.roll(
-            (TilemapManager.ref_tilemap),
-            (-roll_y, -roll_x),
-            axis=(0, 1),
+    def _rebuild_cache(self):
+        """Rasterize every tile of the ring cache with a single tileset fill."""
+        # World tile held by each ring slot: the unique tile in [origin, origin + cache size) that
+        # is congruent to the slot index.
+        slot_rows = np.arange(self.cache_tiles_h)
+        slot_cols = np.arange(self.cache_tiles_w)
+        world_rows = self.ref_pos_y + (slot_rows - self.ref_pos_y) % self.cache_tiles_h
+        world_cols = self.ref_pos_x + (slot_cols - self.ref_pos_x) % self.cache_tiles_w
+
+        self.cached_tile_ids = self._ref_block(world_rows, world_cols)
+        self.tile_cache = self.tileset.fill(
+            self.cached_tile_ids, out=self.tile_cache
+        )
+        self.cache_origin = (self.ref_pos_y, self.ref_pos_x)
+        self.tiles_rasterized = self.cached_tile_ids.size
+        self._index_animated_slots()
+
+    def _scroll_cache(self):
+        """Rasterize only the tile rows/columns exposed since the last render."""
+        origin_y, origin_x = self.cache_origin
+        new_y, new_x = self.ref_pos_y, self.ref_pos_x
+        if (new_y, new_x) == (origin_y, origin_x):
+            return
+        cache_h, cache_w = self.cache_tiles_h, self.cache_tiles_w
+        window_rows = np.arange(new_y, new_y + cache_h)
+        window_cols = np.arange(new_x, new_x + cache_w)
+
+        # Newly exposed columns (for every visible row)
+        if new_x > origin_x:
+            self._rasterize_block(
+                window_rows, np.arange(origin_x + cache_w, new_x + cache_w)
+            )
+        elif new_x < origin_x:
+            self._rasterize_block(window_rows, np.arange(new_x, origin_x))
+        # Newly exposed rows (for every visible column)
+        if new_y > origin_y:
+            self._rasterize_block(
+                np.arange(origin_y + cache_h, new_y + cache_h), window_cols
+            )
+        elif new_y < origin_y:
+            self._rasterize_block(np.arange(new_y, origin_y), window_cols)
+
+        self.cache_origin = (new_y, new_x)
+        self._index_animated_slots()
+
+    def _index_animated_slots(self):
+        """Record which ring cache slots hold an animated tile (one pass over the cached IDs)."""
+        if not self.tileset.is_animated:
+            self.animated_slots = np.empty(0, dtype=np.intp)
+            return
+        self.animated_slots = np.flatnonzero(
+            np.isin(self.cached_tile_ids, self.tileset.animated_ids)
         )
-        self.rolled_x, self.rolled_y = self.tile_roll_x, self.tile_roll_y
 
-    def _expand_ref_tilemap(self):
-        """Tile the rolled tilemap array to exceed the frame size."""
-        repeats_x = ceil(self.frame_tiles_w / self.ref_tiles_w)
-        repeats_y = ceil(self.frame_tiles_h / self.ref_tiles_h)
-        self.rolled_ref_tilemap = np.tile(
-            self.rolled_ref_tilemap, (repeats_y, repeats_x)
-        )[: self.frame_tiles_h, : self.frame_tiles_w]
+    def _patch_frame(self, slot_rows: np.ndarray, slot_cols: np.ndarray, textures: np.ndarray):
+        """Write re-rasterized ring cache tiles into the composed frame with a single scatter.
 
-    def _cull_ref_tilemap(self):
-        """Slice the reference tilemap array to fit the frame, iluding partial tiles as whole tiles.
+        Args:
+            slot_rows (np.ndarray): The ring cache slot row of each tile.
+            slot_cols (np.ndarray): The ring cache slot column of each tile.
+            textures (np.ndarray): The (n, tile_d, tile_d) pixels of each tile.
+        """
+        d = self.tile_d
+        frame_h, frame_w = self.filled_tilemap.shape
+        origin_y, origin_x = self.cache_origin
+        pos_y, pos_x = self.composed_offset
+        # World tile held by each slot, then its top-left pixel in the composed frame
+        world_rows = origin_y + (slot_rows - origin_y) % self.cache_tiles_h
+        world_cols = origin_x + (slot_cols - origin_x) % self.cache_tiles_w
+        rows = (world_rows * d - pos_y)[:, None] + np.arange(d)
+        cols = (world_cols * d - pos_x)[:, None] + np.arange(d)
+
+        valid = ((rows >= 0) & (rows < frame_h))[:, :, None] & (
+            (cols >= 0) & (cols < frame_w)
+        )[:, None, :]
+        shape = valid.shape
+        self.filled_tilemap[
+            np.broadcast_to(rows[:, :, None], shape)[valid],
+            np.broadcast_to(cols[:, None, :], shape)[valid],
+        ] = textures[valid]
+
+    def _prefetch_chunks(self):
+        """Ask a chunked tilemap to load the chunks ahead of the viewport's direction of motion."""
+        if self.cache_origin is None:
+            return
+        origin_y, origin_x = self.cache_origin
+        self.ref_tilemap.prefetch(
+            self.ref_pos_y,
+            self.ref_pos_x,
+            self.cache_tiles_h,
+            self.cache_tiles_w,
+            self.ref_pos_y - origin_y,
+            self.ref_pos_x - origin_x,
+        )
 
-        Note: Since the tilemap has been rolled, the top left corner of the tilemap is the correct
-            starting point for the slice.
+    def _rasterize_block(self, world_rows: np.ndarray, world_cols: np.ndarray):
+        """Rasterize a block of world tiles into their ring cache slots.
+
+        Args:
+            world_rows (np.ndarray): The world tile rows of the block.
+            world_cols (np.ndarray): The world tile columns of the block.
         """
-        self.rolled_ref_tilemap = self.rolled_ref_tilemap[
-            : self.frame_tiles_h, : self.frame_tiles_w
+        tileset = self.tileset
+        d = self.tile_d
+        tile_ids = self._ref_block(world_rows, world_cols)
+        slot_rows = (world_rows % self.cache_tiles_h)[:, None]
+        slot_cols = (world_cols % self.cache_tiles_w)[None, :]
+
+        self.cached_tile_ids[slot_rows, slot_cols] = tile_ids
+        cache_tiles = self.tile_cache.reshape(self.cache_tiles_h, d, self.cache_tiles_w, d)
+        # Advanced indices separated by slices -> (rows, cols, d, d) tile blocks
+        cache_tiles[slot_rows, :, slot_cols, :] = tileset.textures[
+            np.take(tileset.lookup, tile_ids, mode="clip")
         ]
+        self.tiles_rasterized += tile_ids.size
 
-    def _fill_ref_tilemap(self):
-        """Fill the reference tilemap with the tileset textures."""
-        ref_tilemap = TilemapManager.ref_tilemap
-        tile_d = self.tile_d
-        tileset = TilemapManager.tileset_textures
-        h, w = ref_tilemap.shape
-
-        # Create a new, blank tilemap to render the tileset onto.
-        filled_tilemap = np.zeros((h * tile_d, w * tile_d), dtype=np.uint8)
-        for y in range(h):
-            for x in range(w):
-                tile_texture = tileset[ref_tilemap[y, x]]
-                filled_tilemap[
-                    y * tile_d : (y + 1) * tile_d, x * tile_d : (x + 1) * tile_d
-                ] = tile_texture
-
-        self.filled_tilemap = filled_tilemap
-
-    def _roll_rendered_tilemap(self):
-        """Roll the rendered tilemap to the current position."""
-        self.filled_tilemap = np.roll(
-            self.filled_tilemap, (-self.rel_pos_y, -self.rel_pos_x), axis=(0, 1)
-        )
+    def _ref_block(self, world_rows: np.ndarray, world_cols: np.ndarray) -> np.ndarray:
+        """Get the tile IDs of a block of world tiles (the reference tilemap wraps around).
+
+        Args:
+            world_rows (np.ndarray): The world tile rows of the block.
+            world_cols (np.ndarray): The world tile columns of the block.
 
-    def _cull_rendered_tilemap(self):
-        """Slice the rendered tilemap to fit the frame."""
-        self.filled_tilemap = self.filled_tilemap[: self.frame_h, : self.frame_w]
+        Returns:
+            np.ndarray: The (rows, cols) tile IDs.
+        """
+        ref_tilemap = self.ref_tilemap
+        if isinstance(ref_tilemap, ChunkedTilemap):
+            return ref_tilemap.get_block(world_rows, world_cols)
+        return ref_tilemap[np.ix_(world_rows % self.ref_tiles_h, world_cols % self.ref_tiles_w)]
+
+    def _compose_frame(self, scale: int = 1):
+        """Copy the visible window out of the ring cache with at most four slice copies, or, at a
+        coarser render scale, gather only every `scale`-th pixel (internal pixel (iy, ix) samples
+        frame pixel (iy * scale, ix * scale), like the sprites).
+
+        Args:
+            scale (int, optional): The integer render scale. Defaults to 1 (native).
+        """
+        cache = self.tile_cache
+        cache_h, cache_w = cache.shape
+        # World pixel (y, x) lives at ring pixel (y % cache_h, x % cache_w)
+        start_y, start_x = self.pos_y % cache_h, self.pos_x % cache_w
+        if scale > 1:
+            rows = (start_y + np.arange(-(-self.frame_h // scale)) * scale) % cache_h
+            cols = (start_x + np.arange(-(-self.frame_w // scale)) * scale) % cache_w
+            self.filled_tilemap = cache[np.ix_(rows, cols)]
+            return
+
+        frame_h, frame_w = self.frame_h, self.frame_w
+        if self.filled_tilemap is None or self.filled_tilemap.shape != (frame_h, frame_w):
+            self.filled_tilemap = np.empty((frame_h, frame_w), dtype=np.uint8)
+        frame = self.filled_tilemap
+        top_h = min(frame_h, cache_h - start_y)
+        left_w = min(frame_w, cache_w - start_x)
+        bottom_h, right_w = frame_h - top_h, frame_w - left_w
+
+        frame[:top_h, :left_w] = cache[start_y : start_y + top_h, start_x : start_x + left_w]
+        if right_w:
+            frame[:top_h, left_w:] = cache[start_y : start_y + top_h, :right_w]
+        if bottom_h:
+            frame[top_h:, :left_w] = cache[:bottom_h, start_x : start_x + left_w]
+            if right_w:
+                frame[top_h:, left_w:] = cache[:bottom_h, :right_w]
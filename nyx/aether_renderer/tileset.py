@@ -0,0 +1,214 @@
+"""
+Tileset Module
+
+This module stores the textures of a tileset as one contiguous (n_tiles, tile_d, tile_d) array with
+a tile-ID-to-row lookup table, so a whole reference tilemap can be converted to pixels with
+vectorized gathers instead of one dictionary lookup and slice assignment per tile.
+
+Tile IDs may be 8- or 16-bit: the lookup table spans up to the highest ID used (plus one blank
+entry that out-of-range IDs clip to) and uses the smallest unsigned dtype that can address every
+texture row, so it costs one byte per ID for tilesets of up to 255 tiles (at most 64 KiB over the
+whole 16-bit range).
+
+Animated tiles store all of their frames as extra rows; advancing the animation clock only repoints
+their lookup entries, so every later fill/gather automatically uses the current frame.
+
+Classes:
+    Tileset: Contiguous tile texture storage and vectorized tilemap filling.
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class Tileset:
+    """Contiguous tile texture storage and vectorized tilemap filling.
+
+    The last row of `textures` is always a blank (all-zero) tile; tile IDs without a texture map to
+    it, so unknown IDs render as transparent instead of raising.
+
+    Attributes:
+        MAX_TILE_ID (int): The highest supported tile ID (the 16-bit range).
+        tile_d (int): The height/width of a tile in pixels.
+        textures (np.ndarray): The (n_tiles + 1, tile_d, tile_d) uint8 tile textures (a view of
+            `texture_rows`, so the pixels are stored once).
+        texture_rows (np.ndarray): The textures in (tile_d, n_tiles + 1, tile_d) layout, so pixel
+            row `r` of every tile is one contiguous (n_tiles + 1, tile_d) block.
+        lookup (np.ndarray): Maps a tile ID to its row in `textures` (uint8, or uint16/uint32 for
+            larger tilesets). Its last entry is always the blank row, so IDs beyond the table clip
+            to a blank tile.
+        tile_ids (np.ndarray): The tile ID stored in each row of `textures` (excluding the blank).
+        animated_ids (np.ndarray): The IDs of the animated tiles.
+        animation_rows (np.ndarray): The first `textures` row of each animated tile's frames.
+        animation_frames (np.ndarray): The number of frames of each animated tile.
+        animation_periods (np.ndarray): The seconds each frame of an animated tile is shown.
+        animation_time (float): The animation clock in seconds.
+
+    Methods:
+        from_dict: Build a tileset from a {tile_id: texture} dictionary.
+        fill: Convert a reference tilemap of tile IDs into a pixel array.
+        advance: Advance the animation clock and repoint the animated tiles to their new frame.
+        memory_report: Report the bytes used by each part of the tileset.
+    """
+
+    MAX_TILE_ID = np.iinfo(np.uint16).max
+
+    def __init__(
+        self,
+        textures: np.ndarray,
+        tile_ids: np.ndarray,
+        animations: Optional[Dict[int, Tuple[Sequence[np.ndarray], float]]] = None,
+    ):
+        """Initialize the tileset from stacked textures and the tile ID of each texture.
+
+        Args:
+            textures (np.ndarray): The (n_tiles, tile_d, tile_d) uint8 tile textures.
+            tile_ids (np.ndarray): The tile ID of each texture.
+            animations (Optional[Dict[int, Tuple[Sequence[np.ndarray], float]]], optional): The
+                animated tiles as {tile_id: (frame textures, seconds per frame)}. An animated ID
+                replaces any static texture with the same ID. Defaults to None.
+
+        Raises:
+            ValueError: If the textures are not square uint8 tiles, the IDs do not match them or are
+                outside the 16-bit range, or an animation has no frames or a non-positive period.
+        """
+        if textures.ndim != 3 or textures.shape[1] != textures.shape[2]:
+            raise ValueError("Tileset textures must have the shape (n_tiles, tile_d, tile_d).")
+        if textures.dtype != np.uint8:
+            raise ValueError("Tileset textures must be of type 'uint8'.")
+        if len(tile_ids) != len(textures):
+            raise ValueError("Each tileset texture requires exactly one tile ID.")
+
+        n_tiles, self.tile_d = textures.shape[0], textures.shape[1]
+        self.tile_ids = np.asarray(tile_ids, dtype=np.int64)
+        animations = animations or {}
+        frames = [
+            self._animation_frames(frame_list, period)
+            for frame_list, period in animations.values()
+        ]
+        n_rows = n_tiles + sum(len(frame_list) for frame_list in frames)
+
+        self.texture_rows = np.zeros((self.tile_d, n_rows + 1, self.tile_d), dtype=np.uint8)
+        self.textures = self.texture_rows.transpose(1, 0, 2)
+        self.textures[:n_tiles] = textures
+        self.animated_ids = np.fromiter(animations.keys(), dtype=np.int64, count=len(animations))
+        self.animation_frames = np.array([len(frame_list) for frame_list in frames], dtype=np.intp)
+        self.animation_rows = n_tiles + np.concatenate(
+            ([0], np.cumsum(self.animation_frames))
+        )[:-1].astype(np.intp)
+        self.animation_periods = np.array(
+            [period for _, period in animations.values()], dtype=np.float64
+        )
+        for first_row, frame_list in zip(self.animation_rows, frames):
+            self.textures[first_row : first_row + len(frame_list)] = frame_list
+        self.animation_time = 0.0
+
+        all_ids = np.concatenate((self.tile_ids, self.animated_ids))
+        if all_ids.size and (all_ids.min() < 0 or all_ids.max() > self.MAX_TILE_ID):
+            raise ValueError(f"Tile IDs must be in the range [0, {self.MAX_TILE_ID}].")
+        # One spare entry past the highest ID: `mode="clip"` maps unknown IDs onto it
+        lookup_size = max(256, int(all_ids.max()) + 2 if all_ids.size else 0)
+        self.lookup = np.full(lookup_size, n_rows, dtype=np.min_scalar_type(n_rows))
+        self.lookup[self.tile_ids] = np.arange(n_tiles)
+        self.lookup[self.animated_ids] = self.animation_rows
+
+    @classmethod
+    def from_dict(
+        cls,
+        tileset: Dict[int, np.ndarray],
+        animations: Optional[Dict[int, Tuple[Sequence[np.ndarray], float]]] = None,
+    ) -> "Tileset":
+        """Build a tileset from a {tile_id: texture} dictionary.
+
+        Args:
+            tileset (Dict[int, np.ndarray]): The tile textures keyed by tile ID.
+            animations (Optional[Dict[int, Tuple[Sequence[np.ndarray], float]]], optional): The
+                animated tiles as {tile_id: (frame textures, seconds per frame)}. Defaults to None.
+
+        Returns:
+            Tileset: The contiguous tileset.
+        """
+        tile_ids = np.fromiter(tileset.keys(), dtype=np.int64, count=len(tileset))
+        textures = np.stack([np.asarray(tileset[tile_id]) for tile_id in tileset])
+        return cls(textures.astype(np.uint8, copy=False), tile_ids, animations)
+
+    @property
+    def is_animated(self) -> bool:
+        """If the tileset has animated tiles."""
+        return self.animated_ids.size > 0
+
+    def advance(self, dt: float) -> np.ndarray:
+        """Advance the animation clock and repoint the animated tiles to their current frame.
+
+        Args:
+            dt (float): The elapsed time in seconds.
+
+        Returns:
+            np.ndarray: The IDs of the animated tiles whose displayed frame changed.
+        """
+        if not self.is_animated:
+            return self.animated_ids
+        self.animation_time += dt
+        frame_rows = self.animation_rows + (
+            (self.animation_time // self.animation_periods).astype(np.intp)
+            % self.animation_frames
+        )
+        changed = self.lookup[self.animated_ids] != frame_rows
+        self.lookup[self.animated_ids] = frame_rows
+        return self.animated_ids[changed]
+
+    def _animation_frames(self, frame_list: Sequence[np.ndarray], period: float) -> np.ndarray:
+        """Stack and validate the frames of an animated tile."""
+        if len(frame_list) == 0 or period <= 0:
+            raise ValueError("Animated tiles require at least one frame and a positive period.")
+        frames = np.stack([np.asarray(frame) for frame in frame_list])
+        if frames.shape[1:] != (self.tile_d, self.tile_d):
+            raise ValueError("Animation frames must have the same shape as the tileset textures.")
+        return frames.astype(np.uint8, copy=False)
+
+    @property
+    def nbytes(self) -> int:
+        """The total bytes used by the tileset (texture pixels and lookup table)."""
+        return self.texture_rows.nbytes + self.lookup.nbytes
+
+    def memory_report(self) -> Dict[str, int]:
+        """Report the bytes used by each part of the tileset.
+
+        Returns:
+            Dict[str, int]: The bytes used by the textures, the lookup table, and their total.
+        """
+        return {
+            "textures": self.texture_rows.nbytes,
+            "lookup": self.lookup.nbytes,
+            "total": self.nbytes,
+        }
+
+    def __len__(self) -> int:
+        return len(self.tile_ids)
+
+    def fill(self, ref_tilemap: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Convert a reference tilemap of tile IDs into a pixel array.
+
+        The (h, w) tile IDs are converted to texture rows with one lookup, then pixel row `r` of
+        every tile is gathered at once from `texture_rows[r]` straight into an (h, tile_d, w,
+        tile_d) view of the output, which is the memory layout of the final image. The Python
+        overhead is one call per pixel row of a tile, independent of the number of tiles.
+
+        Args:
+            ref_tilemap (np.ndarray): The (h, w) uint8 or uint16 tile IDs.
+            out (Optional[np.ndarray], optional): A reusable (h * tile_d, w * tile_d) uint8 buffer.
+                Allocated if missing or of the wrong shape. Defaults to None.
+
+        Returns:
+            np.ndarray: The (h * tile_d, w * tile_d) pixels.
+        """
+        h, w = ref_tilemap.shape
+        d = self.tile_d
+        if out is None or out.shape != (h * d, w * d) or not out.flags.c_contiguous:
+            out = np.empty((h * d, w * d), dtype=np.uint8)
+        rows = np.take(self.lookup, ref_tilemap, mode="clip")
+        out_tiles = out.reshape(h, d, w, d)
+        for r in range(d):
+            np.take(self.texture_rows[r], rows, axis=0, out=out_tiles[:, r], mode="clip")
+        return out
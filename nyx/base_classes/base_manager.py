@@ -5,9 +5,12 @@ from nyx.nyx_engine.nyx_engine import NyxEngine
 
 
 class BaseManager:
+    def __init__(self, engine: NyxEngine):
+        self._engine = engine
+
     @property
     def engine(self) -> NyxEngine:
-        return NyxEngine()
+        return self._engine
 
     @property
     def dimensions(self) -> AetherDimensions:
@@ -19,7 +19,7 @@ Classes:
 from datetime import datetime
 import io
 import sys
-from typing import Dict
+from typing import Dict, Optional, TextIO
 from line_profiler import LineProfiler
 import numpy as np
 
@@ -37,18 +37,23 @@ class HemeraTermFx:
         run_line_profile (bool): Whether to run the line profiler on `_generate_string_buffer`
         profiler (LineProfiler): The line profiler object.
         profile_output_file (str): The file to output the line profiler stats to.
+        output (Optional[TextIO]): The stream frames are written to, such as a `TerminalSink` for
+            headless runs. None (the default) writes to `sys.stdout`.
 
     """
 
-    def __init__(self, clear_term_on_run: bool = False):
+    def __init__(self, clear_term_on_run: bool = False, output: Optional[TextIO] = None):
         """Constructs Hemera with a default subpixel frame and filled ANSI color maps.
 
         Args:
             clear_term_on_run (bool, optional): Issues a terminal clear command on next render.
                 Defaults to False.
+            output (Optional[TextIO], optional): The stream frames are written to. Defaults to
+                None (`sys.stdout`).
         """
         self.old_subpixel_frame: np.ndarray = None
         self.clear_term_on_run: bool = clear_term_on_run
+        self.output: Optional[TextIO] = output
 
         # Generate ANSI color maps
         self.ansi_fg = self._generate_fg_ansi_map()
@@ -171,11 +176,11 @@ class HemeraTermFx:
         Args:
             str_buffer (str): The string buffer to print to the terminal.
         """
-        sys.stdout.write(str_buffer)
+        (self.output or sys.stdout).write(str_buffer)
 
     def flush_to_term(self):
         """Flush the terminal output."""
-        sys.stdout.flush()
+        (self.output or sys.stdout).flush()
 
     def sum_bg(self, delta_frame: np.ndarray):
         """Sum the fg and bg colors to get the sum of the fg and bg colors for each pixel. Then,
@@ -0,0 +1,362 @@
+"""
+Terminal Input Module
+
+This module reads the keyboard without ever blocking the frame loop. `TerminalInput` puts the TTY
+in cbreak (or raw) mode and runs a background reader thread that sleeps in `select` until bytes
+arrive (no CPU is used while idle), parses them into key names (including arrow/function key
+escape sequences) and pushes them into a single-producer/single-consumer ring buffer, which the
+game drains once per tick (see `InputSystem`). The terminal settings are restored when the reader
+stops, including when the program exits or an exception unwinds through the `with` block.
+
+Key names are printable characters as is (`"a"`, `"A"`, `" "`), and otherwise `"up"`, `"down"`,
+`"left"`, `"right"`, `"home"`, `"end"`, `"insert"`, `"delete"`, `"page-up"`, `"page-down"`,
+`"f1"`-`"f12"`, `"enter"`, `"tab"`, `"backspace"`, `"escape"`, `"ctrl+<letter>"` and
+`"alt+<key>"`.
+
+Classes:
+    KeyRingBuffer: A fixed-size, lock-free single-producer/single-consumer queue of keys.
+    KeyParser: An incremental parser of terminal input bytes into key names.
+    TerminalInput: A non-blocking keyboard reader on a TTY in cbreak or raw mode.
+"""
+
+import atexit
+import codecs
+import os
+import select
+import sys
+import termios
+import threading
+import tty
+from typing import List, Optional
+
+
+class KeyRingBuffer:
+    """A fixed-size, lock-free single-producer/single-consumer queue of keys.
+
+    The producer (the reader thread) only advances `tail` and the consumer (the game loop) only
+    advances `head`, each after its slot access, so no lock is needed. When the buffer is full,
+    new keys are dropped (and counted) rather than overwriting keys not yet consumed.
+
+    Attributes:
+        capacity (int): The number of keys the buffer holds.
+        head (int): The number of keys consumed.
+        tail (int): The number of keys produced.
+        dropped (int): The number of keys dropped because the buffer was full.
+
+    Methods:
+        push: Add a key (producer side).
+        drain: Remove and return every buffered key (consumer side).
+    """
+
+    def __init__(self, capacity: int = 256):
+        """Initialize an empty buffer.
+
+        Args:
+            capacity (int, optional): The number of keys the buffer holds. Defaults to 256.
+
+        Raises:
+            ValueError: If the capacity is not positive.
+        """
+        if capacity < 1:
+            raise ValueError("The key buffer capacity must be positive.")
+        self.capacity = capacity
+        self.head = 0
+        self.tail = 0
+        self.dropped = 0
+        self._slots: List[Optional[str]] = [None] * capacity
+
+    def push(self, key: str) -> bool:
+        """Add a key (producer side).
+
+        Args:
+            key (str): The key name.
+
+        Returns:
+            bool: If the key was added (False if the buffer was full and the key was dropped).
+        """
+        tail = self.tail
+        if tail - self.head >= self.capacity:
+            self.dropped += 1
+            return False
+        self._slots[tail % self.capacity] = key
+        # Published after the slot is written
+        self.tail = tail + 1
+        return True
+
+    def drain(self) -> List[str]:
+        """Remove and return every buffered key, oldest first (consumer side).
+
+        Returns:
+            List[str]: The keys.
+        """
+        head, tail = self.head, self.tail
+        keys = [self._slots[i % self.capacity] for i in range(head, tail)]
+        # Released after the slots are read
+        self.head = tail
+        return keys
+
+    def __len__(self) -> int:
+        return self.tail - self.head
+
+
+class KeyParser:
+    """An incremental parser of terminal input bytes into key names.
+
+    Bytes are decoded as UTF-8 and escape sequences (CSI `ESC [ ...` and SS3 `ESC O x`) are mapped
+    to key names. A sequence split across reads is kept pending until the rest arrives; a lone
+    `ESC` stays pending too, since it may start a sequence, until `flush` is called (the reader
+    does so when no more bytes follow shortly).
+
+    Attributes:
+        pending (str): The decoded characters of an incomplete escape sequence.
+
+    Methods:
+        feed: Parse newly read bytes.
+        flush: Emit the pending characters as keys.
+    """
+
+    # CSI/SS3 final characters
+    FINAL_KEYS = {
+        "A": "up",
+        "B": "down",
+        "C": "right",
+        "D": "left",
+        "H": "home",
+        "F": "end",
+        "P": "f1",
+        "Q": "f2",
+        "R": "f3",
+        "S": "f4",
+    }
+    # CSI `ESC [ <number> ~` sequences
+    TILDE_KEYS = {
+        "1": "home",
+        "2": "insert",
+        "3": "delete",
+        "4": "end",
+        "5": "page-up",
+        "6": "page-down",
+        "7": "home",
+        "8": "end",
+        "15": "f5",
+        "17": "f6",
+        "18": "f7",
+        "19": "f8",
+        "20": "f9",
+        "21": "f10",
+        "23": "f11",
+        "24": "f12",
+    }
+    CONTROL_KEYS = {
+        "\r": "enter",
+        "\n": "enter",
+        "\t": "tab",
+        "\x7f": "backspace",
+        "\x08": "backspace",
+        "\x1b": "escape",
+    }
+
+    def __init__(self):
+        """Initialize the parser with no pending input."""
+        self.pending = ""
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def feed(self, data: bytes) -> List[str]:
+        """Parse newly read bytes.
+
+        Args:
+            data (bytes): The bytes read from the terminal.
+
+        Returns:
+            List[str]: The complete keys, in order.
+        """
+        text = self.pending + self._decoder.decode(data)
+        keys = []
+        i = 0
+        while i < len(text):
+            char = text[i]
+            if char != "\x1b":
+                keys.append(self._key_name(char))
+                i += 1
+                continue
+            if i + 1 == len(text):
+                break
+            introducer = text[i + 1]
+            if introducer == "[":
+                end = i + 2
+                # Parameter and intermediate bytes, then one final byte
+                while end < len(text) and not "\x40" <= text[end] <= "\x7e":
+                    end += 1
+                if end == len(text):
+                    break
+                keys.append(self._csi_key(text[i + 2 : end], text[end]))
+                i = end + 1
+            elif introducer == "O":
+                if i + 2 == len(text):
+                    break
+                final = text[i + 2]
+                keys.append(self.FINAL_KEYS.get(final, f"alt+{final}"))
+                i += 3
+            else:
+                keys.append(
+                    "escape" if introducer == "\x1b" else f"alt+{self._key_name(introducer)}"
+                )
+                i += 1 if introducer == "\x1b" else 2
+        self.pending = text[i:]
+        return keys
+
+    def flush(self) -> List[str]:
+        """Emit the pending characters as keys (a lone `ESC` becomes `"escape"`).
+
+        Returns:
+            List[str]: The keys.
+        """
+        pending, self.pending = self.pending, ""
+        return [self._key_name(char) for char in pending]
+
+    def _csi_key(self, params: str, final: str) -> str:
+        """Get the key name of a CSI sequence (unknown sequences keep their raw text)."""
+        if final == "~":
+            key = self.TILDE_KEYS.get(params.split(";")[0])
+        else:
+            key = self.FINAL_KEYS.get(final)
+        return key if key is not None else f"\x1b[{params}{final}"
+
+    def _key_name(self, char: str) -> str:
+        """Get the key name of a single character."""
+        if char in self.CONTROL_KEYS:
+            return self.CONTROL_KEYS[char]
+        if "\x01" <= char <= "\x1a":
+            return f"ctrl+{chr(ord(char) + 96)}"
+        return char
+
+
+class TerminalInput:
+    """A non-blocking keyboard reader on a TTY in cbreak or raw mode.
+
+    `start` switches the terminal mode and starts the reader thread; `stop` (or leaving the `with`
+    block, or the program exiting) stops it and restores the saved terminal settings. The reader
+    blocks in `select` on the terminal and a wake-up pipe, so it uses no CPU while idle and stops
+    promptly.
+
+    Attributes:
+        fd (int): The terminal file descriptor.
+        raw (bool): If the terminal is put in raw mode (no signal keys, no output processing)
+            rather than cbreak mode.
+        keys (KeyRingBuffer): The keys read and not yet drained.
+        escape_timeout (float): How long a lone `ESC` waits for the rest of a sequence before it
+            is reported as the escape key, in seconds.
+        is_running (bool): If the reader thread is running.
+
+    Methods:
+        start: Switch the terminal mode and start reading.
+        stop: Stop reading and restore the terminal settings.
+        drain: Remove and return every key read since the last drain.
+    """
+
+    def __init__(
+        self,
+        fd: Optional[int] = None,
+        raw: bool = False,
+        capacity: int = 256,
+        escape_timeout: float = 0.05,
+    ):
+        """Initialize the reader (the terminal is not touched until `start`).
+
+        Args:
+            fd (int, optional): The terminal file descriptor. Defaults to None (standard input).
+            raw (bool, optional): Use raw rather than cbreak mode. Defaults to False.
+            capacity (int, optional): The capacity of the key ring buffer. Defaults to 256.
+            escape_timeout (float, optional): How long a lone `ESC` waits for the rest of a
+                sequence, in seconds. Defaults to 0.05.
+        """
+        self.fd = sys.stdin.fileno() if fd is None else fd
+        self.raw = raw
+        self.keys = KeyRingBuffer(capacity)
+        self.escape_timeout = escape_timeout
+        self.is_running = False
+        self._parser = KeyParser()
+        self._saved_attributes: Optional[list] = None
+        self._thread: Optional[threading.Thread] = None
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+
+    def start(self) -> "TerminalInput":
+        """Save the terminal settings, switch the terminal to cbreak/raw mode and start the reader
+        thread.
+
+        Raises:
+            ValueError: If the reader is already running or the file descriptor is not a TTY.
+
+        Returns:
+            TerminalInput: The reader itself.
+        """
+        if self.is_running:
+            raise ValueError("The terminal reader is already running.")
+        if not os.isatty(self.fd):
+            raise ValueError(f"File descriptor {self.fd} is not a terminal.")
+        self._saved_attributes = termios.tcgetattr(self.fd)
+        atexit.register(self.stop)
+        if self.raw:
+            tty.setraw(self.fd, termios.TCSANOW)
+        else:
+            tty.setcbreak(self.fd, termios.TCSANOW)
+        self._wake_r, self._wake_w = os.pipe()
+        self.is_running = True
+        self._thread = threading.Thread(
+            target=self._read_loop, name="nyx-terminal-input", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the reader thread and restore the saved terminal settings (safe to call more than
+        once)."""
+        if not self.is_running:
+            return
+        self.is_running = False
+        os.write(self._wake_w, b"\0")
+        self._thread.join()
+        try:
+            termios.tcsetattr(self.fd, termios.TCSANOW, self._saved_attributes)
+        finally:
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._thread = self._wake_r = self._wake_w = None
+            atexit.unregister(self.stop)
+
+    def drain(self) -> List[str]:
+        """Remove and return every key read since the last drain, oldest first.
+
+        Returns:
+            List[str]: The keys.
+        """
+        return self.keys.drain()
+
+    def __enter__(self) -> "TerminalInput":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _read_loop(self):
+        """Read, parse and buffer keys until stopped or the terminal closes."""
+        parser, keys = self._parser, self.keys
+        while self.is_running:
+            # Blocks without a timeout (no CPU while idle) unless an `ESC` awaits its sequence
+            timeout = self.escape_timeout if parser.pending else None
+            readable, _, _ = select.select([self.fd, self._wake_r], [], [], timeout)
+            if self._wake_r in readable:
+                break
+            if not readable:
+                new_keys = parser.flush()
+            else:
+                try:
+                    data = os.read(self.fd, 1024)
+                except OSError:
+                    data = b""
+                if not data:
+                    break
+                new_keys = parser.feed(data)
+            for key in new_keys:
+                keys.push(key)
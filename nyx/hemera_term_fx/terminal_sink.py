@@ -0,0 +1,66 @@
+"""
+Terminal Sink Module
+
+This module defines an output stream that stands in for the terminal, so Hemera can encode frames
+without a TTY (headless runs, benchmarks and tests). The sink counts the bytes and writes it
+receives, and optionally keeps the output in memory.
+
+Classes:
+    TerminalSink: A null or in-memory replacement for the terminal output stream.
+"""
+
+import io
+from typing import List
+
+
+class TerminalSink(io.TextIOBase):
+    """A null or in-memory replacement for the terminal output stream.
+
+    Attributes:
+        keep_output (bool): If the written text is kept (in-memory sink); otherwise it is discarded
+            (null sink).
+        bytes_written (int): The number of UTF-8 encoded bytes written.
+        writes (int): The number of writes.
+
+    Methods:
+        write: Count (and optionally keep) a string.
+        getvalue: Get the kept output.
+    """
+
+    def __init__(self, keep_output: bool = False):
+        """Initialize an empty sink.
+
+        Args:
+            keep_output (bool, optional): Keep the written text in memory. Defaults to False.
+        """
+        super().__init__()
+        self.keep_output = keep_output
+        self.bytes_written = 0
+        self.writes = 0
+        self._chunks: List[str] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        """Count (and optionally keep) a string.
+
+        Args:
+            text (str): The text written to the terminal.
+
+        Returns:
+            int: The number of characters written.
+        """
+        self.bytes_written += len(text.encode("utf-8"))
+        self.writes += 1
+        if self.keep_output:
+            self._chunks.append(text)
+        return len(text)
+
+    def getvalue(self) -> str:
+        """Get the kept output (empty for a null sink).
+
+        Returns:
+            str: Everything written since the sink was created.
+        """
+        return "".join(self._chunks)
@@ -9,4 +9,11 @@ from abc import ABC
 
 
 class NyxComponent(ABC):
-    """Abstract base class of all components in NyxEngine."""
+    """Abstract base class of all components in NyxEngine.
+
+    Components declare their fields in `__slots__`, so instances carry no per-instance `__dict__`.
+    Subclasses that do not declare `__slots__` still work, at the cost of a `__dict__` per
+    instance.
+    """
+
+    __slots__ = ()
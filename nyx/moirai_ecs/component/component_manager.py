@@ -4,14 +4,49 @@ Component Manager Module
 Manages and organizes the components that define the behaviors of game entities. The components are
 indexed by entity ID.
 
+Component types are registered at runtime (`register_component_type`) and get a small integer type
+ID from the `ComponentTypeRegistry`; the storage of each type is indexed by its type ID (`stores`)
+and aliased by its name (`component_registry`). Each entity also has a component bitmask, so
+matching an entity against a query is a single AND.
+
+The numeric, per-frame component types (position, velocity, z-index, dimensions) are held in
+struct-of-arrays `ColumnStore`s, so systems can update them with vectorized column operations; the
+other component types are stored as objects.
+
+Queries (`query`) cache the entities holding a group of component types and are maintained
+incrementally by `add_component`, `remove_component` and `remove_entity`, and by their batch
+counterparts `add_components` and `remove_entities`. Creating a query is serialized by a lock,
+since systems running in parallel may ask for the same new query concurrently.
+
 Classes:
     ComponentManager: The centralized storage of all Components in NyxEngine, organized by entity_id
         and component type.
 """
 
-from typing import Dict
+import copy
+import threading
+from typing import Dict, FrozenSet, List, Optional
+
+import numpy as np
 
 from nyx.moirai_ecs.component.base_components import NyxComponent
+from nyx.moirai_ecs.component.component_query import ComponentQuery
+from nyx.moirai_ecs.component.component_store import ColumnStore
+from nyx.moirai_ecs.component.component_type_registry import ComponentTypeRegistry
+from nyx.moirai_ecs.component.scene_components import (
+    BackgroundColorComponent,
+    SceneComponent,
+    TilemapComponent,
+)
+from nyx.moirai_ecs.component.texture_components import TextureComponent
+from nyx.moirai_ecs.component.transform_components import (
+    CameraComponent,
+    DimensionsComponent,
+    PositionComponent,
+    VelocityComponent,
+    ZIndexComponent,
+)
+from nyx.moirai_ecs.entity.entity_allocator import EntityId
 
 
 class ComponentManager:
@@ -20,7 +55,18 @@ class ComponentManager:
 
     Attributes:
         component_registry (Dict[str, Dict[int, NyxComponent]]): The registry of all components
-            registered to entities.
+            registered to entities. The "position", "velocity", "z-index" and "dimensions" entries
+            are `ColumnStore`s: adding a component copies its values into the store, and getting
+            it returns a live view of the entity's row.
+        component_types (ComponentTypeRegistry): The registered component types and their IDs.
+        stores (List[Dict[int, NyxComponent]]): The storage of each component type, indexed by
+            type ID (the same objects as the `component_registry` values).
+        entity_masks (np.ndarray): The component bitmask (uint64) of each entity slot.
+        mask_owners (np.ndarray): The entity ID each bitmask belongs to (-1 if none), so stale
+            entity IDs never see the bitmask of their slot's new owner.
+        entity_sequence (np.ndarray): The order in which each slot's owner received its first
+            component (entity creation order, since IDs and slots are recycled).
+        queries (Dict[FrozenSet[str], ComponentQuery]): The cached queries by component group.
 
     Methods:
         add_component(): Register a new component to an entity.
@@ -28,20 +74,107 @@ class ComponentManager:
         update_compone()): Update the component registered to the entity.
         destroy_compon(): Remove the a component from from the registry.
         remove_entity(): Remove all components belonging to an entity.
+        add_components(): Register copies of a component to several entities at once.
+        remove_entities(): Remove all components belonging to several entities at once.
+        query(): Get the cached set of entities holding every given component type.
+        register_component_type(): Register a new component type and create its storage.
+        component_mask(): Get the component bitmask of an entity.
+        creation_order(): Sort entity IDs by the order they received their first component.
+
+    Note:
+        Queries only track changes made through these methods; writing to the registry
+        dictionaries directly bypasses them.
     """
 
+    # The built-in component types: (name, component class, numeric column dtypes or None)
+    BUILTIN_COMPONENT_TYPES = (
+        ("background-color", BackgroundColorComponent, None),
+        ("camera", CameraComponent, None),
+        ("dimensions", DimensionsComponent, {"height": np.int64, "width": np.int64}),
+        (
+            "position",
+            PositionComponent,
+            {
+                "x_pos": np.float64,
+                "y_pos": np.float64,
+                "render_x_pos": np.int64,
+                "render_y_pos": np.int64,
+            },
+        ),
+        ("scene", SceneComponent, None),
+        ("texture", TextureComponent, None),
+        ("tilemap", TilemapComponent, None),
+        ("velocity", VelocityComponent, {"x_vel": np.float64, "y_vel": np.float64}),
+        ("z-index", ZIndexComponent, {"z_index": np.int64}),
+    )
+
     def __init__(self):
-        # Component Registry
-        self.component_registry: Dict[str, Dict[int, NyxComponent]] = {
-            "background-color": {},
-            "dimensions": {},
-            "position": {},
-            "scene": {},
-            "texture": {},
-            "tilemap": {},
-            "velocity": {},
-            "z-index": {},
-        }
+        # Component types, and their storage aliased by name (the component registry)
+        self.component_types = ComponentTypeRegistry()
+        self.stores: List[Dict[int, NyxComponent]] = self.component_types.stores
+        self.component_registry: Dict[str, Dict[int, NyxComponent]] = {}
+        # Per-entity-slot component bitmasks
+        self.entity_masks = np.zeros(64, dtype=np.uint64)
+        self.mask_owners = np.full(64, -1, dtype=np.int64)
+        self.entity_sequence = np.zeros(64, dtype=np.int64)
+        self._next_sequence = 0
+        # Cached queries, and the queries affected by each component type
+        self.queries: Dict[FrozenSet[str], ComponentQuery] = {}
+        self._queries_by_component: Dict[str, List[ComponentQuery]] = {}
+        self._query_lock = threading.Lock()
+        for name, component_class, fields in self.BUILTIN_COMPONENT_TYPES:
+            self.register_component_type(name, component_class, fields)
+
+    def register_component_type(
+        self,
+        name: str,
+        component_class: Optional[type] = None,
+        fields: Optional[Dict[str, type]] = None,
+    ) -> int:
+        """Register a new component type and create its storage.
+
+        Args:
+            name (str): The component type name, used as its key in the component registry.
+            component_class (type, optional): The component class. Defaults to None.
+            fields (Dict[str, type], optional): The NumPy dtype of each numeric field, to store the
+                type in a struct-of-arrays `ColumnStore`. Defaults to None (component objects).
+
+        Raises:
+            ValueError: If the name is already registered or too many types are registered.
+
+        Returns:
+            int: The type ID of the new component type.
+        """
+        type_id = self.component_types.register(name, component_class, fields)
+        self.component_registry[name] = self.stores[type_id]
+        return type_id
+
+    def component_mask(self, entity_id: int) -> int:
+        """Get the component bitmask of an entity (bit `type_id` is set for each type it holds).
+
+        Args:
+            entity_id (int): The entity ID.
+
+        Returns:
+            int: The bitmask (0 for unknown or stale entity IDs).
+        """
+        index = EntityId.index(entity_id)
+        if entity_id < 0 or index >= self.mask_owners.size or self.mask_owners[index] != entity_id:
+            return 0
+        return int(self.entity_masks[index])
+
+    def creation_order(self, entity_ids: np.ndarray) -> np.ndarray:
+        """Sort entity IDs by the order they received their first component (creation order).
+
+        Args:
+            entity_ids (np.ndarray): Live entity IDs holding at least one component.
+
+        Returns:
+            np.ndarray: The entity IDs, oldest first.
+        """
+        entity_ids = np.asarray(entity_ids, dtype=np.int64)
+        order = np.argsort(self.entity_sequence[EntityId.index(entity_ids)], kind="stable")
+        return entity_ids[order]
 
     def add_component(
         self, entity_id: int, component_name: str, component: NyxComponent
@@ -61,7 +194,12 @@ class ComponentManager:
                 f'Component="{component_name}" already exists for entity={entity_id}'
             )
 
+        index = self._own_slot(entity_id)
         self.component_registry[component_name][entity_id] = component
+        self.entity_masks[index] |= self._bit(component_name)
+        for query in self._queries_by_component.get(component_name, ()):
+            if self._matches(entity_id, query):
+                query.add(entity_id)
 
     def get_component(self, entity_id: int, component_name: str) -> NyxComponent:
         """Get a component for an entity.
@@ -117,13 +255,222 @@ class ComponentManager:
                 f'Entity={entity_id} not found in "{component_name}" component registry.'
             )
         del self.component_registry[component_name][entity_id]
+        if self.component_mask(entity_id):
+            self.entity_masks[EntityId.index(entity_id)] &= ~self._bit(component_name)
+        for query in self._queries_by_component.get(component_name, ()):
+            query.discard(entity_id)
 
     def remove_entity(self, entity_id: int):
-        """Remove all components belonging to an entity.
+        """Remove all components belonging to an entity. Every store is swept (not only the
+        component types in the entity's bitmask), so components written directly into
+        `component_registry` are removed too.
 
         Args:
             entity_id (int): The entity ID of the entity to clear from the registry.
         """
-        for sub_dict in self.component_registry.values():
-            if entity_id in sub_dict.keys():
-                del sub_dict[entity_id]
+        held = self.component_types.names_in(self.component_mask(entity_id))
+        if held:
+            self.entity_masks[EntityId.index(entity_id)] = 0
+        for name, store in self.component_registry.items():
+            if entity_id in store:
+                del store[entity_id]
+            elif name not in held:
+                continue
+            for query in self._queries_by_component.get(name, ()):
+                query.discard(entity_id)
+
+    def add_components(
+        self,
+        entity_ids: np.ndarray,
+        component_name: str,
+        component: NyxComponent,
+        overrides: Optional[Dict[str, object]] = None,
+    ):
+        """Register copies of a template component to several entities at once.
+
+        Column-stored component types are appended with one vectorized write per field. Other
+        component types share the template object between the entities, unless overrides are
+        given, in which case each entity gets a shallow copy.
+
+        Args:
+            entity_ids (np.ndarray): The entity IDs to add the component to.
+            component_name (str): The name of the sub-dictionary that holds that component.
+            component (NyxComponent): The template component.
+            overrides (Dict[str, object], optional): Field values replacing the template's, each
+                a scalar or an array with one value per entity. Defaults to None.
+
+        Raises:
+            ValueError: If the component type is already registered for one of the entities.
+        """
+        entity_ids = np.asarray(entity_ids, dtype=np.int64)
+        overrides = overrides or {}
+        registry = self.component_registry[component_name]
+        existing = self._has_component(entity_ids, component_name)
+        if existing.any():
+            raise ValueError(
+                f'Component="{component_name}" already exists for entities='
+                f"{entity_ids[existing].tolist()}"
+            )
+
+        indices = self._own_slots(entity_ids)
+        if isinstance(registry, ColumnStore):
+            registry.extend(
+                entity_ids,
+                {
+                    field: overrides.get(field, getattr(component, field))
+                    for field in registry.fields
+                },
+            )
+        elif overrides:
+            columns = {
+                field: np.broadcast_to(np.asarray(values, dtype=object), entity_ids.shape)
+                for field, values in overrides.items()
+            }
+            for i, entity_id in enumerate(entity_ids.tolist()):
+                entity_component = copy.copy(component)
+                for field, values in columns.items():
+                    setattr(entity_component, field, values[i])
+                registry[entity_id] = entity_component
+        else:
+            registry.update(dict.fromkeys(entity_ids.tolist(), component))
+
+        self.entity_masks[indices] |= self._bit(component_name)
+        masks = self.entity_masks[indices]
+        for query in self._queries_by_component.get(component_name, ()):
+            query.add_many(entity_ids[(masks & query.mask) == query.mask])
+
+    def remove_entities(self, entity_ids: np.ndarray):
+        """Remove all components belonging to several entities at once. Like `remove_entity`,
+        every store is swept, so components written directly into `component_registry` are
+        removed too.
+
+        Args:
+            entity_ids (np.ndarray): The entity IDs of the entities to clear from the registry.
+        """
+        entity_ids = np.asarray(entity_ids, dtype=np.int64)
+        if entity_ids.size == 0:
+            return
+        indices = EntityId.index(entity_ids)
+        owned = (entity_ids >= 0) & (indices < self.mask_owners.size)
+        owned[owned] = self.mask_owners[indices[owned]] == entity_ids[owned]
+        held = np.bitwise_or.reduce(self.entity_masks[indices[owned]]) if owned.any() else 0
+        held = self.component_types.names_in(held)
+        self.entity_masks[indices[owned]] = 0
+        id_set = set(entity_ids.tolist())
+        for name, store in self.component_registry.items():
+            if isinstance(store, ColumnStore):
+                removed = store.remove_many(entity_ids).size
+            else:
+                # Iterates over the smaller of the two
+                present = store.keys() & id_set
+                for entity_id in present:
+                    del store[entity_id]
+                removed = len(present)
+            if removed or name in held:
+                for query in self._queries_by_component.get(name, ()):
+                    query.discard_many(entity_ids)
+
+    def query(self, *component_names: str) -> ComponentQuery:
+        """Get the cached set of entities holding every given component type. The first call for a
+        group of component types matches every entity's component bitmask once; the query is then
+        kept up to date incrementally.
+
+        Args:
+            *component_names (str): The component types to match.
+
+        Raises:
+            KeyError: If a component type is not in the registry.
+
+        Returns:
+            ComponentQuery: The live query (the same object on every call).
+        """
+        key = frozenset(component_names)
+        query = self.queries.get(key)
+        if query is not None:
+            return query
+
+        with self._query_lock:
+            # Another thread may have created the query while this one waited for the lock
+            query = self.queries.get(key)
+            if query is not None:
+                return query
+            query = ComponentQuery(key, mask=self.component_types.mask_of(*key))
+            if key:
+                # One vectorized signature match over every entity slot
+                matching = (self.mask_owners >= 0) & (
+                    (self.entity_masks & query.mask) == query.mask
+                )
+                query.add_many(self.mask_owners[matching])
+            for component_name in key:
+                self._queries_by_component.setdefault(component_name, []).append(query)
+            # Published last, so the lock-free lookup above never sees a half-registered query
+            self.queries[key] = query
+        return query
+
+    def _matches(self, entity_id: int, query: ComponentQuery) -> bool:
+        """Check if an entity holds every component type of a query (its bitmask signature)."""
+        return self.component_mask(entity_id) & int(query.mask) == int(query.mask)
+
+    def _has_component(self, entity_ids: np.ndarray, component_name: str) -> np.ndarray:
+        """Check which of several entities hold a component type (a boolean mask)."""
+        registry = self.component_registry[component_name]
+        if isinstance(registry, ColumnStore):
+            return registry.rows_of(entity_ids) >= 0
+        return np.fromiter(
+            (entity_id in registry for entity_id in entity_ids.tolist()),
+            dtype=bool,
+            count=entity_ids.size,
+        )
+
+    def _bit(self, component_name: str) -> np.uint64:
+        """Get the bitmask bit of a component type."""
+        return np.uint64(1 << self.component_types.type_id(component_name))
+
+    def _own_slot(self, entity_id: int) -> int:
+        """Claim the bitmask slot of one entity (see `_own_slots`)."""
+        index = EntityId.index(entity_id)
+        if entity_id < 0 or index >= self.mask_owners.size:
+            return int(self._own_slots(np.array([entity_id], dtype=np.int64))[0])
+        if self.mask_owners[index] != entity_id:
+            self.entity_masks[index] = 0
+            self.mask_owners[index] = entity_id
+            self.entity_sequence[index] = self._next_sequence
+            self._next_sequence += 1
+        return index
+
+    def _own_slots(self, entity_ids: np.ndarray) -> np.ndarray:
+        """Claim the bitmask slots of entities, clearing slots left by older generations.
+
+        Args:
+            entity_ids (np.ndarray): The (live) entity IDs.
+
+        Raises:
+            KeyError: If an entity ID is negative.
+
+        Returns:
+            np.ndarray: The slot index of each entity.
+        """
+        if entity_ids.size and entity_ids.min() < 0:
+            raise KeyError(int(entity_ids.min()))
+        indices = EntityId.index(entity_ids)
+        needed = int(indices.max()) + 1 if indices.size else 0
+        if needed > self.entity_masks.size:
+            size = max(needed, self.entity_masks.size * 2)
+            self.entity_masks = np.concatenate(
+                [self.entity_masks, np.zeros(size - self.entity_masks.size, dtype=np.uint64)]
+            )
+            self.mask_owners = np.concatenate(
+                [self.mask_owners, np.full(size - self.mask_owners.size, -1, dtype=np.int64)]
+            )
+            self.entity_sequence = np.concatenate(
+                [self.entity_sequence, np.zeros(size - self.entity_sequence.size, dtype=np.int64)]
+            )
+        stale = self.mask_owners[indices] != entity_ids
+        new_owners = indices[stale]
+        self.entity_masks[new_owners] = 0
+        self.mask_owners[indices] = entity_ids
+        self.entity_sequence[new_owners] = np.arange(
+            self._next_sequence, self._next_sequence + new_owners.size
+        )
+        self._next_sequence += new_owners.size
+        return indices
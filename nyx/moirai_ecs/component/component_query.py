@@ -0,0 +1,132 @@
+"""
+Component Query Module
+
+This module defines cached ECS queries: the set of entities holding every component in a group of
+component types. `ComponentManager` keeps each query up to date as components are added and removed,
+so systems read the matching entity IDs directly instead of filtering the registries every frame.
+
+Classes:
+    ComponentQuery: An incrementally maintained, contiguous set of entity IDs.
+"""
+
+from typing import Dict, FrozenSet, Iterable, Iterator
+
+import numpy as np
+
+
+class ComponentQuery:
+    """An incrementally maintained, contiguous set of the entity IDs holding every component in
+    `component_names`.
+
+    The IDs are packed in a NumPy array (swap-remove on removal), so `entity_ids` can be used
+    directly for vectorized gathers from the component stores. The order is unspecified; sort it
+    when a stable order (e.g. creation order) is required.
+
+    Attributes:
+        component_names (FrozenSet[str]): The component types every matching entity holds.
+        mask (np.uint64): The component bitmask of `component_names` (see
+            `ComponentTypeRegistry`).
+
+    Methods:
+        add: Add a matching entity.
+        add_many: Add several matching entities at once.
+        discard: Remove an entity if present.
+        discard_many: Remove several entities at once.
+    """
+
+    def __init__(self, component_names: Iterable[str], mask: int = 0, capacity: int = 64):
+        """Initialize an empty query.
+
+        Args:
+            component_names (Iterable[str]): The component types every matching entity holds.
+            mask (int, optional): The component bitmask of the component types. Defaults to 0.
+            capacity (int, optional): The initial capacity of the ID array. Defaults to 64.
+        """
+        self.component_names: FrozenSet[str] = frozenset(component_names)
+        self.mask = np.uint64(mask)
+        self._dense = np.zeros(capacity, dtype=np.int64)
+        self._rows: Dict[int, int] = {}
+
+    @property
+    def entity_ids(self) -> np.ndarray:
+        """The matching entity IDs (a live view; copy it before modifying the components)."""
+        return self._dense[: len(self._rows)]
+
+    def add(self, entity_id: int):
+        """Add a matching entity (no-op if already present).
+
+        Args:
+            entity_id (int): The entity ID.
+        """
+        if entity_id in self._rows:
+            return
+        row = len(self._rows)
+        if row == self._dense.size:
+            self._dense = np.resize(self._dense, self._dense.size * 2)
+        self._dense[row] = entity_id
+        self._rows[entity_id] = row
+
+    def add_many(self, entity_ids: np.ndarray):
+        """Add several matching entities at once (entities already present are skipped).
+
+        Args:
+            entity_ids (np.ndarray): The entity IDs.
+        """
+        new_ids = [
+            entity_id
+            for entity_id in dict.fromkeys(np.asarray(entity_ids).tolist())
+            if entity_id not in self._rows
+        ]
+        start = len(self._rows)
+        end = start + len(new_ids)
+        if end > self._dense.size:
+            self._dense = np.resize(self._dense, max(end, self._dense.size * 2))
+        self._dense[start:end] = new_ids
+        self._rows.update(zip(new_ids, range(start, end)))
+
+    def discard_many(self, entity_ids: np.ndarray):
+        """Remove several entities at once (entities not present are ignored).
+
+        A few removals are swap-removed one by one; removing a large share of the query compacts
+        the ID array with one vectorized pass instead.
+
+        Args:
+            entity_ids (np.ndarray): The entity IDs.
+        """
+        entity_ids = np.asarray(entity_ids, dtype=np.int64)
+        if entity_ids.size * 8 < len(self._rows):
+            for entity_id in entity_ids.tolist():
+                self.discard(entity_id)
+            return
+        current = self.entity_ids
+        kept = current[~np.isin(current, entity_ids)]
+        self._dense[: kept.size] = kept
+        kept_ids = kept.tolist()
+        self._rows = dict(zip(kept_ids, range(len(kept_ids))))
+
+    def discard(self, entity_id: int):
+        """Remove an entity if present.
+
+        Args:
+            entity_id (int): The entity ID.
+        """
+        row = self._rows.pop(entity_id, None)
+        if row is None:
+            return
+        last = len(self._rows)
+        if row != last:
+            moved_id = int(self._dense[last])
+            self._dense[row] = moved_id
+            self._rows[moved_id] = row
+
+    def __contains__(self, entity_id) -> bool:
+        return entity_id in self._rows
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.entity_ids.tolist())
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self):
+        return f"<ComponentQuery: {sorted(self.component_names)}, {len(self)} entities>"
@@ -0,0 +1,344 @@
+"""
+Component Store Module
+
+This module stores numeric component types (position, velocity, z-index, dimensions) as a
+struct-of-arrays: one dense NumPy column per component field, plus a sparse-set map from entity ID
+to row. Vectorized systems operate on whole columns at once, while lightweight view objects keep the
+per-entity `component_registry[name][entity_id].field` API working.
+
+The sparse map is indexed by the slot index of the generational entity IDs (see
+`EntityAllocator`), so it stays as small as the peak number of live entities; each row also records
+the full entity ID, so stale IDs of destroyed entities are never matched to the slot's new owner.
+
+Rows are always packed in [0, count). Removing an entity moves the last row into the freed one
+(swap-remove), so the columns never have holes and iteration order is insertion order until the
+first removal.
+
+Classes:
+    ColumnStore: Dense, swap-remove column storage for one numeric component type.
+    ComponentView: Base class of the views returned by `ColumnStore`.
+"""
+
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, Tuple, Type
+
+import numpy as np
+
+from nyx.moirai_ecs.component.base_components import NyxComponent
+from nyx.moirai_ecs.entity.entity_allocator import EntityId
+
+
+class ComponentView:
+    """Base class of the views returned by `ColumnStore`. A view reads and writes its entity's row
+    through properties, so it stays valid when rows move during swap-removes.
+
+    View classes are created by `ColumnStore` and also subclass their component class, so
+    `isinstance(view, PositionComponent)` holds. The `_store`/`_entity_id` slots are declared on
+    the generated classes, since only one base of a class may define slots.
+
+    Attributes:
+        entity_id (int): The entity the view belongs to.
+    """
+
+    __slots__ = ()
+    _fields = ()
+
+    def __init__(self, store: "ColumnStore", entity_id: int):
+        self._store = store
+        self._entity_id = entity_id
+
+    @property
+    def entity_id(self) -> int:
+        """The entity the view belongs to."""
+        return self._entity_id
+
+    def __eq__(self, other) -> bool:
+        """Views are equal to any component of the same type holding the same field values."""
+        if not isinstance(other, self._store.component_class):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self._fields)
+
+    def __hash__(self) -> int:
+        return hash((id(self._store), self._entity_id))
+
+
+def _column_property(field: str) -> property:
+    """Build the property that reads/writes one field of a view's row."""
+
+    def getter(view: ComponentView):
+        store = view._store
+        return store.columns[field].item(store.row_of(view._entity_id))
+
+    def setter(view: ComponentView, value):
+        store = view._store
+        store.columns[field][store.row_of(view._entity_id)] = value
+
+    return property(getter, setter, doc=f"The `{field}` column of the entity's row.")
+
+
+class ColumnStore(MutableMapping):
+    """Dense, swap-remove column storage for one numeric component type.
+
+    Behaves like the `{entity_id: component}` dictionaries of the component registry: assigning a
+    component copies its field values into the entity's row, and reading returns a view.
+
+    Attributes:
+        component_class (Type[NyxComponent]): The component type stored.
+        view_class (Type[ComponentView]): The view type returned for each entity.
+        fields (Tuple[str, ...]): The component fields (the columns copied from and to components).
+        columns (Dict[str, np.ndarray]): The full-capacity column of each field, followed by the
+            auxiliary columns added with `add_column`.
+        entity_ids (np.ndarray): The entity ID of each row.
+        sparse (np.ndarray): The row of each entity slot index, or -1.
+        count (int): The number of rows in use.
+
+    Methods:
+        column: Get the live, dense slice of a field's column.
+        add_column: Add an auxiliary column that is not a component field.
+        row_of: Get the row of an entity.
+        rows_of: Get the rows of several entities.
+        extend: Append rows for several new entities at once.
+        remove_many: Remove the rows of several entities at once.
+    """
+
+    def __init__(
+        self,
+        component_class: Type[NyxComponent],
+        fields: Dict[str, type],
+        capacity: int = 64,
+    ):
+        """Allocate the columns of a component type.
+
+        Args:
+            component_class (Type[NyxComponent]): The component type stored.
+            fields (Dict[str, type]): The NumPy dtype of each numeric field.
+            capacity (int, optional): The initial number of rows. Defaults to 64.
+        """
+        self.component_class = component_class
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self.columns: Dict[str, np.ndarray] = {
+            field: np.zeros(capacity, dtype=dtype) for field, dtype in fields.items()
+        }
+        self.entity_ids = np.zeros(capacity, dtype=np.int64)
+        self.sparse = np.full(capacity, -1, dtype=np.int64)
+        self.count = 0
+        self.view_class = type(
+            f"{component_class.__name__}View",
+            (ComponentView, component_class),
+            {
+                "__slots__": ("_store", "_entity_id"),
+                "_fields": tuple(fields),
+                **{field: _column_property(field) for field in fields},
+            },
+        )
+        self._views: Dict[int, ComponentView] = {}
+
+    def column(self, field: str) -> np.ndarray:
+        """Get the live, dense slice of a field's column (rows [0, count)).
+
+        Args:
+            field (str): The field name.
+
+        Returns:
+            np.ndarray: A view of the column; writes go straight into the store.
+        """
+        return self.columns[field][: self.count]
+
+    def add_column(self, field: str, dtype: type) -> np.ndarray:
+        """Add an auxiliary column that is not a component field (e.g. state a system keeps per
+        entity). It moves with its rows like the field columns, is zero for new rows, and is not
+        part of the views or the components (no-op if the column exists).
+
+        Args:
+            field (str): The column name.
+            dtype (type): The NumPy dtype of the column.
+
+        Raises:
+            ValueError: If the name is a component field.
+
+        Returns:
+            np.ndarray: The live, dense slice of the column.
+        """
+        if field in self.fields:
+            raise ValueError(f'"{field}" is a field of {self.component_class.__name__}.')
+        if field not in self.columns:
+            self.columns[field] = np.zeros(self.entity_ids.size, dtype=dtype)
+        return self.column(field)
+
+    @property
+    def dense_entity_ids(self) -> np.ndarray:
+        """The entity ID of each row in use (aligned with `column`)."""
+        return self.entity_ids[: self.count]
+
+    def row_of(self, entity_id: int) -> int:
+        """Get the row of an entity.
+
+        Args:
+            entity_id (int): The entity ID.
+
+        Raises:
+            KeyError: If the entity has no row in this store.
+
+        Returns:
+            int: The row index.
+        """
+        if entity_id >= 0:
+            index = EntityId.index(entity_id)
+            if index < self.sparse.size:
+                row = int(self.sparse[index])
+                if row >= 0 and self.entity_ids[row] == entity_id:
+                    return row
+        raise KeyError(entity_id)
+
+    def rows_of(self, entity_ids: np.ndarray) -> np.ndarray:
+        """Get the rows of several entities (-1 for entities without a row).
+
+        Args:
+            entity_ids (np.ndarray): The entity IDs.
+
+        Returns:
+            np.ndarray: The row of each entity.
+        """
+        entity_ids = np.asarray(entity_ids, dtype=np.int64)
+        indices = EntityId.index(entity_ids)
+        rows = np.full(entity_ids.shape, -1, dtype=np.int64)
+        in_range = (entity_ids >= 0) & (indices < self.sparse.size)
+        rows[in_range] = self.sparse[indices[in_range]]
+        # Stale IDs point at a slot now owned by another generation (or nothing)
+        found = rows >= 0
+        found[found] = self.entity_ids[rows[found]] == entity_ids[found]
+        rows[~found] = -1
+        return rows
+
+    def extend(self, entity_ids: np.ndarray, values: Dict[str, object]):
+        """Append rows for several new entities at once.
+
+        Args:
+            entity_ids (np.ndarray): The new entity IDs (none may have a row yet).
+            values (Dict[str, object]): The value of each field: a scalar shared by every row or
+                an array with one value per entity.
+
+        Raises:
+            KeyError: If an entity ID is negative or its slot already has a row.
+        """
+        entity_ids = np.asarray(entity_ids, dtype=np.int64)
+        if entity_ids.size == 0:
+            return
+        indices = EntityId.index(entity_ids)
+        if entity_ids.min() < 0:
+            raise KeyError(int(entity_ids.min()))
+        self._reserve(self.count + entity_ids.size, int(indices.max()) + 1)
+        in_use = self.sparse[indices] >= 0
+        if in_use.any() or np.unique(indices).size != indices.size:
+            raise KeyError(f"Entity slots are already in use: {entity_ids[in_use].tolist()}")
+
+        rows = np.arange(self.count, self.count + entity_ids.size)
+        for field, column in self.columns.items():
+            column[rows] = values[field] if field in self.fields else 0
+        self.entity_ids[rows] = entity_ids
+        self.sparse[indices] = rows
+        self.count += entity_ids.size
+
+    def remove_many(self, entity_ids: np.ndarray) -> np.ndarray:
+        """Remove the rows of several entities at once (entities without a row are ignored). The
+        remaining rows are compacted in order with one gather per column.
+
+        Args:
+            entity_ids (np.ndarray): The entity IDs to remove.
+
+        Returns:
+            np.ndarray: The entity IDs that had a row and were removed.
+        """
+        rows = self.rows_of(entity_ids)
+        rows = np.unique(rows[rows >= 0])
+        if rows.size == 0:
+            return np.empty(0, dtype=np.int64)
+        keep = np.ones(self.count, dtype=bool)
+        keep[rows] = False
+        kept_rows = np.flatnonzero(keep)
+        removed = self.entity_ids[rows]
+
+        new_count = kept_rows.size
+        for column in self.columns.values():
+            column[:new_count] = column[kept_rows]
+        self.entity_ids[:new_count] = self.entity_ids[kept_rows]
+        self.sparse[EntityId.index(removed)] = -1
+        self.sparse[EntityId.index(self.entity_ids[:new_count])] = np.arange(new_count)
+        self.count = new_count
+        for entity_id in removed.tolist():
+            self._views.pop(entity_id, None)
+        return removed
+
+    def __getitem__(self, entity_id: int) -> ComponentView:
+        view = self._views.get(entity_id)
+        if view is None:
+            self.row_of(entity_id)
+            view = self._views[entity_id] = self.view_class(self, entity_id)
+        return view
+
+    def __setitem__(self, entity_id: int, component: NyxComponent):
+        if entity_id in self:
+            row = self.row_of(entity_id)
+        else:
+            row = self._append(entity_id)
+            for field, column in self.columns.items():
+                column[row] = 0
+        for field in self.fields:
+            self.columns[field][row] = getattr(component, field)
+
+    def __delitem__(self, entity_id: int):
+        row = self.row_of(entity_id)
+        last = self.count - 1
+        if row != last:
+            for column in self.columns.values():
+                column[row] = column[last]
+            moved_id = self.entity_ids[last]
+            self.entity_ids[row] = moved_id
+            self.sparse[EntityId.index(moved_id)] = row
+        self.sparse[EntityId.index(entity_id)] = -1
+        self.count = last
+        self._views.pop(entity_id, None)
+
+    def __contains__(self, entity_id) -> bool:
+        if not isinstance(entity_id, (int, np.integer)):
+            return False
+        try:
+            self.row_of(entity_id)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[int]:
+        # Snapshot, so entities can be removed while iterating
+        return iter(self.entity_ids[: self.count].tolist())
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _append(self, entity_id: int) -> int:
+        """Allocate the next row for an entity, growing the arrays as needed."""
+        if entity_id < 0:
+            raise KeyError(entity_id)
+        index = EntityId.index(entity_id)
+        if index < self.sparse.size and self.sparse[index] >= 0:
+            # The slot still holds a row of a destroyed generation
+            raise KeyError(f"Entity slot {index} is still in use by another entity ID.")
+        self._reserve(self.count + 1, index + 1)
+        row = self.count
+        self.entity_ids[row] = entity_id
+        self.sparse[index] = row
+        self.count += 1
+        return row
+
+    def _reserve(self, rows: int, slots: int):
+        """Grow the row arrays and the sparse map (doubling) to hold the given sizes."""
+        if rows > self.entity_ids.size:
+            new_capacity = max(rows, self.entity_ids.size * 2)
+            for field, column in self.columns.items():
+                self.columns[field] = np.resize(column, new_capacity)
+            self.entity_ids = np.resize(self.entity_ids, new_capacity)
+        if slots > self.sparse.size:
+            new_size = max(slots, self.sparse.size * 2)
+            sparse = np.full(new_size, -1, dtype=np.int64)
+            sparse[: self.sparse.size] = self.sparse
+            self.sparse = sparse
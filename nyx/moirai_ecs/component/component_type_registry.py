@@ -0,0 +1,134 @@
+"""
+Component Type Registry Module
+
+This module assigns small integer IDs to component types as they are registered. The ID of a
+component type indexes its storage (`stores[type_id]`) and its bit in the per-entity component
+bitmasks (`1 << type_id`), so signature matching is a single AND instead of one hash lookup per
+component type. The string names ("position", "z-index", ...) remain an alias layer over the IDs.
+
+Classes:
+    ComponentTypeRegistry: Assigns integer IDs to component types and owns their storage.
+"""
+
+from typing import Dict, List, MutableMapping, Optional, Type
+
+from nyx.moirai_ecs.component.base_components import NyxComponent
+from nyx.moirai_ecs.component.component_store import ColumnStore
+
+
+class ComponentTypeRegistry:
+    """Assigns integer IDs to component types and owns their storage.
+
+    Attributes:
+        MAX_TYPES (int): The maximum number of component types (the bits of a `uint64` mask).
+        names (List[str]): The name of each component type, indexed by type ID.
+        classes (List[Type[NyxComponent]]): The component class of each type (None if untyped).
+        stores (List[MutableMapping]): The storage of each type, indexed by type ID: a
+            `ColumnStore` for numeric types, otherwise a `{entity_id: component}` dictionary.
+        ids (Dict[str, int]): The type ID of each component type name.
+
+    Methods:
+        register: Register a component type and create its storage.
+        type_id: Get the ID of a component type.
+        mask_of: Get the bitmask matching a set of component types.
+        names_in: Get the component type names set in a bitmask.
+    """
+
+    MAX_TYPES = 64
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.classes: List[Optional[Type[NyxComponent]]] = []
+        self.stores: List[MutableMapping] = []
+        self.ids: Dict[str, int] = {}
+
+    def register(
+        self,
+        name: str,
+        component_class: Optional[Type[NyxComponent]] = None,
+        fields: Optional[Dict[str, type]] = None,
+    ) -> int:
+        """Register a component type and create its storage.
+
+        Args:
+            name (str): The component type name (its alias in the component registry).
+            component_class (Type[NyxComponent], optional): The component class. Defaults to None.
+            fields (Dict[str, type], optional): The NumPy dtype of each numeric field; if given,
+                the type is stored in a `ColumnStore` (requires `component_class`). Defaults to
+                None (a dictionary of component objects).
+
+        Raises:
+            ValueError: If the name is already registered, the registry is full, or fields are
+                given without a component class.
+
+        Returns:
+            int: The new type ID.
+        """
+        if name in self.ids:
+            raise ValueError(f'Component type "{name}" is already registered.')
+        if len(self.names) == self.MAX_TYPES:
+            raise ValueError(f"At most {self.MAX_TYPES} component types can be registered.")
+        if fields is not None and component_class is None:
+            raise ValueError("Column-stored component types require a component class.")
+
+        type_id = len(self.names)
+        self.names.append(name)
+        self.classes.append(component_class)
+        self.stores.append({} if fields is None else ColumnStore(component_class, fields))
+        self.ids[name] = type_id
+        return type_id
+
+    def type_id(self, name: str) -> int:
+        """Get the ID of a component type.
+
+        Args:
+            name (str): The component type name.
+
+        Raises:
+            KeyError: If the component type is not registered.
+
+        Returns:
+            int: The type ID.
+        """
+        if name not in self.ids:
+            raise KeyError(f'Component="{name}" is not a registered component type.')
+        return self.ids[name]
+
+    def mask_of(self, *names: str) -> int:
+        """Get the bitmask matching a set of component types.
+
+        Args:
+            *names (str): The component type names.
+
+        Raises:
+            KeyError: If a component type is not registered.
+
+        Returns:
+            int: The OR of `1 << type_id` over the types.
+        """
+        mask = 0
+        for name in names:
+            mask |= 1 << self.type_id(name)
+        return mask
+
+    def names_in(self, mask: int) -> List[str]:
+        """Get the component type names set in a bitmask.
+
+        Args:
+            mask (int): A component bitmask.
+
+        Returns:
+            List[str]: The names, in type ID order.
+        """
+        mask = int(mask)
+        return [name for type_id, name in enumerate(self.names) if mask >> type_id & 1]
+
+    def __contains__(self, name) -> bool:
+        return name in self.ids
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self):
+        return f"<ComponentTypeRegistry: {self.names}>"
+
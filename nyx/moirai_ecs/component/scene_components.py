@@ -22,6 +22,8 @@ class SceneComponent(NyxComponent):
         friendly_name (str): A human-readable name for the scene.
     """
 
+    __slots__ = ("friendly_name",)
+
     def __init__(self, friendly_name: str):
         self.friendly_name = friendly_name
 
@@ -36,6 +38,8 @@ class BackgroundColorComponent(NyxComponent):
         ValueError: If the background color code is not an integer between 0 and 255.
     """
 
+    __slots__ = ("bg_color_code",)
+
     def __init__(self, bg_color_code: int = 0):
         if 0 <= bg_color_code <= 255:
             self.bg_color_code = bg_color_code
@@ -56,12 +60,14 @@ class TilemapComponent(NyxComponent):
         tile_dimension (int): The size of a tile in pixels.
 
     Raises:
-        ValueError: If the tilemap is not a NumPy `ndarray` of `dtype` 'uint8'.
+        ValueError: If the tilemap is not a NumPy `ndarray` of `dtype` 'uint8' or 'uint16'.
     """
 
+    __slots__ = ("tilemap", "tile_dimension")
+
     def __init__(self, tilemap: np.ndarray, tile_dimension: int = 16):
-        if not isinstance(tilemap, np.ndarray) or tilemap.dtype != np.uint8:
-            raise ValueError("Tilemap must be a NumPy `ndarray` of `dtype` 'uint8'")
+        if not isinstance(tilemap, np.ndarray) or tilemap.dtype not in (np.uint8, np.uint16):
+            raise ValueError("Tilemap must be a NumPy `ndarray` of `dtype` 'uint8' or 'uint16'")
 
         self.tilemap = tilemap
         self.tile_dimension = tile_dimension
@@ -1,11 +1,31 @@
+from typing import Optional
+
 import numpy as np
+from nyx.aether_renderer.texture_atlas import AtlasRegion
 from nyx.moirai_ecs.component.base_components import NyxComponent
 
 
 class TextureComponent(NyxComponent):
-    """Define a texture for an entity"""
+    """Define a texture for an entity, either as its own array or as a region of a texture atlas.
+
+    Attributes:
+        texture (np.ndarray): The texture array (a view into the atlas page for atlas regions).
+        region (AtlasRegion): The atlas region referenced by the component, or None.
+
+    Raises:
+        ValueError: If neither a texture nor a region is given, or if the texture is not 'uint8'.
+    """
+
+    __slots__ = ("texture", "region")
 
-    def __init__(self, texture: np.ndarray):
+    def __init__(
+        self, texture: Optional[np.ndarray] = None, region: Optional[AtlasRegion] = None
+    ):
+        if region is not None:
+            texture = region.texture
+        if texture is None:
+            raise ValueError("A texture array or an atlas region is required.")
         if texture.dtype != np.uint8:
             raise ValueError("NumPy array must be of type 'uint8'.")
         self.texture = texture
+        self.region = region
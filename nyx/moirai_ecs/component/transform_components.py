@@ -9,6 +9,7 @@ Classes:
     DimensionsComponent: Create height, width bounds for an entity.
     PositionComponent: Position of the the (0,0) origin of the entity within the frame.
     VelocityComponent: Define the current speed of the component in pixels per refresh.
+    CameraComponent: Position of the viewport's (0,0) origin within the world.
 """
 
 from nyx.moirai_ecs.component.base_components import NyxComponent
@@ -21,6 +22,8 @@ class ZIndexComponent(NyxComponent):
         z_index (int): The layer priority of the entity.
     """
 
+    __slots__ = ("z_index",)
+
     def __init__(self, z_index: int):
         self.z_index: int = z_index
 
@@ -33,6 +36,8 @@ class DimensionsComponent(NyxComponent):
         width (int): The width of the entity.
     """
 
+    __slots__ = ("height", "width")
+
     def __init__(self, height: int, width: int):
         self.height = height
         self.width = width
@@ -48,6 +53,8 @@ class PositionComponent(NyxComponent):
         render_y_pos (int): The y-coordinate of the entity to render
     """
 
+    __slots__ = ("x_pos", "render_x_pos", "y_pos", "render_y_pos")
+
     def __init__(self, x_pos: float = 0, y_pos: float = 0):
         self.x_pos: float = x_pos
         self.render_x_pos: int = x_pos
@@ -64,6 +71,8 @@ class PositionComponent(NyxComponent):
 class VelocityComponent(NyxComponent):
     """Define the current speed of the component in pixels per refresh."""
 
+    __slots__ = ("x_vel", "y_vel")
+
     def __init__(self, x_vel: int = 0, y_vel: int = 0):
         self.x_vel = x_vel
         self.y_vel = y_vel
@@ -73,3 +82,22 @@ class VelocityComponent(NyxComponent):
 
     def __repr__(self):
         return f"<VelocityComponent: x_vel={self.x_vel}, y_vel={self.y_vel}>"
+
+
+class CameraComponent(NyxComponent):
+    """Position of the viewport's (0,0) origin within the world. Entity positions are world
+    coordinates; the renderer draws them at `position - camera`.
+
+    Attributes:
+        x_pos (int): The world x-coordinate of the viewport's left edge.
+        y_pos (int): The world y-coordinate of the viewport's top edge.
+    """
+
+    __slots__ = ("x_pos", "y_pos")
+
+    def __init__(self, x_pos: int = 0, y_pos: int = 0):
+        self.x_pos: int = x_pos
+        self.y_pos: int = y_pos
+
+    def __repr__(self):
+        return f"<CameraComponent: x_pos={self.x_pos}, y_pos={self.y_pos}>"
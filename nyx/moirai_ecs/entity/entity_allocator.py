@@ -0,0 +1,253 @@
+"""
+Entity Allocator Module
+
+This module hands out generational entity IDs. An entity ID packs a slot index (low bits) and the
+generation of that slot (high bits) into one int. Destroyed slots are recycled through a free list
+with their generation bumped, so:
+
+- The slot indices stay dense and bounded by the peak number of live entities, which keeps the
+  array-backed component stores small no matter how many entities have ever existed.
+- A stale ID held after its entity was destroyed no longer matches the slot's generation, so it is
+  never mistaken for the new entity reusing the slot.
+
+Classes:
+    EntityId: A collection of static methods that pack and unpack generational entity IDs.
+    EntityAllocator: Allocates and recycles generational entity IDs.
+"""
+
+from collections import deque
+from typing import Deque
+
+import numpy as np
+
+
+class EntityId:
+    """A collection of static methods that pack and unpack generational entity IDs.
+
+    Attributes:
+        INDEX_BITS (int): The bits holding the slot index (up to ~1M live entities).
+        GENERATION_BITS (int): The bits holding the slot generation (wraps around).
+        INDEX_MASK (int): The mask extracting the slot index.
+        GENERATION_MASK (int): The mask extracting the (shifted down) generation.
+
+    Methods:
+        pack(): Combine a slot index and generation into an entity ID.
+        index(): Get the slot index of an entity ID.
+        generation(): Get the generation of an entity ID.
+    """
+
+    INDEX_BITS = 20
+    GENERATION_BITS = 11
+    INDEX_MASK = (1 << INDEX_BITS) - 1
+    GENERATION_MASK = (1 << GENERATION_BITS) - 1
+
+    @staticmethod
+    def pack(index: int, generation: int) -> int:
+        """Combine a slot index and generation into an entity ID.
+
+        Args:
+            index (int): The slot index.
+            generation (int): The slot generation.
+
+        Returns:
+            int: The entity ID (a non-negative 31-bit int).
+        """
+        return ((generation & EntityId.GENERATION_MASK) << EntityId.INDEX_BITS) | index
+
+    @staticmethod
+    def index(entity_id: int) -> int:
+        """Get the slot index of an entity ID (also works element-wise on int arrays)."""
+        return entity_id & EntityId.INDEX_MASK
+
+    @staticmethod
+    def generation(entity_id: int) -> int:
+        """Get the generation of an entity ID (also works element-wise on int arrays)."""
+        return (entity_id >> EntityId.INDEX_BITS) & EntityId.GENERATION_MASK
+
+
+class EntityAllocator:
+    """Allocates and recycles generational entity IDs.
+
+    Freed slots are reused first-in-first-out, so a slot is reused as late as possible and its
+    generation wraps around as rarely as possible.
+
+    Attributes:
+        generations (np.ndarray): The current generation of each slot.
+        alive (np.ndarray): If each slot currently holds a live entity.
+        slot_count (int): The number of slots ever used (the dense index range).
+        alive_count (int): The number of live entities.
+        free_slots (Deque[int]): The recycled slot indices, oldest first.
+
+    Methods:
+        allocate: Allocate a new entity ID.
+        allocate_many: Allocate several new entity IDs at once.
+        release: Free an entity ID's slot for reuse.
+        release_many: Free the slots of several entity IDs at once.
+        reissue_many: Replace live entity IDs with new IDs for the same slots.
+        is_alive: Check if an entity ID refers to a live entity.
+        alive_mask: Check which of several entity IDs refer to live entities.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """Initialize an empty allocator.
+
+        Args:
+            capacity (int, optional): The initial number of slots. Defaults to 1024.
+        """
+        self.generations = np.zeros(capacity, dtype=np.int64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.slot_count = 0
+        self.alive_count = 0
+        self.free_slots: Deque[int] = deque()
+
+    def allocate(self) -> int:
+        """Allocate a new entity ID, reusing a freed slot if one is available.
+
+        Raises:
+            ValueError: If every slot index is in use.
+
+        Returns:
+            int: The new entity ID.
+        """
+        if self.free_slots:
+            index = self.free_slots.popleft()
+        else:
+            index = self.slot_count
+            if index > EntityId.INDEX_MASK:
+                raise ValueError("Every entity slot index is in use.")
+            if index == self.generations.size:
+                self._grow()
+            self.slot_count += 1
+        self.alive[index] = True
+        self.alive_count += 1
+        return EntityId.pack(index, int(self.generations[index]))
+
+    def allocate_many(self, count: int) -> np.ndarray:
+        """Allocate several new entity IDs at once, reusing freed slots first.
+
+        Args:
+            count (int): The number of IDs to allocate.
+
+        Raises:
+            ValueError: If there are not enough slot indices left.
+
+        Returns:
+            np.ndarray: The new entity IDs (int64).
+        """
+        reused = min(count, len(self.free_slots))
+        fresh = count - reused
+        if self.slot_count + fresh > EntityId.INDEX_MASK + 1:
+            raise ValueError("Every entity slot index is in use.")
+        indices = np.empty(count, dtype=np.int64)
+        indices[:reused] = [self.free_slots.popleft() for _ in range(reused)]
+        indices[reused:] = np.arange(self.slot_count, self.slot_count + fresh)
+        while self.slot_count + fresh > self.generations.size:
+            self._grow()
+        self.slot_count += fresh
+
+        self.alive[indices] = True
+        self.alive_count += count
+        return (self.generations[indices] << EntityId.INDEX_BITS) | indices
+
+    def release(self, entity_id: int) -> bool:
+        """Free an entity ID's slot for reuse and bump the slot's generation.
+
+        Args:
+            entity_id (int): The entity ID to release.
+
+        Returns:
+            bool: If the ID was alive (stale or unknown IDs are ignored).
+        """
+        if not self.is_alive(entity_id):
+            return False
+        index = EntityId.index(entity_id)
+        self.alive[index] = False
+        self.generations[index] = (self.generations[index] + 1) & EntityId.GENERATION_MASK
+        self.free_slots.append(index)
+        self.alive_count -= 1
+        return True
+
+    def release_many(self, entity_ids: np.ndarray) -> np.ndarray:
+        """Free the slots of several entity IDs at once (stale, unknown and repeated IDs are
+        ignored).
+
+        Args:
+            entity_ids (np.ndarray): The entity IDs to release.
+
+        Returns:
+            np.ndarray: The IDs that were alive and have been released.
+        """
+        entity_ids = np.unique(np.asarray(entity_ids, dtype=np.int64))
+        released = entity_ids[self.alive_mask(entity_ids)]
+        indices = EntityId.index(released)
+        self.alive[indices] = False
+        self.generations[indices] = (self.generations[indices] + 1) & EntityId.GENERATION_MASK
+        self.free_slots.extend(indices.tolist())
+        self.alive_count -= released.size
+        return released
+
+    def reissue_many(self, entity_ids: np.ndarray) -> np.ndarray:
+        """Replace live entity IDs with new IDs for the same slots (bumped generations), without
+        freeing the slots. The old IDs become stale, as if the entities had been destroyed and
+        their slots immediately reused.
+
+        Args:
+            entity_ids (np.ndarray): Live, distinct entity IDs.
+
+        Raises:
+            KeyError: If an entity ID is not alive.
+
+        Returns:
+            np.ndarray: The new entity ID of each slot, aligned with `entity_ids`.
+        """
+        entity_ids = np.asarray(entity_ids, dtype=np.int64)
+        alive = self.alive_mask(entity_ids)
+        if not alive.all():
+            raise KeyError(f"Entity IDs are not alive: {entity_ids[~alive].tolist()}")
+        indices = EntityId.index(entity_ids)
+        self.generations[indices] = (self.generations[indices] + 1) & EntityId.GENERATION_MASK
+        return (self.generations[indices] << EntityId.INDEX_BITS) | indices
+
+    def is_alive(self, entity_id: int) -> bool:
+        """Check if an entity ID refers to a live entity (same slot generation).
+
+        Args:
+            entity_id (int): The entity ID to check.
+
+        Returns:
+            bool: If the entity is alive.
+        """
+        if entity_id < 0:
+            return False
+        index = EntityId.index(entity_id)
+        return (
+            index < self.slot_count
+            and bool(self.alive[index])
+            and int(self.generations[index]) == EntityId.generation(entity_id)
+        )
+
+    def alive_mask(self, entity_ids: np.ndarray) -> np.ndarray:
+        """Check which of several entity IDs refer to live entities.
+
+        Args:
+            entity_ids (np.ndarray): The entity IDs to check.
+
+        Returns:
+            np.ndarray: A boolean mask aligned with `entity_ids`.
+        """
+        entity_ids = np.asarray(entity_ids, dtype=np.int64)
+        indices = EntityId.index(entity_ids)
+        mask = (entity_ids >= 0) & (indices < self.slot_count)
+        mask[mask] = self.alive[indices[mask]] & (
+            self.generations[indices[mask]] == EntityId.generation(entity_ids[mask])
+        )
+        return mask
+
+    def _grow(self):
+        """Double the number of slots."""
+        new_capacity = self.generations.size * 2
+        self.generations = np.resize(self.generations, new_capacity)
+        self.generations[self.slot_count :] = 0
+        alive = np.zeros(new_capacity, dtype=bool)
+        alive[: self.slot_count] = self.alive[: self.slot_count]
+        self.alive = alive
@@ -0,0 +1,258 @@
+"""
+Entity Pool Module
+
+This module recycles short-lived entities (projectiles, particles, pickups) built from a prefab. A
+pool owns a set of entities and a private copy of the prefab's object components for each of them.
+Releasing an entity detaches its components and resets its copies to the prefab state instead of
+destroying it, and acquiring it again re-attaches them, so spawning at a high rate does not churn
+entity slots, component storage or component objects. A released entity's ID is reissued with a
+bumped generation, so stale handles to it (held by systems or queued commands) never alias the
+entity it becomes next.
+
+Destroying a pooled entity through the entity manager (e.g. when it is culled off-screen) releases
+it back to its pool; `destroy_many(..., release_pooled=False)` removes it from the pool and
+destroys it for real.
+
+Classes:
+    EntityPool: A pool of recyclable entities built from one prefab.
+"""
+
+import copy
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
+
+import numpy as np
+
+from nyx.moirai_ecs.component.base_components import NyxComponent
+from nyx.moirai_ecs.component.component_store import ColumnStore
+
+if TYPE_CHECKING:
+    from nyx.moirai_ecs.entity.moirai_entity_manager import MoiraiEntityManager
+
+
+def _copy_state(source: NyxComponent, target: NyxComponent):
+    """Copy every attribute (instance dict and slots) of a component onto another."""
+    if hasattr(source, "__dict__"):
+        target.__dict__.update(source.__dict__)
+    for cls in type(source).__mro__:
+        for slot in getattr(cls, "__slots__", ()):
+            if slot != "__dict__" and hasattr(source, slot):
+                setattr(target, slot, getattr(source, slot))
+
+
+class EntityPool:
+    """A pool of recyclable entities built from one prefab.
+
+    Column-stored components (position, velocity, ...) are written straight from the prefab on
+    acquire; every other prefab component is copied once per pooled entity, so entities never share
+    mutable component objects.
+
+    Attributes:
+        entity_manager (MoiraiEntityManager): The entity manager owning the pooled entities.
+        prefab (Dict[str, NyxComponent]): The component of each component type, by name.
+        friendly_name (str): The friendly name of the pooled entities.
+        max_size (int): The maximum number of pooled entities, or None for no limit.
+        capacity (int): The number of entities owned by the pool.
+        in_use (int): The number of entities currently acquired.
+        high_water_mark (int): The largest `in_use` seen so far.
+
+    Methods:
+        acquire: Hand out pre-initialized entities, growing the pool if needed.
+        release: Return entities to the pool and reset their component state.
+        discard: Remove entities from the pool, so they can be destroyed.
+        owns: Check which of several entities belong to the pool.
+    """
+
+    def __init__(
+        self,
+        entity_manager: "MoiraiEntityManager",
+        prefab: Dict[str, NyxComponent],
+        capacity: int = 32,
+        friendly_name: str = "",
+        max_size: Optional[int] = None,
+    ):
+        """Create the pool and pre-allocate its entities.
+
+        Args:
+            entity_manager (MoiraiEntityManager): The entity manager owning the pooled entities.
+            prefab (Dict[str, NyxComponent]): The component of each component type, by name.
+            capacity (int, optional): The number of entities to pre-allocate. Defaults to 32.
+            friendly_name (str, optional): The friendly name of the pooled entities. Defaults to
+                "".
+            max_size (int, optional): The maximum number of pooled entities. Defaults to None (the
+                pool grows as needed).
+
+        Raises:
+            ValueError: If the capacity exceeds the maximum size.
+        """
+        if max_size is not None and capacity > max_size:
+            raise ValueError("The initial pool capacity cannot exceed its maximum size.")
+        self.entity_manager = entity_manager
+        self.prefab = prefab
+        self.friendly_name = friendly_name
+        self.max_size = max_size
+        self.high_water_mark = 0
+
+        registry = entity_manager.component_manager.component_registry
+        self._column_components = {
+            name: component
+            for name, component in prefab.items()
+            if isinstance(registry[name], ColumnStore)
+        }
+        self._object_components = {
+            name: component
+            for name, component in prefab.items()
+            if name not in self._column_components
+        }
+        self._entity_ids = np.empty(0, dtype=np.int64)
+        self._rows: Dict[int, int] = {}
+        self._instances: Dict[int, Dict[str, NyxComponent]] = {}
+        self._free: List[int] = []
+        self._in_use: Set[int] = set()
+        self._grow(capacity)
+        entity_manager.pools.append(self)
+
+    @property
+    def capacity(self) -> int:
+        """The number of entities owned by the pool."""
+        return self._entity_ids.size
+
+    @property
+    def in_use(self) -> int:
+        """The number of entities currently acquired."""
+        return len(self._in_use)
+
+    def acquire(
+        self, count: int = 1, overrides: Optional[Dict[str, Dict[str, object]]] = None
+    ) -> np.ndarray:
+        """Hand out pre-initialized entities, growing the pool if needed.
+
+        Args:
+            count (int, optional): The number of entities to acquire. Defaults to 1.
+            overrides (Dict[str, Dict[str, object]], optional): Per component type, field values
+                replacing the prefab's, each a scalar or an array with one value per entity.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the pool would grow past its maximum size.
+
+        Returns:
+            np.ndarray: The acquired entity IDs.
+        """
+        if count <= 0:
+            return np.empty(0, dtype=np.int64)
+        overrides = overrides or {}
+        missing = count - len(self._free)
+        if missing > 0:
+            if self.max_size is not None and self.capacity + missing > self.max_size:
+                raise ValueError(
+                    f"Entity pool exhausted ({self.in_use} of at most {self.max_size} in use)."
+                )
+            growth = max(missing, self.capacity)
+            if self.max_size is not None:
+                growth = min(growth, self.max_size - self.capacity)
+            self._grow(growth)
+        entity_ids = np.array(self._free[-count:][::-1], dtype=np.int64)
+        del self._free[-count:]
+        self._in_use.update(entity_ids.tolist())
+        self.high_water_mark = max(self.high_water_mark, self.in_use)
+
+        component_manager = self.entity_manager.component_manager
+        for name, component in self._column_components.items():
+            component_manager.add_components(entity_ids, name, component, overrides.get(name))
+        for name in self._object_components:
+            fields = {
+                field: np.broadcast_to(np.asarray(values, dtype=object), entity_ids.shape)
+                for field, values in overrides.get(name, {}).items()
+            }
+            for i, entity_id in enumerate(entity_ids.tolist()):
+                instance = self._instances[entity_id][name]
+                for field, values in fields.items():
+                    setattr(instance, field, values[i])
+                component_manager.add_component(entity_id, name, instance)
+        return entity_ids
+
+    def release(self, entity_ids) -> np.ndarray:
+        """Return entities to the pool: detach all their components, reset the pooled
+        component copies to the prefab state, and reissue their IDs (so the released IDs become
+        stale). Entities not in use are ignored.
+
+        Args:
+            entity_ids (int | np.ndarray): The entity ID(s) to release.
+
+        Returns:
+            np.ndarray: The entity IDs that were in use and have been released (now stale).
+        """
+        entity_ids = np.atleast_1d(np.asarray(entity_ids, dtype=np.int64))
+        released = [eid for eid in dict.fromkeys(entity_ids.tolist()) if eid in self._in_use]
+        if not released:
+            return np.empty(0, dtype=np.int64)
+        released_ids = np.array(released, dtype=np.int64)
+        self.entity_manager.component_manager.remove_entities(released_ids)
+        new_ids = self.entity_manager._reissue(released_ids).tolist()
+        for entity_id, new_id in zip(released, new_ids):
+            instances = self._instances.pop(entity_id)
+            for name, component in self._object_components.items():
+                _copy_state(component, instances[name])
+            self._instances[new_id] = instances
+            row = self._rows.pop(entity_id)
+            self._rows[new_id] = row
+            self._entity_ids[row] = new_id
+        self._in_use.difference_update(released)
+        self._free.extend(reversed(new_ids))
+        return released_ids
+
+    def discard(self, entity_ids) -> np.ndarray:
+        """Remove entities from the pool (acquired or not) without touching their components, so
+        the entity manager can destroy them. Entities not owned by the pool are ignored.
+
+        Args:
+            entity_ids (int | np.ndarray): The entity ID(s) to remove.
+
+        Returns:
+            np.ndarray: The entity IDs that were owned by the pool and have been removed.
+        """
+        entity_ids = np.atleast_1d(np.asarray(entity_ids, dtype=np.int64))
+        discarded = [eid for eid in dict.fromkeys(entity_ids.tolist()) if eid in self._rows]
+        if not discarded:
+            return np.empty(0, dtype=np.int64)
+        discarded_set = set(discarded)
+        for entity_id in discarded:
+            del self._instances[entity_id]
+        self._in_use.difference_update(discarded)
+        self._free = [eid for eid in self._free if eid not in discarded_set]
+        self._entity_ids = self._entity_ids[~np.isin(self._entity_ids, discarded)]
+        self._rows = dict(zip(self._entity_ids.tolist(), range(self._entity_ids.size)))
+        return np.array(discarded, dtype=np.int64)
+
+    def owns(self, entity_ids: np.ndarray) -> np.ndarray:
+        """Check which of several entities belong to the pool (acquired or not).
+
+        Args:
+            entity_ids (np.ndarray): The entity IDs to check.
+
+        Returns:
+            np.ndarray: A boolean mask aligned with `entity_ids`.
+        """
+        return np.isin(entity_ids, self._entity_ids)
+
+    def _grow(self, count: int):
+        """Create `count` component-less entities and their private component copies."""
+        if count <= 0:
+            return
+        new_ids = self.entity_manager.spawn_many({}, count, friendly_name=self.friendly_name)
+        self._rows.update(
+            zip(new_ids.tolist(), range(self._entity_ids.size, self._entity_ids.size + count))
+        )
+        self._entity_ids = np.concatenate([self._entity_ids, new_ids])
+        for entity_id in new_ids.tolist():
+            self._instances[entity_id] = {
+                name: copy.copy(component) for name, component in self._object_components.items()
+            }
+        # Hand out the oldest entities first
+        self._free[:0] = new_ids[::-1].tolist()
+
+    def __repr__(self):
+        return (
+            f"<EntityPool: {self.friendly_name or 'unnamed'}, {self.in_use}/{self.capacity} in use,"
+            f" high water mark {self.high_water_mark}>"
+        )
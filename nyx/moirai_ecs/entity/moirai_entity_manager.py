@@ -2,7 +2,9 @@
 Moirai Entity Manager Module
 
 This module orcehstrates the creation and destruction of entities in the ECS architecture, keeping a
-registry of current, alive entities and their unique entity IDs.
+registry of current, alive entities and their unique entity IDs. Entity IDs are generational: the
+slot of a destroyed entity is recycled for new entities with a bumped generation, so stale IDs are
+never mistaken for live ones.
 
 Classes:
     MorosEntityManager: Performs CRUD operations of game entities within its held entity registry.
@@ -14,10 +16,16 @@ Mythology:
     the path that life will follow; and Atropos cuts the thread, ending that life's journey.
 """
 
-from typing import Dict, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+import numpy as np
+
+from nyx.moirai_ecs.entity.entity_allocator import EntityAllocator
 from nyx.moirai_ecs.entity.nyx_entity import NyxEntity
 
 if TYPE_CHECKING:
+    from nyx.moirai_ecs.component.base_components import NyxComponent
+    from nyx.moirai_ecs.entity.entity_pool import EntityPool
     from nyx.nyx_engine.nyx_engine import NyxEngine
 
 
@@ -26,27 +34,31 @@ class MoiraiEntityManager:
 
     Attributes:
         entity_registry (Dict[int, NyxEntity]) = The registry of entities keyed by their entity ID.
+        allocator (EntityAllocator): Allocates and recycles the generational entity IDs.
+        pools (List[EntityPool]): The entity pools created on this manager; destroying a pooled
+            entity releases it back to its pool instead, unless `release_pooled=False`.
 
     Methods:
         create_entity: Create and register a new entity to the entity registry.
         destroy_entity: Remove a registered entity from the entity registry.
+        spawn_many: Create several entities sharing a component template in one call.
+        destroy_many: Remove several registered entities in one call.
         is_alive: Check if an entity is still active in the registry.
         get_entity: Fetch an entity from the registry by its entity ID.
         get_all_entities: Fet the entire entity registry list.
     """
 
-    entity_registry: Dict[int, NyxEntity] = {}
-
-    @classmethod
-    def reset_entity_registry(cls):
+    def reset_entity_registry(self):
         """Clear the entity registry of all entities."""
-        cls.entity_registry.clear()
+        self.entity_registry.clear()
 
     def __init__(self, engine: "NyxEngine"):
         self.engine = engine
         self.component_manager = self.engine.component_manager
         self.component_registry = self.engine.component_registry
         self.entity_registry: Dict[int, NyxEntity] = {}
+        self.allocator = EntityAllocator()
+        self.pools: List["EntityPool"] = []
 
     def create_entity(self, friendly_name: str = "") -> NyxEntity:
         """Create a NyxEntity and add it to the entity registry.
@@ -58,23 +70,99 @@ class MoiraiEntityManager:
             NyxEntity: the newly created entity.
         """
 
-        new_entity = NyxEntity(friendly_name=friendly_name.strip())
+        new_entity = NyxEntity(
+            friendly_name=friendly_name.strip(), entity_id=self.allocator.allocate()
+        )
         self.entity_registry[new_entity.entity_id] = new_entity
         return new_entity
 
-    def destroy_entity(self, entity_id: int):
-        """Remove a registered entity from the entity registry, and clear its components.
+    def destroy_entity(self, entity_id: int, release_pooled: bool = True):
+        """Remove a registered entity from the entity registry, clear its components, and recycle its
+        ID slot. Stale IDs of already destroyed entities are ignored, and pooled entities are
+        released back to their entity pool.
 
         Args:
             entity_id (int): The entity ID to remove.
+            release_pooled (bool, optional): If a pooled entity is released back to its pool;
+                otherwise it is removed from its pool and destroyed. Defaults to True.
         """
+        entity_ids = np.array([entity_id], dtype=np.int64)
+        if release_pooled:
+            if self._release_to_pools(entity_ids).size:
+                return self
+        else:
+            self._discard_from_pools(entity_ids)
         if entity_id in self.entity_registry:
             del self.entity_registry[entity_id]
             self.component_manager.remove_entity(entity_id=entity_id)
+        self.allocator.release(entity_id)
         return self
 
+    def spawn_many(
+        self,
+        template: Dict[str, "NyxComponent"],
+        count: int,
+        overrides: Optional[Dict[str, Dict[str, object]]] = None,
+        friendly_name: str = "",
+    ) -> np.ndarray:
+        """Create several entities sharing a component template in one call.
+
+        Args:
+            template (Dict[str, NyxComponent]): The component of each component type, by name.
+            count (int): The number of entities to create.
+            overrides (Dict[str, Dict[str, object]], optional): Per component type, field values
+                replacing the template's, each a scalar or an array with one value per entity,
+                e.g. `{"position": {"y_pos": ys, "render_y_pos": ys}}`. Defaults to None.
+            friendly_name (str): The friendly name of every new entity. Defaults to "".
+
+        Returns:
+            np.ndarray: The entity IDs of the new entities.
+        """
+        overrides = overrides or {}
+        entity_ids = self.allocator.allocate_many(count)
+        friendly_name = friendly_name.strip()
+        id_list = entity_ids.tolist()
+        self.entity_registry.update(
+            zip(id_list, [NyxEntity(friendly_name, entity_id=entity_id) for entity_id in id_list])
+        )
+        for component_name, component in template.items():
+            self.component_manager.add_components(
+                entity_ids, component_name, component, overrides.get(component_name)
+            )
+        return entity_ids
+
+    def destroy_many(self, entity_ids: np.ndarray, release_pooled: bool = True) -> np.ndarray:
+        """Remove several registered entities, clear their components, and recycle their ID slots
+        in one call. Stale and unknown IDs are ignored, and pooled entities are released back to
+        their entity pool.
+
+        Args:
+            entity_ids (np.ndarray): The entity IDs to remove.
+            release_pooled (bool, optional): If pooled entities are released back to their pool;
+                otherwise they are removed from their pool and destroyed. Defaults to True.
+
+        Returns:
+            np.ndarray: The entity IDs that were alive and have been removed (or released back to
+                their entity pool).
+        """
+        entity_ids = np.asarray(entity_ids, dtype=np.int64)
+        alive = np.unique(entity_ids[self.allocator.alive_mask(entity_ids)])
+        if release_pooled:
+            pooled = self._release_to_pools(alive)
+        else:
+            self._discard_from_pools(alive)
+            pooled = np.empty(0, dtype=np.int64)
+        if pooled.size:
+            alive = alive[~np.isin(alive, pooled)]
+        for entity_id in alive.tolist():
+            self.entity_registry.pop(entity_id, None)
+        self.component_manager.remove_entities(alive)
+        self.allocator.release_many(alive)
+        return np.concatenate([alive, pooled]) if pooled.size else alive
+
     def is_alive(self, entity_id: int) -> bool:
-        """Check if a NyxEntity is still active in this entity manager.
+        """Check if a NyxEntity is still active in this entity manager. IDs of destroyed entities
+        stay dead even after their slot is reused.
 
         Args:
             entity_id (int): The entity ID to check for alive status.
@@ -82,7 +170,7 @@ class MoiraiEntityManager:
         Returns:
             bool: If the entity is alive.
         """
-        return entity_id in self.entity_registry
+        return self.allocator.is_alive(entity_id) and entity_id in self.entity_registry
 
     def get_entity(self, entity_id: int) -> NyxEntity:
         """Get an entity from the entity list
@@ -103,3 +191,42 @@ class MoiraiEntityManager:
             Dict[int, NyxEntity]: The registry of NyxEntity objects.
         """
         return self.entity_registry
+
+    def _release_to_pools(self, entity_ids: np.ndarray) -> np.ndarray:
+        """Release the pooled entities among `entity_ids` back to their pools.
+
+        Returns:
+            np.ndarray: Every pooled entity ID among `entity_ids` (released or already free).
+        """
+        if not self.pools:
+            return np.empty(0, dtype=np.int64)
+        pooled = []
+        for pool in self.pools:
+            owned = entity_ids[pool.owns(entity_ids)]
+            if owned.size:
+                pool.release(owned)
+                pooled.append(owned)
+        return np.concatenate(pooled) if pooled else np.empty(0, dtype=np.int64)
+
+    def _discard_from_pools(self, entity_ids: np.ndarray):
+        """Remove the pooled entities among `entity_ids` from their pools (without releasing
+        them), so they can be destroyed."""
+        for pool in self.pools:
+            pool.discard(entity_ids)
+
+    def _reissue(self, entity_ids: np.ndarray) -> np.ndarray:
+        """Give live entities new IDs for the same slots, so their old IDs become stale.
+
+        Args:
+            entity_ids (np.ndarray): Live, distinct entity IDs without components.
+
+        Returns:
+            np.ndarray: The new entity IDs, aligned with `entity_ids`.
+        """
+        new_ids = self.allocator.reissue_many(entity_ids)
+        registry = self.entity_registry
+        for old_id, new_id in zip(entity_ids.tolist(), new_ids.tolist()):
+            entity = registry.pop(old_id, None)
+            friendly_name = entity.friendly_name if entity is not None else ""
+            registry[new_id] = NyxEntity(friendly_name, entity_id=new_id)
+        return new_ids
@@ -1,32 +1,32 @@
 """
 NyxEntity Module
 
-This module defines the entity class within the ECS architecture. An entity holds a globally unique
-reference ID (int) which is then linked to different components or assets within the game engine.
+This module defines the entity class within the ECS architecture. An entity holds a unique
+generational reference ID (int) which is then linked to different components or assets within the
+game engine. IDs are allocated by the owning `MoiraiEntityManager` (see `create_entity`).
 """
 
 
 class NyxEntity:
-    """Define the game entity object, which holds a globally unique reference ID (int). This ID is
-    then linked to different components or assets within the game engine.
+    """Define the game entity object, which holds a unique generational reference ID (int). This ID
+    is then linked to different components or assets within the game engine.
 
     Attributes:
-        entity_id (int): The globally unique ID of this entity.
+        entity_id (int): The unique generational ID of this entity (see `EntityAllocator`).
         friendly_name (str, optional): The friendly name of this entity. Defaults to "".
     """
 
-    _next_entity_id = 0
+    __slots__ = ("_entity_id", "friendly_name")
 
-    def __init__(self, friendly_name: str = ""):
-        """Initialize NyxEntity with an immutable globally unique entity id and optional friendly
-        name.
+    def __init__(self, friendly_name: str = "", *, entity_id: int):
+        """Initialize NyxEntity with an immutable entity id and optional friendly name.
 
         Args:
             friendly_name (str, optional): The human-readable friendly name for the entity. Defaults
                 to "".
+            entity_id (int): The ID allocated by the owning entity manager's `EntityAllocator`.
         """
-        self._entity_id: int = NyxEntity._next_entity_id
-        NyxEntity._next_entity_id += 1
+        self._entity_id: int = entity_id
         self.friendly_name: str = friendly_name.strip() if friendly_name else ""
 
     @property
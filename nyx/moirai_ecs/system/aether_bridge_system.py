@@ -4,6 +4,11 @@ Aether ECS-Renderer Bridge Module
 This module collects and z-indexes the entities and components that are renderable, before handing
 them off to AetherRenderer for granular processing and frame generation.
 
+Within a layer, sprites are drawn in entity creation order. Consecutive sprites that share the same
+texture array (such as a volley of entities referencing the same atlas region) are grouped into a
+single batch, `(xs, ys, texture)` with `xs`/`ys` as integer arrays, so AetherRenderer can composite
+all of them with one vectorized blit without changing which sprite ends up on top.
+
 Classes:
     AetherBridgeSystem: The system responsible for collecting all renderable components and passing
         them to Aether for composition.
@@ -21,7 +26,9 @@ class AetherBridgeSystem(BaseSystem):
 
     Attributes:
         renderable_entities (Dict[int, List[Tuple[int, int, np.ndarray]]]): The renderable entities
-            to be passed to AetherRenderer.
+            to be passed to AetherRenderer. Each entry is either a single sprite `(x, y, texture)`
+            or a batch of consecutive sprites sharing a texture `(xs, ys, texture)` with `xs`/`ys`
+            as arrays, in draw order.
     """
 
     def __init__(self):
@@ -31,55 +38,92 @@ class AetherBridgeSystem(BaseSystem):
 
     def update(self):
         """Gather all renderable entities and components, then pass them to AetherRenderer."""
-        component_registry = self.engine.component_registry
+        engine = self.engine
+        component_registry = engine.component_registry
         renderable_entities = {}
-        # scene_entities = {}
-
-        # First filter by entities that have a z-index component
-        for entity_id, z_index_comp in component_registry["z-index"].items():
-            z_index = z_index_comp.z_index
-
-            # Sprite-related components
-            if (
-                entity_id in component_registry["position"]
-                and entity_id in component_registry["texture"]
-            ):
-                # Prepare the renderable entity for AetherRenderer by providing its position and
-                # texture to AetherRenderer as a tuple.
-                texture = component_registry["texture"][entity_id].texture
-                x = component_registry["position"][entity_id].render_x_pos
-                y = component_registry["position"][entity_id].render_y_pos
-                renderable_entity = (x, y, texture)
-                self._validate_z_index(
-                    z_index=z_index, renderable_entities=renderable_entities
-                )
-            renderable_entities[z_index].append(renderable_entity)
-
-            # TODO: Add support for scene-level components for level loading?
-            # Scene-level components
-            # elif entity_id in component_registry["scene"]:
-            #     # Directly apply the scene background color to the AetherRenderer:
-            #     if entity_id in component_registry["background-color"]:
-            #         background_color = component_registry["background-color"][
-            #             entity_id
-            #         ].color
-            #         NyxEngine.aether_renderer.set_background_color(background_color)
-            #     # Pass the scene tilemap to the AetherRenderer:
-            #     if entity_id in component_registry["tilemap"]:
-            #         tilemap = component_registry["tilemap"][entity_id].tilemap
-            #         tile_dimension = component_registry["tilemap"][
-            #             entity_id
-            #         ].tile_dimension
-            #         z_index = component_registry["z-index"][entity_id].z_index
-            #         renderable_entity = (tilemap, tile_dimension)
+        # Runs of consecutive sprites sharing a texture array, per z-index in draw order:
+        # {z_index: [([x, ...], [y, ...], texture), ...]}
+        layer_batches: Dict[int, List[Tuple[List[int], List[int], np.ndarray]]] = {}
+
+        # Only entities holding every sprite component are visited (the cached query is maintained
+        # by the component manager), in creation order: entity IDs are recycled, so their numeric
+        # order is not the order to draw overlapping sprites in.
+        entity_ids = engine.query("z-index", "position", "texture").entity_ids
+
+        # With an active camera, positions are world coordinates: only visit the entities that
+        # intersect the viewport, and draw them relative to the camera.
+        camera_system = engine.camera_system
+        if camera_system.is_active:
+            offset_x = int(camera_system.camera.x_pos)
+            offset_y = int(camera_system.camera.y_pos)
+            visible = np.fromiter(
+                camera_system.visible_entities,
+                dtype=np.int64,
+                count=len(camera_system.visible_entities),
+            )
+            entity_ids = np.intersect1d(entity_ids, visible, assume_unique=True)
+        else:
+            offset_x, offset_y = 0, 0
+        entity_ids = engine.component_manager.creation_order(entity_ids)
+
+        # Gather the z-indices and positions of every sprite from the component columns
+        z_index_store = component_registry["z-index"]
+        position_store = component_registry["position"]
+        position_rows = position_store.rows_of(entity_ids)
+        z_indices = z_index_store.column("z_index")[z_index_store.rows_of(entity_ids)]
+        render_xs = position_store.column("render_x_pos")[position_rows] - offset_x
+        render_ys = position_store.column("render_y_pos")[position_rows] - offset_y
+        texture_reg = component_registry["texture"]
+
+        for entity_id, z_index, x, y in zip(
+            entity_ids.tolist(), z_indices.tolist(), render_xs.tolist(), render_ys.tolist()
+        ):
+            # Prepare the renderable entity for AetherRenderer by appending it to the layer's last
+            # batch if that batch draws the same texture (batching never reorders draws).
+            texture = texture_reg[entity_id].texture
+            batches = layer_batches.setdefault(z_index, [])
+            if batches and batches[-1][2] is texture:
+                batches[-1][0].append(x)
+                batches[-1][1].append(y)
+            else:
+                batches.append(([x], [y], texture))
+
+        # TODO: Add support for scene-level components for level loading?
+        # Scene-level components
+        # elif entity_id in component_registry["scene"]:
+        #     # Directly apply the scene background color to the AetherRenderer:
+        #     if entity_id in component_registry["background-color"]:
+        #         background_color = component_registry["background-color"][
+        #             entity_id
+        #         ].color
+        #         NyxEngine.aether_renderer.set_background_color(background_color)
+        #     # Pass the scene tilemap to the AetherRenderer:
+        #     if entity_id in component_registry["tilemap"]:
+        #         tilemap = component_registry["tilemap"][entity_id].tilemap
+        #         tile_dimension = component_registry["tilemap"][
+        #             entity_id
+        #         ].tile_dimension
+        #         z_index = component_registry["z-index"][entity_id].z_index
+        #         renderable_entity = (tilemap, tile_dimension)
+        for z_index, batches in layer_batches.items():
+            renderable_entities[z_index] = [
+                self._pack_batch(xs, ys, texture) for xs, ys, texture in batches
+            ]
         self.renderable_entities = renderable_entities
 
-    def _validate_z_index(self, z_index: int, renderable_entities: dict):
-        """Ensure that the z-index is present in the renderable entities dictionary.
+    @staticmethod
+    def _pack_batch(xs: List[int], ys: List[int], texture: np.ndarray) -> Tuple:
+        """Pack a group of sprites sharing a texture into a renderable entry.
 
         Args:
-            z_index (int): The z-index to validate.
-            renderable_entities (dict): The dictionary of renderable entities to check.
+            xs (List[int]): The x-positions of the sprites.
+            ys (List[int]): The y-positions of the sprites.
+            texture (np.ndarray): The shared texture.
+
+        Returns:
+            Tuple: `(x, y, texture)` for a single sprite, otherwise `(xs, ys, texture)` with the
+                positions as int64 arrays.
         """
-        if z_index not in renderable_entities:
-            renderable_entities[z_index] = []
+        if len(xs) == 1:
+            return xs[0], ys[0], texture
+        return np.array(xs, dtype=np.int64), np.array(ys, dtype=np.int64), texture
@@ -2,21 +2,86 @@
 Abstract Base System Module
 
 This module defines the abstract base classes that all systems in the ECS architechture inherit
-from.
+from. A system belongs to exactly one engine, which it is attached to explicitly (`attach`, or
+`NyxEngine.add_system`), so several independent engines can run in one process.
 """
 
 from abc import ABC
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional, Tuple
 
 if TYPE_CHECKING:
+    from nyx.moirai_ecs.system.command_buffer import CommandBuffer
     from nyx.nyx_engine.nyx_engine import NyxEngine
 
 
 class BaseSystem(ABC):
-    """The base system class, which all systems in the ECS architecture inherit from."""
+    """The base system class, which all systems in the ECS architecture inherit from.
+
+    Attributes:
+        reads (Tuple[str, ...]): The component types (or other shared resources, such as
+            "particle-pools") the system reads. None (undeclared) makes the system exclusive: the
+            scheduler never runs it concurrently with another system.
+        writes (Tuple[str, ...]): The component types (or other shared resources) the system
+            writes. None (undeclared) makes the system exclusive.
+        engine (NyxEngine): The engine the system is attached to.
+
+    Methods:
+        attach: Attach the system to an engine.
+        update: Update the system's components for one tick.
+        interpolate: Blend the render state between the last two simulation states.
+    """
+
+    reads: Optional[Tuple[str, ...]] = None
+    writes: Optional[Tuple[str, ...]] = None
 
     @property
     def engine(self) -> "NyxEngine":
-        """Return the engine instance."""
-        from nyx.nyx_engine.nyx_engine import NyxEngine
-        return NyxEngine()
+        """Return the engine the system is attached to.
+
+        Raises:
+            ValueError: If the system is not attached to an engine.
+        """
+        engine = self.__dict__.get("_engine")
+        if engine is None:
+            raise ValueError(
+                f"{type(self).__name__} is not attached to an engine (see `NyxEngine.add_system`)."
+            )
+        return engine
+
+    def attach(self, engine: "NyxEngine") -> "BaseSystem":
+        """Attach the system to an engine, whose components and command buffer it then updates.
+
+        Args:
+            engine (NyxEngine): The engine.
+
+        Raises:
+            ValueError: If the system is already attached to another engine.
+
+        Returns:
+            BaseSystem: The system itself.
+        """
+        attached = self.__dict__.get("_engine")
+        if attached is not None and attached is not engine:
+            raise ValueError(f"{type(self).__name__} is already attached to another engine.")
+        self._engine = engine
+        return self
+
+    @property
+    def commands(self) -> "CommandBuffer":
+        """Return the engine's command buffer, for deferring structural changes (spawning,
+        destroying, adding/removing components) until every system has updated.
+
+        While the scheduler runs the system concurrently with others, this is a private buffer
+        that is merged into the engine's in registration order, so command order is
+        deterministic."""
+        commands = self.__dict__.get("_commands")
+        return commands if commands is not None else self.engine.commands
+
+    def interpolate(self, alpha: float):
+        """Blend the render state between the last two simulation states before a frame is drawn
+        (no-op by default).
+
+        Args:
+            alpha (float): How far real time is between the previous and the current simulation
+                state, in [0, 1).
+        """
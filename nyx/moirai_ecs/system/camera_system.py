@@ -0,0 +1,218 @@
+"""
+Camera System Module
+
+This module maps world coordinates to the viewport and culls entities that are outside of it. A
+spatial hash grid of entity bounding boxes is kept up to date incrementally, so finding the visible
+entities only costs as much as the entities near the viewport.
+
+Classes:
+    CameraSystem: Tracks the active camera and the set of entities visible through it.
+"""
+
+from typing import Dict, Optional, Set, Tuple
+
+import numpy as np
+
+from nyx.moirai_ecs.component.base_components import NyxComponent
+from nyx.moirai_ecs.component.component_store import ColumnStore
+from nyx.moirai_ecs.component.transform_components import CameraComponent
+from nyx.moirai_ecs.system.base_systems import BaseSystem
+from nyx.moirai_ecs.system.spatial_hash_grid import SpatialHashGrid
+
+
+class CameraSystem(BaseSystem):
+    """Tracks the active camera and the set of entities visible through it.
+
+    The first entity holding a `CameraComponent` is the active camera. Without a camera, entity
+    positions are screen coordinates and nothing is culled (the original behavior).
+
+    Only entities whose cell range changed are re-hashed each update. The candidates (entities
+    that gained or lost a position component, entities with a velocity component, and entities
+    explicitly flagged with `mark_moved`) are found and checked with vectorized array operations,
+    so entities moving within their cells cost no per-entity Python work. Texture and dimension
+    sizes are read when an entity is added or flagged with `mark_moved`.
+
+    Attributes:
+        grid (SpatialHashGrid): The spatial hash of entity bounding boxes in world coordinates.
+        camera (CameraComponent): The active camera, or None if there is no camera entity.
+        visible_entities (Set[int]): The entity IDs intersecting the viewport after `update`.
+
+    Methods:
+        update: Sync the spatial hash and recompute the visible entities.
+        mark_moved: Flag an entity without velocity whose position or texture was changed.
+        world_to_viewport: Convert a world position to viewport coordinates.
+    """
+
+    def __init__(self, cell_size: int = 64):
+        """Initialize an empty spatial hash and no active camera.
+
+        Args:
+            cell_size (int, optional): The spatial hash cell size in pixels. Defaults to 64.
+        """
+        self.grid = SpatialHashGrid(cell_size=cell_size)
+        self.camera: Optional[CameraComponent] = None
+        self.visible_entities: Set[int] = set()
+        self._moved: Set[int] = set()
+        # The (x, y, w, h) box and inclusive cell range of every hashed entity
+        self._hashed = ColumnStore(
+            NyxComponent,
+            {field: np.int64 for field in ("x", "y", "w", "h", "cx0", "cy0", "cx1", "cy1")},
+        )
+
+    @property
+    def is_active(self) -> bool:
+        """If a camera entity exists (and entity positions are world coordinates)."""
+        return self.camera is not None
+
+    def update(self):
+        """Sync the spatial hash and recompute the visible entities for the active camera."""
+        component_registry = self.engine.component_registry
+        cameras: Dict[int, CameraComponent] = component_registry["camera"]
+        if not cameras:
+            self.camera = None
+            self.visible_entities = set()
+            return
+        self.camera = next(iter(cameras.values()))
+        self._sync_grid(component_registry)
+
+        dimensions = self.engine.aether_dimensions
+        self.visible_entities = self._visible(
+            int(self.camera.x_pos),
+            int(self.camera.y_pos),
+            dimensions.effective_window_w,
+            dimensions.effective_window_h,
+        )
+
+    def mark_moved(self, entity_id: int):
+        """Flag an entity whose position (without velocity), texture or dimensions were changed
+        directly.
+
+        Args:
+            entity_id (int): The entity ID to re-hash on the next update.
+        """
+        self._moved.add(entity_id)
+
+    def world_to_viewport(self, x: int, y: int) -> Tuple[int, int]:
+        """Convert a world position to viewport coordinates.
+
+        Args:
+            x (int): The world x-coordinate.
+            y (int): The world y-coordinate.
+
+        Returns:
+            Tuple[int, int]: The (x, y) position relative to the viewport origin.
+        """
+        if self.camera is None:
+            return x, y
+        return x - int(self.camera.x_pos), y - int(self.camera.y_pos)
+
+    def _sync_grid(self, component_registry: Dict[str, Dict[int, NyxComponent]]):
+        """Re-hash only the entities whose cell range changed since the last update.
+
+        The box and cell range of every hashed entity are mirrored in a `ColumnStore`, so finding
+        removed, new and moving entities (gathers through the stores' sparse entity maps) and
+        their new cell ranges is vectorized. Only entities that were added, removed, flagged with
+        `mark_moved`, or crossed into a different cell range touch the grid in Python.
+        """
+        grid = self.grid
+        hashed = self._hashed
+        positions: ColumnStore = component_registry["position"]
+        position_ids = positions.dense_entity_ids
+
+        hashed_ids = hashed.dense_entity_ids
+        removed = hashed_ids[positions.rows_of(hashed_ids) < 0]
+        if removed.size:
+            for entity_id in removed.tolist():
+                grid.remove(entity_id)
+            hashed.remove_many(removed)
+
+        added = position_ids[hashed.rows_of(position_ids) < 0]
+        if added.size:
+            # New entities have no cell range yet (the sentinel never matches a computed range)
+            no_cells = np.iinfo(np.int64).min
+            hashed.extend(
+                added, {field: no_cells if field.startswith("c") else 0 for field in hashed.fields}
+            )
+        marked = np.empty(0, dtype=np.int64)
+        if self._moved:
+            marked = np.fromiter(self._moved, dtype=np.int64, count=len(self._moved))
+            marked = marked[positions.rows_of(marked) >= 0]
+            self._moved.clear()
+
+        # Sizes only change for new entities and entities flagged with `mark_moved`
+        resized = np.concatenate((added, marked))
+        if resized.size:
+            sizes = self._sizes(resized, component_registry)
+            rows = hashed.rows_of(resized)
+            hashed.column("w")[rows] = sizes[:, 0]
+            hashed.column("h")[rows] = sizes[:, 1]
+
+        velocity_ids = component_registry["velocity"].dense_entity_ids
+        movers = velocity_ids[positions.rows_of(velocity_ids) >= 0]
+        if resized.size:
+            movers = movers[~np.isin(movers, resized)]
+        dirty = np.concatenate((np.unique(resized), movers))
+        if dirty.size == 0:
+            return
+        rows = hashed.rows_of(dirty)
+        position_rows = positions.rows_of(dirty)
+        x = hashed.column("x")
+        y = hashed.column("y")
+        x[rows] = positions.column("render_x_pos")[position_rows]
+        y[rows] = positions.column("render_y_pos")[position_rows]
+        x, y = x[rows], y[rows]
+        w, h = hashed.column("w")[rows], hashed.column("h")[rows]
+
+        cell_size = grid.cell_size
+        changed = np.zeros(dirty.size, dtype=bool)
+        for field, cells in (
+            ("cx0", x // cell_size),
+            ("cy0", y // cell_size),
+            ("cx1", (x + np.maximum(w, 1) - 1) // cell_size),
+            ("cy1", (y + np.maximum(h, 1) - 1) // cell_size),
+        ):
+            column = hashed.column(field)
+            changed |= column[rows] != cells
+            column[rows] = cells
+        for entity_id, box in zip(
+            dirty[changed].tolist(),
+            zip(x[changed].tolist(), y[changed].tolist(), w[changed].tolist(), h[changed].tolist()),
+        ):
+            grid.update(entity_id, *box)
+
+    def _visible(self, x: int, y: int, w: int, h: int) -> Set[int]:
+        """Find the entities whose current box intersects a rectangle: the grid cells give the
+        candidates, which are tested against the up-to-date boxes in one vectorized pass (the grid
+        only stores the box of an entity when its cell range changes)."""
+        candidates = self.grid.candidates(x, y, w, h)
+        if not candidates:
+            return set()
+        hashed = self._hashed
+        entity_ids = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+        rows = hashed.rows_of(entity_ids)
+        ex, ey = hashed.column("x")[rows], hashed.column("y")[rows]
+        overlaps = (
+            (ex < x + w)
+            & (ey < y + h)
+            & (ex + hashed.column("w")[rows] > x)
+            & (ey + hashed.column("h")[rows] > y)
+        )
+        return set(entity_ids[overlaps].tolist())
+
+    @staticmethod
+    def _sizes(
+        entity_ids: np.ndarray, component_registry: Dict[str, Dict[int, NyxComponent]]
+    ) -> np.ndarray:
+        """Get the (w, h) of each entity from its texture (or dimensions, or 1x1)."""
+        textures = component_registry["texture"]
+        dimensions = component_registry["dimensions"]
+        sizes = np.ones((entity_ids.size, 2), dtype=np.int64)
+        for i, entity_id in enumerate(entity_ids.tolist()):
+            if entity_id in textures:
+                h, w = textures[entity_id].texture.shape
+            elif entity_id in dimensions:
+                h, w = dimensions[entity_id].height, dimensions[entity_id].width
+            else:
+                continue
+            sizes[i] = w, h
+        return sizes
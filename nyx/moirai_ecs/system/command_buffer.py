@@ -0,0 +1,156 @@
+"""
+Command Buffer Module
+
+This module defers structural changes (spawning and destroying entities, adding and removing
+components) made by systems. Systems record commands while they iterate the component registries,
+and the engine applies them at a single sync point after every system has updated, so no registry
+ever changes size mid-iteration and consecutive commands of the same kind are applied as one batch.
+
+Classes:
+    CommandBuffer: A per-tick queue of deferred structural changes.
+"""
+
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, Optional, Tuple
+
+import numpy as np
+
+from nyx.moirai_ecs.component.base_components import NyxComponent
+
+if TYPE_CHECKING:
+    from nyx.moirai_ecs.entity.moirai_entity_manager import MoiraiEntityManager
+
+
+class CommandBuffer:
+    """A per-tick queue of deferred structural changes.
+
+    Commands are applied in the order they were recorded. Recording is safe from several threads
+    at once (appending to the queue is atomic), so concurrently running systems need no locks on
+    the registries.
+
+    Attributes:
+        commands (Deque[Tuple]): The recorded commands, oldest first.
+        commands_applied (int): The number of commands applied by the last flush.
+
+    Methods:
+        spawn: Record the creation of entities from a component template.
+        destroy: Record the destruction of entities.
+        add_component: Record adding a component to an entity.
+        remove_component: Record removing a component from an entity.
+        extend: Move the commands recorded in another buffer to the end of this one.
+        flush: Apply and clear the recorded commands.
+    """
+
+    def __init__(self):
+        self.commands: Deque[Tuple] = deque()
+        self.commands_applied = 0
+
+    def spawn(
+        self,
+        template: Dict[str, NyxComponent],
+        count: int = 1,
+        overrides: Optional[Dict[str, Dict[str, object]]] = None,
+        friendly_name: str = "",
+    ):
+        """Record the creation of entities from a component template (see `spawn_many`).
+
+        Args:
+            template (Dict[str, NyxComponent]): The component of each component type, by name.
+            count (int, optional): The number of entities to create. Defaults to 1.
+            overrides (Dict[str, Dict[str, object]], optional): Per component type, field values
+                replacing the template's. Defaults to None.
+            friendly_name (str, optional): The friendly name of the new entities. Defaults to "".
+        """
+        self.commands.append(("spawn", template, count, overrides, friendly_name))
+
+    def destroy(self, entity_ids):
+        """Record the destruction of one or several entities.
+
+        Args:
+            entity_ids (int | np.ndarray): The entity ID(s) to destroy.
+        """
+        self.commands.append(("destroy", np.atleast_1d(np.asarray(entity_ids, dtype=np.int64))))
+
+    def add_component(self, entity_id: int, component_name: str, component: NyxComponent):
+        """Record adding a component to an entity.
+
+        Args:
+            entity_id (int): The entity ID.
+            component_name (str): The name of the component type.
+            component (NyxComponent): The component to add.
+        """
+        self.commands.append(("add", entity_id, component_name, component))
+
+    def remove_component(self, entity_id: int, component_name: str):
+        """Record removing a component from an entity.
+
+        Args:
+            entity_id (int): The entity ID.
+            component_name (str): The name of the component type.
+        """
+        self.commands.append(("remove", entity_id, component_name))
+
+    def extend(self, other: "CommandBuffer"):
+        """Move the commands recorded in another buffer to the end of this one.
+
+        Args:
+            other (CommandBuffer): The buffer to drain.
+        """
+        self.commands.extend(other.commands)
+        other.commands.clear()
+
+    def flush(self, entity_manager: "MoiraiEntityManager") -> int:
+        """Apply and clear the recorded commands, batching runs of consecutive destroys and of
+        consecutive spawns of the same template.
+
+        Commands targeting entities that are no longer alive when they are applied (e.g. destroyed
+        earlier in the same tick) are dropped, as are removals of components the entity does not
+        hold.
+
+        Args:
+            entity_manager (MoiraiEntityManager): The entity manager to apply the commands to.
+
+        Raises:
+            ValueError: If a component type is added to an entity that already holds it.
+
+        Returns:
+            int: The number of commands applied.
+        """
+        component_manager = entity_manager.component_manager
+        applied = 0
+        while self.commands:
+            command = self.commands.popleft()
+            applied += 1
+            kind = command[0]
+            if kind == "destroy":
+                batch = [command[1]]
+                while self.commands and self.commands[0][0] == "destroy":
+                    batch.append(self.commands.popleft()[1])
+                    applied += 1
+                entity_manager.destroy_many(np.concatenate(batch))
+            elif kind == "spawn":
+                _, template, count, overrides, friendly_name = command
+                while (
+                    overrides is None
+                    and self.commands
+                    and self.commands[0][0] == "spawn"
+                    and self.commands[0][1] is template
+                    and self.commands[0][3] is None
+                    and self.commands[0][4] == friendly_name
+                ):
+                    count += self.commands.popleft()[2]
+                    applied += 1
+                entity_manager.spawn_many(template, count, overrides, friendly_name)
+            elif kind == "add":
+                _, entity_id, component_name, component = command
+                if entity_manager.is_alive(entity_id):
+                    component_manager.add_component(entity_id, component_name, component)
+            elif kind == "remove":
+                _, entity_id, component_name = command
+                if entity_id in component_manager.component_registry[component_name]:
+                    component_manager.remove_component(entity_id, component_name)
+        self.commands_applied = applied
+        return applied
+
+    def __len__(self) -> int:
+        return len(self.commands)
@@ -0,0 +1,51 @@
+"""
+Input System Module
+
+This module hands the keys read by `TerminalInput` to the game once per game update, so input
+latency is bounded by one tick and reading never blocks the loop.
+
+Classes:
+    InputSystem: Drains the terminal key buffer once per game update.
+"""
+
+from typing import List
+
+from nyx.hemera_term_fx.terminal_input import TerminalInput
+from nyx.moirai_ecs.system.base_systems import BaseSystem
+
+
+class InputSystem(BaseSystem):
+    """Drain the terminal key buffer once per game update. Systems registered after it (and game
+    logic) read the keys of the current tick from `keys`.
+
+    Attributes:
+        terminal_input (TerminalInput): The keyboard reader.
+        keys (List[str]): The keys pressed since the previous update, oldest first.
+    """
+
+    reads = ()
+    writes = ("input",)
+
+    def __init__(self, terminal_input: TerminalInput):
+        """Initialize the system with no keys.
+
+        Args:
+            terminal_input (TerminalInput): The keyboard reader.
+        """
+        self.terminal_input = terminal_input
+        self.keys: List[str] = []
+
+    def update(self):
+        """Replace `keys` with the keys read since the previous update."""
+        self.keys = self.terminal_input.drain()
+
+    def is_pressed(self, key: str) -> bool:
+        """Check if a key was pressed since the previous update.
+
+        Args:
+            key (str): The key name (see `TerminalInput`).
+
+        Returns:
+            bool: If the key was pressed.
+        """
+        return key in self.keys
@@ -7,17 +7,49 @@ Classes:
     MovementSystem: Updates an entity's position component as a function of its velocity and time.
 """
 
-from typing import Dict
-from nyx.moirai_ecs.component.transform_components import (
-    PositionComponent,
-    VelocityComponent,
-)
+import numpy as np
+
+from nyx.moirai_ecs.component.component_store import ColumnStore
 from nyx.moirai_ecs.system.base_systems import BaseSystem
-from nyx.nyx_engine.nyx_engine import NyxEngine
 
 
 class MovementSystem(BaseSystem):
-    """Update an entity's position component as a function of its velocity and time."""
+    """Update an entity's position component as a function of its velocity and time.
+
+    Every entity of the cached ("position", "velocity") query is moved with a handful of column
+    operations over the struct-of-arrays component stores, independent of the number of entities.
+
+    Attributes:
+        fixed_point (bool): If positions are advanced in fixed-point integer sub-pixel units, so
+            repeated updates never accumulate floating-point rounding drift. The integer positions
+            are kept across updates in the `x_pos_fixed`/`y_pos_fixed` auxiliary columns of the
+            position store, and `x_pos`/`y_pos` mirror them exactly.
+        fraction_bits (int): The number of sub-pixel bits in fixed-point mode (8 = 1/256 px).
+        interpolate_render (bool): If the render positions are blended between the previous and
+            the current update when a frame is drawn between updates (see `interpolate`).
+        moved_last_update (int): The number of entities moved by the last update.
+    """
+
+    reads = ("velocity",)
+    writes = ("position",)
+
+    def __init__(
+        self, fixed_point: bool = False, fraction_bits: int = 8, interpolate_render: bool = False
+    ):
+        """Initialize the movement mode.
+
+        Args:
+            fixed_point (bool, optional): If positions use fixed-point sub-pixel units. Defaults to
+                False.
+            fraction_bits (int, optional): The sub-pixel bits in fixed-point mode. Defaults to 8.
+            interpolate_render (bool, optional): If render positions are interpolated between
+                updates. Defaults to False.
+        """
+        self.fixed_point = fixed_point
+        self.fraction_bits = fraction_bits
+        self.interpolate_render = interpolate_render
+        self.moved_last_update = 0
+        self._previous = None
 
     def update(self):
         """Update the position of each entity in the position registry if it also has a velocity
@@ -28,29 +60,107 @@ class MovementSystem(BaseSystem):
         """
         engine = self.engine
         component_registry = engine.component_registry
-        entity_reg = engine.entity_manager.entity_registry
-        position_reg: Dict[int, PositionComponent] = (
-            component_registry["position"]
-        )
-        velocity_reg: Dict[int, VelocityComponent] = (
-            component_registry["velocity"]
-        )
-        engine = NyxEngine()
+        positions: ColumnStore = component_registry["position"]
+        velocities: ColumnStore = component_registry["velocity"]
         dt = engine.sec_per_game_loop
 
-        # Update the position of each entity
-        for entity_id, velocity_component in velocity_reg.items():
-            if entity_id in entity_reg and entity_id in position_reg:
-                position_component = position_reg[entity_id]
-
-                # Update the x coordinate in the component
-                dx = velocity_component.x_vel * dt
-                position_component.x_pos += dx
-                # Round the x position to the nearest integer
-                position_component.render_x_pos = round(position_component.x_pos)
-
-                # Update the y coordinate in the component
-                dy = velocity_component.y_vel * dt
-                position_component.y_pos += dy
-                # Round the y position to the nearest integer
-                position_component.render_y_pos = round(position_component.y_pos)
+        movers = engine.query("position", "velocity").entity_ids
+        pos_rows, vel_rows = self._matching_rows(positions, velocities, movers)
+        self.moved_last_update = movers.size
+        if self.moved_last_update == 0:
+            self._previous = None
+            return
+        if self.interpolate_render:
+            if pos_rows is None:
+                moved_ids, rows = positions.dense_entity_ids.copy(), slice(None)
+            else:
+                moved_ids, rows = movers.copy(), pos_rows
+            self._previous = (
+                moved_ids,
+                positions.column("x_pos")[rows].copy(),
+                positions.column("y_pos")[rows].copy(),
+            )
+        for axis in ("x", "y"):
+            self._move_axis(
+                positions,
+                axis,
+                positions.column(f"render_{axis}_pos"),
+                velocities.column(f"{axis}_vel"),
+                pos_rows,
+                vel_rows,
+                dt,
+            )
+
+    def interpolate(self, alpha: float):
+        """Set the render positions of the entities moved by the last update to
+        `previous + alpha * (current - previous)`, rounded (no-op unless `interpolate_render`).
+
+        Args:
+            alpha (float): How far real time is between the previous and the current update, in
+                [0, 1).
+        """
+        if not self.interpolate_render or self._previous is None:
+            return
+        entity_ids, previous_x, previous_y = self._previous
+        positions: ColumnStore = self.engine.component_registry["position"]
+        rows = positions.rows_of(entity_ids)
+        alive = rows >= 0
+        rows = rows[alive]
+        for axis, previous in (("x", previous_x[alive]), ("y", previous_y[alive])):
+            current = positions.column(f"{axis}_pos")[rows]
+            positions.column(f"render_{axis}_pos")[rows] = np.rint(
+                previous + alpha * (current - previous)
+            )
+
+    @staticmethod
+    def _matching_rows(positions: ColumnStore, velocities: ColumnStore, movers: np.ndarray):
+        """Pair the position and velocity rows of the entities holding both components.
+
+        Args:
+            positions (ColumnStore): The position store.
+            velocities (ColumnStore): The velocity store.
+            movers (np.ndarray): The entity IDs holding both components.
+
+        Returns:
+            Tuple: `(None, None)` when both stores hold the same entities in the same row order
+                (the common case, so whole columns are used without gathers), otherwise the
+                position rows and velocity rows of the matching entities.
+        """
+        if len(movers) == len(positions) == len(velocities) and np.array_equal(
+            positions.dense_entity_ids, velocities.dense_entity_ids
+        ):
+            return None, None
+        return positions.rows_of(movers), velocities.rows_of(movers)
+
+    def _move_axis(
+        self,
+        positions: ColumnStore,
+        axis: str,
+        render_pos: np.ndarray,
+        vel: np.ndarray,
+        pos_rows,
+        vel_rows,
+        dt: float,
+    ):
+        """Advance one axis of the positions and round it (half to even, in both modes) to the
+        render positions."""
+        pos = positions.column(f"{axis}_pos")
+        rows = slice(None) if pos_rows is None else pos_rows
+        step = vel * dt if vel_rows is None else vel[vel_rows] * dt
+
+        if self.fixed_point:
+            scale = 1 << self.fraction_bits
+            fixed_column = positions.add_column(f"{axis}_pos_fixed", np.int64)
+            fixed, current = fixed_column[rows], pos[rows]
+            # New entities, and positions written since the last update, are (re)quantized;
+            # everything else keeps accumulating in integers
+            stale = current != fixed / scale
+            fixed[stale] = np.rint(current[stale] * scale)
+            fixed += np.rint(step * scale).astype(np.int64)
+            fixed_column[rows] = fixed
+            moved = fixed / scale
+        else:
+            moved = pos[rows] + step
+
+        pos[rows] = moved
+        render_pos[rows] = np.rint(moved)
@@ -0,0 +1,35 @@
+"""
+Particle System Module
+
+This module advances the particle pools registered with AetherRenderer once per game update.
+
+Classes:
+    ParticleSystem: Integrates every registered particle pool with vectorized math.
+"""
+
+from nyx.moirai_ecs.system.base_systems import BaseSystem
+
+
+class ParticleSystem(BaseSystem):
+    """Integrate every particle pool registered with AetherRenderer and recycle expired particles.
+
+    Attributes:
+        expired_last_update (int): The number of particles that expired during the last update.
+    """
+
+    reads = ()
+    writes = ("particle-pools",)
+
+    def __init__(self):
+        """Initialize the expired-particle counter."""
+        self.expired_last_update = 0
+
+    def update(self):
+        """Advance every registered particle pool by one game update."""
+        engine = self.engine
+        dt = engine.sec_per_game_loop
+        expired = 0
+        for pools in engine.aether_renderer.particle_pools.values():
+            for pool in pools:
+                expired += pool.update(dt)
+        self.expired_last_update = expired
@@ -0,0 +1,164 @@
+"""
+Spatial Hash Grid Module
+
+This module provides a uniform spatial hash used to find the entities that intersect a rectangle
+(such as the camera viewport) without touching every entity in the world.
+
+Classes:
+    SpatialHashGrid: Buckets entity bounding boxes into fixed-size world cells.
+"""
+
+from typing import Dict, Set, Tuple
+
+
+class SpatialHashGrid:
+    """Buckets entity bounding boxes into fixed-size world cells.
+
+    Each entity is stored in every cell its bounding box overlaps. Updates are incremental: moving
+    an entity only touches the cell buckets when the range of cells it covers actually changes.
+
+    Attributes:
+        cell_size (int): The width and height of a cell, in world pixels.
+        cells (Dict[Tuple[int, int], Set[int]]): The entity IDs in each occupied (cell_x, cell_y).
+        entity_bounds (Dict[int, Tuple[int, int, int, int]]): The (x, y, w, h) box of each entity.
+        entity_cells (Dict[int, Tuple[int, int, int, int]]): The inclusive (cx0, cy0, cx1, cy1)
+            cell range covered by each entity.
+
+    Methods:
+        update: Insert an entity or move it to a new bounding box.
+        remove: Remove an entity from the grid.
+        candidates: Return the entity IDs in the cells a rectangle overlaps.
+        query: Return the entity IDs whose bounding box intersects a rectangle.
+    """
+
+    def __init__(self, cell_size: int = 64):
+        """Initialize an empty grid.
+
+        Args:
+            cell_size (int, optional): The cell size in world pixels. Defaults to 64.
+
+        Raises:
+            ValueError: If the cell size is not a positive integer.
+        """
+        if cell_size <= 0:
+            raise ValueError(f"Cell size (={cell_size}) must be a positive integer.")
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], Set[int]] = {}
+        self.entity_bounds: Dict[int, Tuple[int, int, int, int]] = {}
+        self.entity_cells: Dict[int, Tuple[int, int, int, int]] = {}
+
+    def __contains__(self, entity_id: int) -> bool:
+        return entity_id in self.entity_bounds
+
+    def __len__(self) -> int:
+        return len(self.entity_bounds)
+
+    def update(self, entity_id: int, x: int, y: int, w: int = 1, h: int = 1) -> bool:
+        """Insert an entity or move it to a new bounding box.
+
+        Args:
+            entity_id (int): The entity ID to insert or move.
+            x (int): The world x-coordinate of the top-left corner.
+            y (int): The world y-coordinate of the top-left corner.
+            w (int, optional): The width of the bounding box. Defaults to 1.
+            h (int, optional): The height of the bounding box. Defaults to 1.
+
+        Returns:
+            bool: If the set of cells covered by the entity changed.
+        """
+        self.entity_bounds[entity_id] = (x, y, w, h)
+        cell_size = self.cell_size
+        new_range = (
+            x // cell_size,
+            y // cell_size,
+            (x + max(w, 1) - 1) // cell_size,
+            (y + max(h, 1) - 1) // cell_size,
+        )
+        old_range = self.entity_cells.get(entity_id)
+        if old_range == new_range:
+            return False
+        if old_range is not None:
+            self._unlink(entity_id, old_range)
+        self.entity_cells[entity_id] = new_range
+        cells = self.cells
+        cx0, cy0, cx1, cy1 = new_range
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = {entity_id}
+                else:
+                    bucket.add(entity_id)
+        return True
+
+    def remove(self, entity_id: int):
+        """Remove an entity from the grid. Unknown entity IDs are ignored.
+
+        Args:
+            entity_id (int): The entity ID to remove.
+        """
+        cell_range = self.entity_cells.pop(entity_id, None)
+        self.entity_bounds.pop(entity_id, None)
+        if cell_range is not None:
+            self._unlink(entity_id, cell_range)
+
+    def candidates(self, x: int, y: int, w: int, h: int) -> Set[int]:
+        """Return the entity IDs in the cells a rectangle overlaps (a superset of the entities
+        intersecting it, since cells are coarse).
+
+        Args:
+            x (int): The world x-coordinate of the rectangle.
+            y (int): The world y-coordinate of the rectangle.
+            w (int): The width of the rectangle.
+            h (int): The height of the rectangle.
+
+        Returns:
+            Set[int]: The entity IDs in the overlapped cells.
+        """
+        if w <= 0 or h <= 0:
+            return set()
+        cell_size = self.cell_size
+        cells = self.cells
+        candidates: Set[int] = set()
+        for cy in range(y // cell_size, (y + h - 1) // cell_size + 1):
+            for cx in range(x // cell_size, (x + w - 1) // cell_size + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    candidates.update(bucket)
+        return candidates
+
+    def query(self, x: int, y: int, w: int, h: int) -> Set[int]:
+        """Return the entity IDs whose bounding box intersects a rectangle.
+
+        Args:
+            x (int): The world x-coordinate of the rectangle.
+            y (int): The world y-coordinate of the rectangle.
+            w (int): The width of the rectangle.
+            h (int): The height of the rectangle.
+
+        Returns:
+            Set[int]: The intersecting entity IDs.
+        """
+        candidates = self.candidates(x, y, w, h)
+
+        # Cells are coarse; keep only the boxes that really overlap the rectangle
+        x_end, y_end = x + w, y + h
+        bounds = self.entity_bounds
+        visible = set()
+        for entity_id in candidates:
+            ex, ey, ew, eh = bounds[entity_id]
+            if ex < x_end and ey < y_end and ex + ew > x and ey + eh > y:
+                visible.add(entity_id)
+        return visible
+
+    def _unlink(self, entity_id: int, cell_range: Tuple[int, int, int, int]):
+        """Remove an entity from every cell bucket of a cell range, dropping empty buckets."""
+        cells = self.cells
+        cx0, cy0, cx1, cy1 = cell_range
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.discard(entity_id)
+                    if not bucket:
+                        del cells[(cx, cy)]
@@ -0,0 +1,181 @@
+"""
+System Scheduler Module
+
+This module runs the engine's systems each tick according to the component types they declare they
+read and write (`BaseSystem.reads`/`writes`). Two systems conflict when one writes something the
+other reads or writes; a system that has not declared its access conflicts with every system. The
+scheduler orders conflicting systems by registration order (a dependency DAG) and groups the
+systems into stages of mutually independent systems that run concurrently on a thread pool.
+NumPy-heavy systems release the GIL, so they overlap even on standard CPython builds.
+
+The schedule is deterministic: conflicting systems always run in registration order, systems in
+the same stage touch disjoint data, and the structural-change commands they record are merged into
+the engine's command buffer in registration order.
+
+Classes:
+    SystemScheduler: Builds the per-tick stages of the running systems and executes them.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from nyx.moirai_ecs.system.command_buffer import CommandBuffer
+
+if TYPE_CHECKING:
+    from nyx.moirai_ecs.system.base_systems import BaseSystem
+
+
+class SystemScheduler:
+    """Builds the per-tick stages of the running systems and executes them.
+
+    Attributes:
+        parallel (bool): If the systems of a stage run concurrently (otherwise every system runs on
+            the calling thread, in registration order).
+        max_workers (int): The size of the thread pool.
+        stages (List[List[BaseSystem]]): The stages of the last schedule, in execution order.
+        timings (Dict[str, float]): The wall time of each system during the last tick, in seconds
+            (keyed by `"<index>:<class name>"`).
+
+    Methods:
+        build_stages: Group systems into stages of mutually independent systems.
+        run: Run one tick of the systems.
+        describe: Describe the last schedule and its timings.
+        shutdown: Stop the thread pool.
+    """
+
+    def __init__(self, parallel: bool = True, max_workers: Optional[int] = None):
+        """Initialize the scheduler (the thread pool is created on first use).
+
+        Args:
+            parallel (bool, optional): If independent systems run concurrently. Defaults to True.
+            max_workers (int, optional): The size of the thread pool. Defaults to the CPU count,
+                capped at 8.
+        """
+        self.parallel = parallel
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.stages: List[List["BaseSystem"]] = []
+        self.timings: Dict[str, float] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._schedule_key: Optional[Tuple] = None
+        self._labels: Dict[int, str] = {}
+
+    @staticmethod
+    def conflicts(first: "BaseSystem", second: "BaseSystem") -> bool:
+        """Check if two systems may not run concurrently.
+
+        Args:
+            first (BaseSystem): A system.
+            second (BaseSystem): Another system.
+
+        Returns:
+            bool: If either system is undeclared or one writes what the other reads or writes.
+        """
+        if None in (first.reads, first.writes, second.reads, second.writes):
+            return True
+        first_writes, second_writes = set(first.writes), set(second.writes)
+        return bool(
+            first_writes & (set(second.reads) | second_writes)
+            or second_writes & set(first.reads)
+        )
+
+    def build_stages(self, systems: Sequence["BaseSystem"]) -> List[List["BaseSystem"]]:
+        """Group systems into stages of mutually independent systems.
+
+        Each system depends on every earlier-registered system it conflicts with and is placed in
+        the stage after its latest dependency (the longest path in the dependency DAG), so stages
+        run in order and the systems inside a stage can run concurrently.
+
+        Args:
+            systems (Sequence[BaseSystem]): The systems in registration order.
+
+        Returns:
+            List[List[BaseSystem]]: The stages, each in registration order.
+        """
+        levels: List[int] = []
+        stages: List[List["BaseSystem"]] = []
+        for i, system in enumerate(systems):
+            level = 1 + max(
+                (levels[j] for j in range(i) if self.conflicts(systems[j], system)), default=-1
+            )
+            levels.append(level)
+            if level == len(stages):
+                stages.append([])
+            stages[level].append(system)
+        return stages
+
+    def run(self, systems: Sequence["BaseSystem"], commands: CommandBuffer):
+        """Run one tick of the systems, stage by stage.
+
+        Args:
+            systems (Sequence[BaseSystem]): The systems in registration order.
+            commands (CommandBuffer): The engine's command buffer, which receives the commands
+                recorded by concurrently running systems in registration order.
+
+        Raises:
+            Exception: The first exception (in registration order) raised by a system; the rest of
+                its stage still completes, but later stages do not run.
+        """
+        key = tuple((id(system), system.reads, system.writes) for system in systems)
+        if key != self._schedule_key:
+            self.stages = self.build_stages(systems)
+            self._labels = {
+                id(system): f"{i}:{type(system).__name__}" for i, system in enumerate(systems)
+            }
+            self._schedule_key = key
+        self.timings = {}
+
+        for stage in self.stages:
+            if not self.parallel or len(stage) == 1:
+                for system in stage:
+                    self._timed_update(system)
+                continue
+
+            buffers = [CommandBuffer() for _ in stage]
+            for system, buffer in zip(stage, buffers):
+                system._commands = buffer
+            try:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="nyx-system"
+                    )
+                futures = [self._pool.submit(self._timed_update, system) for system in stage]
+                errors = [future.exception() for future in futures]
+            finally:
+                for system, buffer in zip(stage, buffers):
+                    del system._commands
+                    commands.extend(buffer)
+            for error in errors:
+                if error is not None:
+                    raise error
+
+    def describe(self) -> str:
+        """Describe the last schedule and its timings.
+
+        Returns:
+            str: One line per stage listing its systems and their last wall times.
+        """
+        lines = []
+        for level, stage in enumerate(self.stages):
+            entries = ", ".join(
+                f"{self._labels[id(system)]} "
+                f"({self.timings.get(self._labels[id(system)], 0.0) * 1000:.3f} ms)"
+                for system in stage
+            )
+            lines.append(f"stage {level}: {entries}")
+        return "\n".join(lines)
+
+    def shutdown(self):
+        """Stop the thread pool (it is recreated if the scheduler runs again)."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _timed_update(self, system: "BaseSystem"):
+        """Update a system and record its wall time."""
+        start = time.perf_counter()
+        try:
+            system.update()
+        finally:
+            self.timings[self._labels[id(system)]] = time.perf_counter() - start
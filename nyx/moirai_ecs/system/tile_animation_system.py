@@ -0,0 +1,34 @@
+"""
+Tile Animation System Module
+
+This module advances the animated tiles of the tilemap layers registered with AetherRenderer once
+per game update.
+
+Classes:
+    TileAnimationSystem: Steps the animation clock of every tilemap layer.
+"""
+
+from nyx.moirai_ecs.system.base_systems import BaseSystem
+
+
+class TileAnimationSystem(BaseSystem):
+    """Step the animation clock of every tilemap layer registered with AetherRenderer.
+
+    Attributes:
+        tiles_animated_last_update (int): The number of tile cells rewritten during the last update.
+    """
+
+    reads = ()
+    writes = ("tilemap-layers",)
+
+    def __init__(self):
+        """Initialize the rewritten-tile counter."""
+        self.tiles_animated_last_update = 0
+
+    def update(self):
+        """Advance the animated tiles of every tilemap layer by one game update."""
+        engine = self.engine
+        dt = engine.sec_per_game_loop
+        self.tiles_animated_last_update = sum(
+            tilemap.animate(dt) for tilemap in engine.aether_renderer.tilemap_layers.values()
+        )
@@ -0,0 +1,141 @@
+"""
+Batch Runner Module
+
+This module runs many independent, headless worlds in parallel worker processes (bot/AI
+evaluation, parameter sweeps, soak tests). Each world gets its own `NyxEngine` in its worker,
+runs a fixed number of ticks through `NyxEngine.run_headless`, and sends back its
+`HeadlessReport`, including any game-specific metrics collected from the finished world.
+
+Classes:
+    BatchRunner: Runs headless worlds in a process pool and collects their reports.
+"""
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from nyx.nyx_engine.headless_report import HeadlessReport
+from nyx.nyx_engine.nyx_engine import NyxEngine
+
+
+class BatchRunner:
+    """Runs headless worlds in a process pool and collects their reports.
+
+    A world is described by its parameters: in the worker, `setup(engine, params)` builds the
+    scene on a new engine and returns the per-tick update (or None to only trigger the systems).
+    After the run, `collect(engine)` returns the world's own metrics (a score, the surviving
+    entities, ...), stored in the report's `metrics`. `setup` and `collect` are sent to the
+    workers, so they must be picklable (module-level functions).
+
+    Attributes:
+        setup (Callable[[NyxEngine, Any], Optional[Callable[[], None]]]): Builds a world.
+        ticks (int): The number of game updates each world runs.
+        collect (Callable[[NyxEngine], Dict[str, Any]]): Extracts a finished world's metrics, or
+            None.
+        window_h (int): The window height of every world.
+        window_w (int): The window width of every world.
+        encode (bool): If the frames are encoded with Hemera (into a null sink).
+        processes (int): The number of worker processes.
+
+    Methods:
+        run: Run one world per parameter set and return their reports.
+    """
+
+    def __init__(
+        self,
+        setup: Callable[[NyxEngine, Any], Optional[Callable[[], None]]],
+        ticks: int,
+        collect: Optional[Callable[[NyxEngine], Dict[str, Any]]] = None,
+        window_h: int = 360,
+        window_w: int = 480,
+        encode: bool = True,
+        processes: Optional[int] = None,
+    ):
+        """Initialize the runner.
+
+        Args:
+            setup (Callable[[NyxEngine, Any], Optional[Callable[[], None]]]): Builds a world from
+                its parameters and returns its per-tick update, or None.
+            ticks (int): The number of game updates each world runs.
+            collect (Callable[[NyxEngine], Dict[str, Any]], optional): Extracts a finished
+                world's metrics. Defaults to None.
+            window_h (int, optional): The window height of every world. Defaults to 360.
+            window_w (int, optional): The window width of every world. Defaults to 480.
+            encode (bool, optional): Encode the frames with Hemera. Defaults to True.
+            processes (int, optional): The number of worker processes. Defaults to the CPU count.
+        """
+        self.setup = setup
+        self.ticks = ticks
+        self.collect = collect
+        self.window_h = window_h
+        self.window_w = window_w
+        self.encode = encode
+        self.processes = processes or os.cpu_count() or 1
+
+    def run(
+        self, params: Sequence[Any], seeds: Optional[Sequence[int]] = None
+    ) -> List[HeadlessReport]:
+        """Run one world per parameter set, in parallel worker processes.
+
+        Args:
+            params (Sequence[Any]): The parameters of each world.
+            seeds (Sequence[int], optional): The seed of each world. Defaults to None (the index
+                of the world), so a batch is reproducible.
+
+        Raises:
+            ValueError: If the number of seeds does not match the number of worlds.
+
+        Returns:
+            List[HeadlessReport]: The report of each world, in the order of `params`.
+        """
+        seeds = list(range(len(params))) if seeds is None else list(seeds)
+        if len(seeds) != len(params):
+            raise ValueError("Every world needs exactly one seed.")
+        if not params:
+            return []
+        with ProcessPoolExecutor(max_workers=min(self.processes, len(params))) as pool:
+            futures = [
+                pool.submit(
+                    _run_world,
+                    self.setup,
+                    self.collect,
+                    self.ticks,
+                    self.window_h,
+                    self.window_w,
+                    self.encode,
+                    world_params,
+                    seed,
+                )
+                for world_params, seed in zip(params, seeds)
+            ]
+            return [future.result() for future in futures]
+
+
+def _run_world(
+    setup: Callable[[NyxEngine, Any], Optional[Callable[[], None]]],
+    collect: Optional[Callable[[NyxEngine], Dict[str, Any]]],
+    ticks: int,
+    window_h: int,
+    window_w: int,
+    encode: bool,
+    params: Any,
+    seed: int,
+) -> HeadlessReport:
+    """Build and run one world on a new engine (in a worker process) and report it."""
+    engine = NyxEngine()
+    try:
+        # The scene is built from the world's seed too, not only the run
+        random.seed(seed)
+        np.random.seed(seed)
+        update = setup(engine, params)
+        report = engine.run_headless(
+            ticks, seed=seed, window_h=window_h, window_w=window_w, update=update, encode=encode
+        )
+        if collect is not None:
+            report.metrics = collect(engine)
+        return report
+    finally:
+        engine.shutdown()
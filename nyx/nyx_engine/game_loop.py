@@ -0,0 +1,242 @@
+"""
+Game Loop Module
+
+This module paces the engine on a monotonic clock. The simulation advances in fixed steps through
+an accumulator (so the tick rate does not depend on how long a tick or a frame takes), rendering
+runs at its own target rate, and every sleep targets an absolute deadline, so sleep overshoot never
+accumulates into drift. A `SimulatedClock` drives the same loop on virtual time, without sleeping
+(headless benchmarks and soak tests).
+
+Classes:
+    FramePacer: Sleeps until evenly spaced, absolute deadlines.
+    GameLoop: A fixed-timestep simulation loop with decoupled, paced rendering.
+    SimulatedClock: A virtual clock whose sleep advances time instantly.
+"""
+
+import time
+from typing import Callable, Optional
+
+
+class FramePacer:
+    """Sleeps until evenly spaced, absolute deadlines (`start + n * interval`).
+
+    Oversleeping one frame shortens the next sleep instead of delaying every later frame. When the
+    caller falls more than one interval behind, the deadlines are re-anchored to the present
+    rather than bursting to catch up.
+
+    Attributes:
+        interval (float): The time between deadlines, in seconds.
+        next_deadline (float): The clock time of the next deadline, or None before the first wait.
+        missed_deadlines (int): The number of times the caller fell behind and was re-anchored.
+
+    Methods:
+        wait: Sleep until the next deadline.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the pacer.
+
+        Args:
+            interval (float): The time between deadlines, in seconds.
+            clock (Callable[[], float], optional): A monotonic clock. Defaults to
+                `time.perf_counter`.
+            sleep (Callable[[float], None], optional): The sleep function. Defaults to `time.sleep`.
+
+        Raises:
+            ValueError: If the interval is not positive.
+        """
+        if interval <= 0:
+            raise ValueError("The pacing interval must be positive.")
+        self.interval = interval
+        self.next_deadline: Optional[float] = None
+        self.missed_deadlines = 0
+        self._clock = clock
+        self._sleep = sleep
+
+    def wait(self):
+        """Sleep until the next deadline, then schedule the one after it."""
+        now = self._clock()
+        if self.next_deadline is None:
+            self.next_deadline = now + self.interval
+        elif now - self.next_deadline > self.interval:
+            self.missed_deadlines += 1
+            self.next_deadline = now
+        delay = self.next_deadline - now
+        if delay > 0:
+            self._sleep(delay)
+        self.next_deadline += self.interval
+
+
+class GameLoop:
+    """A fixed-timestep simulation loop with decoupled, paced rendering.
+
+    Updates are scheduled on absolute deadlines (`next_tick += update_interval`): each iteration
+    runs one `update` per deadline that has passed, then renders if the next render deadline has
+    passed, passing `alpha = accumulator / update_interval` (how far real time is between the last
+    two simulation states) for interpolation. After a stall at most `max_catch_up_steps` updates
+    run; the time of the skipped updates is dropped instead of spiraling.
+
+    Attributes:
+        update_interval (float): The fixed simulation step, in seconds.
+        render_interval (float): The target time between rendered frames, in seconds.
+        max_catch_up_steps (int): The most updates run back-to-back to catch up.
+        accumulator (float): The real time since the last update not yet simulated, in seconds.
+        ticks (int): The number of updates run.
+        frames (int): The number of frames rendered.
+        dropped_time (float): The real time discarded by the catch-up cap, in seconds.
+        is_running (bool): If the loop is running (cleared by `stop`).
+
+    Methods:
+        run: Run the loop until `stop` is called or a limit is reached.
+        step: Run one iteration of the loop without sleeping.
+        stop: Ask the loop to exit after the current iteration.
+    """
+
+    def __init__(
+        self,
+        update: Callable[[], None],
+        render: Callable[[float], None],
+        update_interval: float,
+        render_interval: float,
+        max_catch_up_steps: int = 5,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the loop.
+
+        Args:
+            update (Callable[[], None]): Advances the simulation by one fixed step.
+            render (Callable[[float], None]): Renders a frame, given the interpolation alpha in
+                [0, 1).
+            update_interval (float): The fixed simulation step, in seconds.
+            render_interval (float): The target time between rendered frames, in seconds.
+            max_catch_up_steps (int, optional): The most updates run back-to-back to catch up.
+                Defaults to 5.
+            clock (Callable[[], float], optional): A monotonic clock. Defaults to
+                `time.perf_counter`.
+            sleep (Callable[[float], None], optional): The sleep function. Defaults to `time.sleep`.
+
+        Raises:
+            ValueError: If an interval or the catch-up cap is not positive.
+        """
+        if update_interval <= 0 or render_interval <= 0:
+            raise ValueError("The update and render intervals must be positive.")
+        if max_catch_up_steps < 1:
+            raise ValueError("At least one catch-up step is required.")
+        self.update = update
+        self.render = render
+        self.update_interval = update_interval
+        self.render_interval = render_interval
+        self.max_catch_up_steps = max_catch_up_steps
+        self.accumulator = 0.0
+        self.ticks = 0
+        self.frames = 0
+        self.dropped_time = 0.0
+        self.is_running = False
+        self._clock = clock
+        self._sleep = sleep
+        self._next_tick: Optional[float] = None
+        self._next_render: Optional[float] = None
+
+    def run(self, max_ticks: Optional[int] = None, max_seconds: Optional[float] = None):
+        """Run the loop until `stop` is called or a limit is reached, sleeping until the next
+        update or render deadline between iterations.
+
+        Args:
+            max_ticks (int, optional): Stop after this many updates. Defaults to None (no limit).
+            max_seconds (float, optional): Stop after this much real time. Defaults to None (no
+                limit).
+        """
+        self.is_running = True
+        start = self._clock()
+        while self.is_running:
+            self.step()
+            now = self._clock()
+            if (max_ticks is not None and self.ticks >= max_ticks) or (
+                max_seconds is not None and now - start >= max_seconds
+            ):
+                break
+            # Both deadlines are absolute: when one has already passed, the next step acts on it
+            delay = min(self._next_tick, self._next_render) - now
+            if delay > 0:
+                self._sleep(delay)
+        self.is_running = False
+
+    def step(self) -> int:
+        """Run one iteration of the loop without sleeping: the updates due, then a frame if the
+        render deadline has passed.
+
+        Returns:
+            int: The number of updates run.
+        """
+        now = self._clock()
+        if self._next_tick is None:
+            self._next_tick = now + self.update_interval
+            self._next_render = now
+
+        updates = 0
+        if now >= self._next_tick:
+            updates = int((now - self._next_tick) // self.update_interval) + 1
+            if updates > self.max_catch_up_steps:
+                skipped = updates - self.max_catch_up_steps
+                self.dropped_time += skipped * self.update_interval
+                self._next_tick += skipped * self.update_interval
+                updates = self.max_catch_up_steps
+            for _ in range(updates):
+                self.update()
+                self._next_tick += self.update_interval
+            self.ticks += updates
+
+        # The real time since the last update that has not been simulated yet
+        self.accumulator = min(
+            max(self.update_interval - (self._next_tick - now), 0.0), self.update_interval
+        )
+        if now >= self._next_render:
+            self.render(min(self.accumulator / self.update_interval, 1.0 - 1e-9))
+            self.frames += 1
+            self._next_render += self.render_interval
+            if self._next_render <= now:
+                # Fell behind: re-anchor the render deadlines instead of bursting frames
+                self._next_render = now + self.render_interval
+        return updates
+
+    def stop(self):
+        """Ask the loop to exit after the current iteration."""
+        self.is_running = False
+
+
+class SimulatedClock:
+    """A virtual clock whose sleep advances time instantly. Passed as both the `clock` and the
+    `sleep` of a `GameLoop`, the loop runs its exact update/render schedule as fast as possible
+    and deterministically, independent of how long the updates and frames really take.
+
+    Attributes:
+        now (float): The current virtual time, in seconds.
+
+    Methods:
+        sleep: Advance the virtual time.
+    """
+
+    def __init__(self, start: float = 0.0):
+        """Initialize the clock.
+
+        Args:
+            start (float, optional): The initial virtual time, in seconds. Defaults to 0.0.
+        """
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        """Advance the virtual time.
+
+        Args:
+            seconds (float): The time to advance by, in seconds.
+        """
+        self.now += seconds
@@ -0,0 +1,99 @@
+"""
+Headless Report Module
+
+This module holds the results of a headless engine run (`NyxEngine.run_headless`): the
+throughput of the simulation and of the frame pipeline, the size of the encoded frames, and the
+time spent in each stage of a tick and of a frame.
+
+Classes:
+    HeadlessReport: The throughput and per-stage timings of a headless run.
+"""
+
+from typing import Any, Dict, Optional
+
+
+class HeadlessReport:
+    """The throughput and per-stage timings of a headless run.
+
+    Attributes:
+        ticks (int): The number of game updates run.
+        frames (int): The number of frames rendered.
+        seconds (float): The wall time of the run, in seconds.
+        bytes_written (int): The number of bytes Hemera wrote to its sink (0 if frames were not
+            encoded).
+        stage_times (Dict[str, float]): The total wall time of each stage, in seconds. Tick stages
+            are `systems` (with a `system <label>` entry per system) and `commands`; frame stages
+            are `interpolate`, `camera`, `bridge`, `compose` and `encode`.
+        metrics (Dict[str, Any]): Game-specific results of the run (see `BatchRunner`).
+
+    Methods:
+        ticks_per_sec: The game updates run per second of wall time.
+        frames_per_sec: The frames rendered per second of wall time.
+        bytes_per_frame: The mean encoded size of a frame.
+        format: Format the report as a text table.
+    """
+
+    def __init__(
+        self,
+        ticks: int,
+        frames: int,
+        seconds: float,
+        bytes_written: int,
+        stage_times: Dict[str, float],
+        metrics: Optional[Dict[str, Any]] = None,
+    ):
+        """Initialize the report.
+
+        Args:
+            ticks (int): The number of game updates run.
+            frames (int): The number of frames rendered.
+            seconds (float): The wall time of the run, in seconds.
+            bytes_written (int): The number of bytes written by Hemera.
+            stage_times (Dict[str, float]): The total wall time of each stage, in seconds.
+            metrics (Dict[str, Any], optional): Game-specific results of the run. Defaults to
+                None (no metrics).
+        """
+        self.ticks = ticks
+        self.frames = frames
+        self.seconds = seconds
+        self.bytes_written = bytes_written
+        self.stage_times = stage_times
+        self.metrics: Dict[str, Any] = metrics if metrics is not None else {}
+
+    @property
+    def ticks_per_sec(self) -> float:
+        """The game updates run per second of wall time."""
+        return self.ticks / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def frames_per_sec(self) -> float:
+        """The frames rendered per second of wall time."""
+        return self.frames / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def bytes_per_frame(self) -> float:
+        """The mean encoded size of a frame, in bytes."""
+        return self.bytes_written / self.frames if self.frames else 0.0
+
+    def format(self) -> str:
+        """Format the report as a text table: the totals, then the mean time of each stage per
+        tick (tick stages) or per frame (frame stages) and its share of the run.
+
+        Returns:
+            str: The report.
+        """
+        lines = [
+            f"{self.ticks} ticks, {self.frames} frames in {self.seconds:.3f} s",
+            f"{self.ticks_per_sec:.1f} ticks/s, {self.frames_per_sec:.1f} frames/s, "
+            f"{self.bytes_per_frame:.0f} bytes/frame",
+        ]
+        for stage, total in self.stage_times.items():
+            is_tick_stage = stage in ("systems", "commands") or stage.startswith("system ")
+            count = self.ticks if is_tick_stage else self.frames
+            per = total / count if count else 0.0
+            share = total / self.seconds if self.seconds > 0 else 0.0
+            lines.append(
+                f"  {stage:32s} {per * 1000:9.3f} ms/{'tick' if is_tick_stage else 'frame'}"
+                f" {share:7.1%}"
+            )
+        return "\n".join(lines)
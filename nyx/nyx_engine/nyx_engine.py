@@ -3,21 +3,36 @@ NyxEngine Module
 
 This is the primary orchestration module of game-related tasks, systsems, and workflows.
 
+Every `NyxEngine` is an independent context (components, entities, systems, renderer and
+terminal output), so several worlds can run in one process. Systems are attached to the engine
+that runs them (`add_system`), and managers receive it on construction.
+
 Classes:
     NyxEngine: The primary orchestration module of game-related tasks, systsems, and workflows.
 """
 
+import random
 import time
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from nyx.aether_renderer.aether_dimensions import AetherDimensions
 from nyx.aether_renderer.aether_renderer import AetherRenderer
+from nyx.aether_renderer.texture_atlas import TextureAtlas
 from nyx.aether_renderer.tilemap_manager import TilemapManager
 from nyx.hemera_term_fx.hemera_term_fx import HemeraTermFx
+from nyx.hemera_term_fx.terminal_sink import TerminalSink
 from nyx.moirai_ecs.component.base_components import NyxComponent
 from nyx.moirai_ecs.component.component_manager import ComponentManager
+from nyx.moirai_ecs.component.component_query import ComponentQuery
 from nyx.moirai_ecs.entity.moirai_entity_manager import MoiraiEntityManager
 from nyx.moirai_ecs.system.aether_bridge_system import AetherBridgeSystem
+from nyx.moirai_ecs.system.camera_system import CameraSystem
+from nyx.moirai_ecs.system.command_buffer import CommandBuffer
+from nyx.moirai_ecs.system.system_scheduler import SystemScheduler
+from nyx.nyx_engine.game_loop import GameLoop, SimulatedClock
+from nyx.nyx_engine.headless_report import HeadlessReport
 
 
 if TYPE_CHECKING:
@@ -28,95 +43,340 @@ class NyxEngine:
     """The primary orchestration module of game-related tasks, systsems, and workflows.
 
     Attributes:
+        fps_target (int): The number of frames rendered per second.
+        sec_per_frame (float): The number of seconds per rendered frame.
         game_update_per_sec (int): The number of game updates per second.
-        sec_per_game_loop (float): The number of seconds per game loop.
+        sec_per_game_loop (float): The number of seconds per game loop (the fixed simulation step).
+        max_catch_up_steps (int): The most game updates run back-to-back after a stall.
+        game_loop (GameLoop): The loop of the running game (None until `run_game`).
         running_systems (list): A list of all running systems.
+        scheduler (SystemScheduler): Runs the systems each tick, concurrently where their declared
+            component reads/writes do not conflict.
         entity_manager (MoiraiEntityManager): The entity manager.
         component_manager (ComponentManager): The component manager.
+        commands (CommandBuffer): The structural changes deferred by systems until the end of
+            `trigger_systems`.
+        camera_system (CameraSystem): The world-to-viewport mapping and off-screen culling.
+        world_bounds (Tuple[int, int, int, int]): The (left, top, right, bottom) edges of the
+            world, beyond which `kill_entities` culls entities while a camera is active. None (the
+            default) keeps every off-screen entity of a camera world alive.
         aether_bridge (AetherBridgeSystem): The bridge between the ECS and the Aether renderer.
         aether_renderer (AetherRenderer): The Aether renderer/composition object.
         hemera_term_fx (HemeraTermFx): The Hemera terminal printer.
-        tilemap_manager (TilemapManager): The tilemap manager.
+        tilemap_manager (TilemapManager): The default tilemap layer (z-index 0).
+        texture_atlas (TextureAtlas): The shared atlas that sprite textures can be packed into.
+        encode_frames (bool): If rendered frames are encoded and written by Hemera (cleared for
+            composition-only headless runs).
+        stage_times (Dict[str, float]): The total wall time of each tick and frame stage while
+            profiling (see `HeadlessReport`), or None when not profiling.
 
     Methods:
         run_game(): The main game loop.
+        run_headless(): Run game updates and frames as fast as possible, without a terminal.
+        stop_game(): Stops the main game loop.
         add_system(): Adds a system to the running systems list.
-        trigger_systems(): Triggers all running systems.
+        trigger_systems(): Triggers all running systems, then applies their deferred commands.
         kill_entities(): Removes entities that are out of bounds.
         render_frame(): Renders the current frame.
+        query(): Get the cached set of entities holding every given component type.
+        shutdown(): Stops the scheduler's thread pool.
     """
 
-    # Singleton instance
-    _instance = None
+    def __init__(self):
+        self.is_running = False
+        self.fps_target = 30
+        self.sec_per_frame = 1 / self.fps_target
+        self.game_update_per_sec = 60
+        self.sec_per_game_loop = 1 / self.game_update_per_sec
+        self.max_catch_up_steps = 5
+        self.game_loop: Optional[GameLoop] = None
+        self.running_systems: List[BaseSystem] = []
+        self.scheduler: SystemScheduler = SystemScheduler()
+        self.component_manager: ComponentManager = ComponentManager()
+        self.component_registry: Dict[str, Dict[int, NyxComponent]]  = self.component_manager.component_registry
+        self.entity_manager: MoiraiEntityManager = MoiraiEntityManager(self)
+        self.commands: CommandBuffer = CommandBuffer()
+        self.camera_system: CameraSystem = CameraSystem().attach(self)
+        self.world_bounds: Optional[Tuple[int, int, int, int]] = None
+        self.aether_bridge: AetherBridgeSystem = AetherBridgeSystem().attach(self)
+        self.aether_renderer: AetherRenderer = AetherRenderer()
+        self.aether_dimensions: AetherDimensions = self.aether_renderer.dimensions
+        self.hemera_term_fx: HemeraTermFx = HemeraTermFx()
+        self.tilemap_manager: TilemapManager = TilemapManager(
+            dimensions=self.aether_dimensions
+        )
+        self.aether_renderer.add_tilemap(self.tilemap_manager)
+        self.texture_atlas: TextureAtlas = TextureAtlas()
+        self.encode_frames: bool = True
+        self.stage_times: Optional[Dict[str, float]] = None
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    def query(self, *component_names: str) -> ComponentQuery:
+        """Get the cached set of entities holding every given component type.
 
-    def __init__(self):
-        if not hasattr(self, "initialized"):
-            self.initialized = True
+        Args:
+            *component_names (str): The component types to match.
+
+        Returns:
+            ComponentQuery: The live query, maintained incrementally by the component manager.
+        """
+        return self.component_manager.query(*component_names)
+
+    def run_game(self, max_ticks: Optional[int] = None):
+        """The main game loop.
+
+        The systems are triggered at a fixed `game_update_per_sec` and frames are rendered at
+        `fps_target`, both paced on a monotonic clock (see `GameLoop`). Each frame interpolates
+        the render positions between the last two game updates.
+
+        Args:
+            max_ticks (int, optional): Stop after this many game updates. Defaults to None (run
+                until `stop_game`).
+        """
+        self.game_loop = GameLoop(
+            update=self.trigger_systems,
+            render=self.render_frame,
+            update_interval=self.sec_per_game_loop,
+            render_interval=self.sec_per_frame,
+            max_catch_up_steps=self.max_catch_up_steps,
+        )
+        self.is_running = True
+        try:
+            self.game_loop.run(max_ticks=max_ticks)
+        finally:
             self.is_running = False
-            self.fps_target = 30
-            self.sec_per_frame = 1 / self.fps_target
-            self.game_update_per_sec = 60
-            self.sec_per_game_loop = 1 / self.game_update_per_sec
-            self.running_systems: List[BaseSystem] = []
-            self.component_manager: ComponentManager = ComponentManager()
-            self.component_registry: Dict[str, Dict[int, NyxComponent]]  = self.component_manager.component_registry
-            self.entity_manager: MoiraiEntityManager = MoiraiEntityManager(self)
-            self.aether_bridge: AetherBridgeSystem = AetherBridgeSystem()
-            self.aether_renderer: AetherRenderer = AetherRenderer()
-            self.aether_dimensions: AetherDimensions = self.aether_renderer.dimensions
-            self.hemera_term_fx: HemeraTermFx = HemeraTermFx()
-            self.tilemap_manager: TilemapManager = TilemapManager(
-                dimensions=self.aether_dimensions
+
+    def run_headless(
+        self,
+        ticks: int,
+        seed: int = 0,
+        window_h: Optional[int] = None,
+        window_w: Optional[int] = None,
+        update: Optional[Callable[[], None]] = None,
+        encode: bool = True,
+        sink: Optional[TerminalSink] = None,
+    ) -> HeadlessReport:
+        """Run game updates and frames as fast as possible, without a terminal, and report the
+        throughput and per-stage timings.
+
+        The regular `GameLoop` schedule runs on a `SimulatedClock`, so the same updates, frames
+        and interpolation alphas as a real run happen without any sleeping, independent of the
+        machine's speed. The window size replaces the terminal size, and Hemera writes into a
+        `TerminalSink` instead of the terminal.
+
+        Args:
+            ticks (int): The number of game updates to run.
+            seed (int, optional): The seed of the `random` and `numpy.random` global generators,
+                set before the first update. Defaults to 0.
+            window_h (int, optional): The window height. Defaults to None (the current window).
+            window_w (int, optional): The window width. Defaults to None (the current window).
+            update (Callable[[], None], optional): Advances the game by one step (game logic, then
+                `trigger_systems`). Defaults to None (`trigger_systems`).
+            encode (bool, optional): Encode the frames with Hemera. Defaults to True.
+            sink (TerminalSink, optional): The sink Hemera writes to, e.g. an in-memory sink to
+                inspect the output. Defaults to None (a null sink).
+
+        Raises:
+            ValueError: If no window size is set (there is no terminal to size the frames).
+
+        Returns:
+            HeadlessReport: The throughput and per-stage timings of the run.
+        """
+        dimensions = self.aether_renderer.dimensions
+        saved = (
+            dimensions.window_h,
+            dimensions.window_w,
+            dimensions.headless,
+            self.hemera_term_fx.output,
+            self.encode_frames,
+            self.stage_times,
+        )
+        dimensions.window_h = dimensions.window_h if window_h is None else window_h
+        dimensions.window_w = dimensions.window_w if window_w is None else window_w
+        if dimensions.window_h <= 0 or dimensions.window_w <= 0:
+            dimensions.window_h, dimensions.window_w = saved[:2]
+            raise ValueError("A headless run requires a window size.")
+        sink = sink if sink is not None else TerminalSink()
+        bytes_before = sink.bytes_written
+        clock = SimulatedClock()
+        self.game_loop = GameLoop(
+            update=update or self.trigger_systems,
+            render=self.render_frame,
+            update_interval=self.sec_per_game_loop,
+            render_interval=self.sec_per_frame,
+            max_catch_up_steps=self.max_catch_up_steps,
+            clock=clock,
+            sleep=clock.sleep,
+        )
+        dimensions.headless = True
+        dimensions.update()
+        self.hemera_term_fx.output = sink
+        self.encode_frames = encode
+        self.stage_times = {}
+        random.seed(seed)
+        np.random.seed(seed)
+        self.is_running = True
+        start = time.perf_counter()
+        try:
+            self.game_loop.run(max_ticks=ticks)
+            return HeadlessReport(
+                ticks=self.game_loop.ticks,
+                frames=self.game_loop.frames,
+                seconds=time.perf_counter() - start,
+                bytes_written=sink.bytes_written - bytes_before,
+                stage_times=self.stage_times,
             )
+        finally:
+            self.is_running = False
+            (
+                dimensions.window_h,
+                dimensions.window_w,
+                dimensions.headless,
+                self.hemera_term_fx.output,
+                self.encode_frames,
+                self.stage_times,
+            ) = saved
+            dimensions.update()
 
-    def run_game(self):
-        """The main game loop."""
-        while True:
-            self.trigger_systems()
-            self.render_frame()
-            time.sleep(self.sec_per_game_loop)
+    def stop_game(self):
+        """Stops the main game loop after its current iteration."""
+        if self.game_loop is not None:
+            self.game_loop.stop()
 
     def add_system(self, system: "BaseSystem"):
-        """Adds a system to the running systems list.
+        """Attaches a system to the engine and adds it to the running systems list.
 
         Args:
             system ("BaseSystem"): The system to add.
+
+        Raises:
+            ValueError: If the system is attached to another engine.
         """
-        self.running_systems.append(system)
+        self.running_systems.append(system.attach(self))
+
+    def shutdown(self):
+        """Stops the scheduler's thread pool (it is recreated if the systems run again)."""
+        self.scheduler.shutdown()
 
     def trigger_systems(self):
-        """Triggers an update call on all running systems."""
-        for system in self.running_systems:
-            system.update()
+        """Triggers an update call on all running systems through the scheduler, then applies the
+        structural changes they recorded in the command buffer (the per-tick sync point)."""
+        start = time.perf_counter()
+        self.scheduler.run(self.running_systems, self.commands)
+        start = self._record_stage("systems", start)
+        if self.stage_times is not None:
+            for label, seconds in self.scheduler.timings.items():
+                key = f"system {label}"
+                self.stage_times[key] = self.stage_times.get(key, 0.0) + seconds
+        self.commands.flush(self.entity_manager)
+        self._record_stage("commands", start)
 
-    def kill_entities(self, bounds: int = 10):
-        """Removes entities that are out of bounds.
+    def kill_entities(self, bounds: int = 10, viewport: bool = False) -> np.ndarray:
+        """Removes entities that are out of bounds on any side of the window (or of the world,
+        while a camera is active).
+
+        The out-of-bounds mask is computed over the position (and dimensions) columns in one
+        vectorized pass, and the culled entities are destroyed with a single `destroy_many`.
 
         Args:
             bounds (int): The number of pixels outside the window to cull entities
+            viewport (bool, optional): While a camera is active, cull against the viewport instead
+                of `world_bounds`. Defaults to False.
+
+        Returns:
+            np.ndarray: The entity IDs that were culled.
+
+        Note:
+            With an active camera, entity positions are world coordinates and off-screen entities
+            stay alive (the camera culls them from rendering): only entities outside
+            `world_bounds` are removed, or none if it is unset. With `viewport=True`, the bounds
+            are measured from the viewport instead. Entities are culled on the left/top once their
+            right/bottom edge (from their dimensions component, if any) is more than `bounds`
+            pixels outside.
         """
-        cull_id_list = []
-        h, w = (
-            self.aether_renderer.dimensions.effective_window_h,
-            self.aether_renderer.dimensions.effective_window_w,
+        if self.camera_system.is_active and not viewport:
+            if self.world_bounds is None:
+                return np.empty(0, dtype=np.int64)
+            left, top, right, bottom = self.world_bounds
+        else:
+            left, top = 0, 0
+            if self.camera_system.is_active:
+                left = int(self.camera_system.camera.x_pos)
+                top = int(self.camera_system.camera.y_pos)
+            right = left + self.aether_renderer.dimensions.effective_window_w
+            bottom = top + self.aether_renderer.dimensions.effective_window_h
+
+        positions = self.component_registry["position"]
+        entity_ids = positions.dense_entity_ids
+        x = positions.column("render_x_pos")
+        y = positions.column("render_y_pos")
+        dimensions = self.component_registry["dimensions"]
+        dim_rows = dimensions.rows_of(entity_ids)
+        has_dims = dim_rows >= 0
+        width = np.zeros(entity_ids.size, dtype=np.int64)
+        height = np.zeros(entity_ids.size, dtype=np.int64)
+        width[has_dims] = dimensions.column("width")[dim_rows[has_dims]]
+        height[has_dims] = dimensions.column("height")[dim_rows[has_dims]]
+
+        out_of_bounds = (
+            (x >= right + bounds)
+            | (y >= bottom + bounds)
+            | (x + width < left - bounds)
+            | (y + height < top - bounds)
         )
-        for entity_id, comp in self.component_manager.component_registry[
-            "position"
-        ].items():
-            if comp.render_x_pos >= w + bounds or comp.render_y_pos >= h + bounds:
-                cull_id_list.append(entity_id)
-        for entity_id in cull_id_list:
-            self.entity_manager.destroy_entity(entity_id)
-
-    def render_frame(self):
-        """Renders the current frame."""
+        if not out_of_bounds.any():
+            return np.empty(0, dtype=np.int64)
+        return self.entity_manager.destroy_many(entity_ids[out_of_bounds].copy())
+
+    def render_frame(self, alpha: Optional[float] = None):
+        """Renders the current frame.
+
+        Args:
+            alpha (float, optional): How far real time is between the last two game updates, in
+                [0, 1); if given, each running system interpolates its render state first.
+                Defaults to None (render the latest game update as is).
+
+        Note:
+            The composition time is fed to the renderer's resolution scaler (against the
+            `sec_per_frame` budget), which lowers the internal render resolution when over budget.
+            The bridge and printing are not scale-dependent, so they do not drive the scaler.
+        """
+        stage_start = time.perf_counter()
+        if alpha is not None:
+            for system in self.running_systems:
+                system.interpolate(alpha)
+            stage_start = self._record_stage("interpolate", stage_start)
+        self.camera_system.update()
+        if self.camera_system.is_active:
+            camera = self.camera_system.camera
+            self.aether_renderer.scroll_tilemaps(camera.x_pos, camera.y_pos)
+        stage_start = self._record_stage("camera", stage_start)
         self.aether_bridge.update()
         renderable_entities = self.aether_bridge.renderable_entities
         self.aether_renderer.accept_entities(renderable_entities)
+        stage_start = self._record_stage("bridge", stage_start)
+        compose_start = stage_start
         new_frame = self.aether_renderer.render()
-        self.hemera_term_fx.print(new_frame)
+        stage_start = self._record_stage("compose", stage_start)
+        # Only composition gets cheaper at a coarser render scale (the bridge and encoding work on
+        # entities and the full-size upscaled frame), so only its time drives the scaler
+        scaler = self.aether_renderer.resolution_scaler
+        scaler.frame_budget = self.sec_per_frame
+        scaler.record_frame(stage_start - compose_start)
+        if self.encode_frames:
+            self.hemera_term_fx.print(new_frame)
+            self._record_stage("encode", stage_start)
+
+    def _record_stage(self, stage: str, start: float) -> float:
+        """Add the time since `start` to a stage's total while profiling.
+
+        Args:
+            stage (str): The stage name.
+            start (float): The `time.perf_counter` time the stage started.
+
+        Returns:
+            float: The current `time.perf_counter` time (the start of the next stage).
+        """
+        now = time.perf_counter()
+        if self.stage_times is not None:
+            self.stage_times[stage] = self.stage_times.get(stage, 0.0) + now - start
+        return now
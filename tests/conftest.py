@@ -0,0 +1,12 @@
+import pytest
+
+from nyx.nyx_engine.nyx_engine import NyxEngine
+
+
+@pytest.fixture
+def fresh_engine():
+    """An independent engine (empty components, entities, systems, renderer and camera) for the
+    duration of a test."""
+    engine = NyxEngine()
+    yield engine
+    engine.shutdown()
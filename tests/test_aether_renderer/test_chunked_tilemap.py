@@ -0,0 +1,55 @@
+import numpy as np
+
+from nyx.aether_renderer.aether_dimensions import AetherDimensions
+from nyx.aether_renderer.chunked_tilemap import ChunkedTilemap
+from nyx.aether_renderer.tilemap_manager import TilemapManager
+
+
+def test_get_block_matches_wrapped_array(tmp_path):
+    """Test that blocks spanning chunk and world edges match the wrapped in-memory tilemap."""
+    world = np.random.default_rng(0).integers(0, 256, size=(37, 53)).astype(np.uint8)
+    path = tmp_path / "world.npy"
+    ChunkedTilemap.save(path, world)
+    chunked = ChunkedTilemap.open(path, chunk_size=8, max_chunks=4, prefetch=False)
+
+    rows, cols = np.arange(30, 45), np.arange(-5, 12)
+    np.testing.assert_array_equal(
+        chunked.get_block(rows, cols), world[np.ix_(rows % 37, cols % 53)]
+    )
+    assert isinstance(chunked.source, np.memmap)
+    assert len(chunked.chunks) <= 4
+    assert chunked.chunks_evicted == chunked.chunks_loaded - len(chunked.chunks)
+
+
+def test_prefetch_loads_chunks_ahead(tmp_path):
+    """Test that the chunks ahead of the direction of motion are loaded in the background."""
+    path = tmp_path / "world.npy"
+    ChunkedTilemap.save(path, np.arange(64 * 64, dtype=np.uint16).reshape(64, 64))
+    chunked = ChunkedTilemap.open(path, chunk_size=16, max_chunks=8)
+    chunked.prefetch(0, 0, 8, 8, dir_y=0, dir_x=1)
+    chunked.close()
+    assert (0, 1) in chunked.chunks
+    assert (0, 0) not in chunked.chunks
+
+
+def test_tilemap_manager_streams_chunked_tilemap(tmp_path):
+    """Test that a chunked tilemap renders the same pixels as the in-memory array."""
+    rng = np.random.default_rng(2)
+    tiles = {i: rng.integers(1, 256, size=(4, 4), dtype=np.uint8) for i in range(8)}
+    world = rng.integers(0, 8, size=(40, 40)).astype(np.uint8)
+    path = tmp_path / "world.npy"
+    ChunkedTilemap.save(path, world)
+    dimensions = AetherDimensions()
+    dimensions.effective_window_h, dimensions.effective_window_w = 12, 16
+
+    frames = []
+    for tilemap in (world, ChunkedTilemap.open(path, chunk_size=8, max_chunks=6)):
+        manager = TilemapManager(dimensions)
+        manager.set_tileset(tiles, 4)
+        manager.set_tilemap(tilemap)
+        for step in range(30):
+            manager.pos_x += 5
+            manager.pos_y += step % 3
+            manager.render()
+            frames.append(manager.rendered_tilemap.copy())
+    np.testing.assert_array_equal(np.stack(frames[:30]), np.stack(frames[30:]))
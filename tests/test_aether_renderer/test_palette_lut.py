@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from nyx.aether_renderer.aether_renderer import AetherRenderer
+from nyx.aether_renderer.palette_lut import PaletteLUT
+
+
+def test_identity_lut_short_circuits():
+    """Test that setting an identity LUT disables post-processing."""
+    renderer = AetherRenderer()
+    renderer.set_post_process_lut(np.arange(256, dtype=np.uint8))
+    assert renderer.post_process_lut is None
+    renderer.set_post_process_lut(PaletteLUT.fade(1.0))
+    assert renderer.post_process_lut is None
+
+
+def test_compose_applies_left_to_right():
+    """Test that a composed LUT equals applying each LUT in order."""
+    first = PaletteLUT.cycle(16, 231, 5)
+    second = PaletteLUT.tint(196, 0.5)
+    frame = np.arange(256, dtype=np.uint8)
+    np.testing.assert_array_equal(
+        PaletteLUT.compose(first, second)[frame], second[first[frame]]
+    )
+
+
+def test_builders_are_cached_and_read_only():
+    """Test that effect LUTs are cached per parameter and cannot be modified."""
+    assert PaletteLUT.fade(0.5) is PaletteLUT.fade(0.5)
+    with pytest.raises(ValueError):
+        PaletteLUT.fade(0.5)[1] = 0
+
+
+def test_effects_keep_empty_pixel():
+    """Test that color 0 (empty pixel) is never remapped by effects."""
+    assert PaletteLUT.fade(0.0)[0] == 0
+    assert PaletteLUT.tint(21, 1.0)[0] == 0
+    assert PaletteLUT.fade(0.0)[231] == 16
+
+
+def test_post_process_is_applied_in_place():
+    """Test that the post-process stage remaps the merged frame in place."""
+    renderer = AetherRenderer()
+    lut = PaletteLUT.from_mapping({5: 9})
+    renderer.set_post_process_lut(lut)
+    frame = np.full((4, 4), 5, dtype=np.uint8)
+    renderer.merged_frame = frame
+    renderer._apply_post_process()
+    assert renderer.merged_frame is frame
+    assert (frame == 9).all()
@@ -0,0 +1,42 @@
+import numpy as np
+
+from nyx.aether_renderer.particle_pool import ParticlePool
+
+
+def test_emit_respects_capacity():
+    """Test that emitting beyond capacity drops the extra particles."""
+    pool = ParticlePool(capacity=10)
+    assert pool.emit(np.arange(8), 0.0) == 8
+    assert pool.emit(np.arange(8), 0.0) == 2
+    assert len(pool) == 10
+
+
+def test_update_integrates_positions():
+    """Test that positions advance by velocity * dt."""
+    pool = ParticlePool(capacity=4)
+    pool.emit(x_pos=[0.0, 10.0], y_pos=5.0, x_vel=[10.0, -10.0], y_vel=2.0, lifetime=np.inf)
+    pool.update(0.5)
+    np.testing.assert_allclose(pool.x_pos[:2], [5.0, 5.0])
+    np.testing.assert_allclose(pool.y_pos[:2], [6.0, 6.0])
+
+
+def test_expired_particles_are_swap_removed():
+    """Test that expired particles are removed and the survivors stay packed at the front."""
+    pool = ParticlePool(capacity=8)
+    lifetimes = np.array([0.1, 5.0, 0.1, 5.0, 5.0, 0.1, 5.0, 0.1], dtype=np.float32)
+    pool.emit(x_pos=np.arange(8), y_pos=0.0, lifetime=lifetimes)
+    assert pool.update(0.5) == 4
+    assert len(pool) == 4
+    assert sorted(pool.x_pos[:4].tolist()) == [1.0, 3.0, 4.0, 6.0]
+    assert (pool.lifetime[:4] > 0).all()
+
+
+def test_rasterize_clips_to_frame():
+    """Test that visible particles are drawn and off-frame particles are skipped."""
+    pool = ParticlePool(capacity=4)
+    pool.emit(x_pos=[1.5, -3.0, 2.0, 50.0], y_pos=[2.0, 1.0, 0.0, 1.0], color=[7, 8, 9, 10])
+    frame = np.zeros((4, 4), dtype=np.uint8)
+    pool.rasterize(frame)
+    assert frame[2, 1] == 7
+    assert frame[0, 2] == 9
+    assert np.count_nonzero(frame) == 2
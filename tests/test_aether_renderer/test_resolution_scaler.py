@@ -0,0 +1,56 @@
+import numpy as np
+
+from nyx.aether_renderer.aether_renderer import AetherRenderer
+from nyx.aether_renderer.resolution_scaler import ResolutionScaler
+
+
+def test_scaler_disabled_keeps_native_scale():
+    """Test that a disabled controller never changes the scale."""
+    scaler = ResolutionScaler(frame_budget=0.01, settle_frames=1)
+    for _ in range(20):
+        assert scaler.record_frame(1.0) == 1
+
+
+def test_scaler_increases_and_decreases_scale():
+    """Test that sustained slow frames coarsen the scale and fast frames refine it again."""
+    scaler = ResolutionScaler(frame_budget=0.01, settle_frames=3, enabled=True)
+    for _ in range(3):
+        scaler.record_frame(0.05)
+    assert scaler.scale == 2
+    for _ in range(50):
+        scaler.record_frame(0.001)
+    assert scaler.scale == 1
+    assert scaler.get_telemetry()["scale_changes"] == 2
+
+
+def test_scaler_respects_max_scale():
+    """Test that the scale never exceeds the configured maximum."""
+    scaler = ResolutionScaler(frame_budget=0.01, max_scale=2, settle_frames=1, enabled=True)
+    for _ in range(20):
+        scaler.record_frame(1.0)
+    assert scaler.scale == 2
+
+
+def test_scale_sprite_samples_on_frame_grid():
+    """Test that sprites are point-sampled on the internal pixel grid."""
+    texture = np.arange(16, dtype=np.uint8).reshape(4, 4)
+    x, y, sampled = AetherRenderer._scale_sprite(3, 2, texture, 2)
+    # Window pixel (y=2, x=4) is the first sampled pixel -> texture[0, 1]
+    assert (x, y) == (2, 1)
+    np.testing.assert_array_equal(sampled, texture[0::2, 1::2])
+
+
+def test_upscale_frame_fills_effective_window():
+    """Test that the internal frame is integer-upscaled and cropped to the window."""
+    renderer = AetherRenderer()
+    renderer.dimensions.render_scale = 2
+    renderer.dimensions.update()
+    h, w = renderer.dimensions.render_h, renderer.dimensions.render_w
+    internal_frame = np.arange(h * w, dtype=np.uint8).reshape(h, w)
+    renderer.merged_frame = internal_frame
+    renderer._upscale_frame()
+
+    eff_h = renderer.dimensions.effective_window_h
+    eff_w = renderer.dimensions.effective_window_w
+    expected = np.repeat(np.repeat(internal_frame, 2, axis=0), 2, axis=1)[:eff_h, :eff_w]
+    np.testing.assert_array_equal(renderer.merged_frame, expected)
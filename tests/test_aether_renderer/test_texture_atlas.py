@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from nyx.aether_renderer.aether_renderer import AetherRenderer
+from nyx.aether_renderer.texture_atlas import TextureAtlas
+from nyx.moirai_ecs.component.texture_components import TextureComponent
+
+
+def test_regions_do_not_overlap():
+    """Test that packed regions keep their own pixels."""
+    atlas = TextureAtlas(page_h=32, page_w=32)
+    textures = {
+        f"tex-{i}": np.full((4 + i % 5, 3 + i % 7), i + 1, dtype=np.uint8)
+        for i in range(40)
+    }
+    regions = atlas.add_many(textures)
+    for name, texture in textures.items():
+        np.testing.assert_array_equal(regions[name].texture, texture)
+    assert len(atlas.pages) > 1
+
+
+def test_oversized_texture_gets_dedicated_page():
+    """Test that a texture larger than a page is packed on a page of its own size."""
+    atlas = TextureAtlas(page_h=8, page_w=8)
+    region = atlas.add("big", np.ones((10, 12), dtype=np.uint8))
+    small = atlas.add("small", np.full((2, 2), 7, dtype=np.uint8))
+    assert atlas.pages[region.page_index].shape == (10, 12)
+    assert small.page_index != region.page_index
+    np.testing.assert_array_equal(region.texture, np.ones((10, 12)))
+
+
+def test_duplicate_name_returns_existing_region():
+    """Test that adding the same name twice does not pack the texture again."""
+    atlas = TextureAtlas()
+    first = atlas.add("laser", np.ones((3, 8), dtype=np.uint8))
+    assert atlas.add("laser", np.zeros((3, 8), dtype=np.uint8)) is first
+    with pytest.raises(KeyError):
+        atlas.get_region("missing")
+
+
+def test_texture_component_references_region():
+    """Test that a component built from a region shares the atlas memory."""
+    atlas = TextureAtlas()
+    region = atlas.add("laser", np.ones((3, 8), dtype=np.uint8))
+    component = TextureComponent(region=region)
+    assert component.region is region
+    assert np.shares_memory(component.texture, atlas.pages[0])
+
+
+@pytest.mark.parametrize("scale", [1, 2, 3])
+def test_batched_blit_matches_single_blits(scale):
+    """Test that a batched blit draws the same subframe as drawing each sprite on its own."""
+    rng = np.random.default_rng(0)
+    texture = rng.integers(1, 255, size=(5, 7), dtype=np.uint8)
+    xs = rng.integers(-8, 20, size=30)
+    ys = rng.integers(-8, 20, size=30)
+
+    batched = AetherRenderer()
+    batched.dimensions.render_scale = scale
+    batched.dimensions.update()
+    batched.layered_entities = {1: [(xs, ys, texture)]}
+    batched._process_layers()
+
+    single = AetherRenderer()
+    single.dimensions.render_scale = scale
+    single.dimensions.update()
+    single.layered_entities = {1: [(int(x), int(y), texture) for x, y in zip(xs, ys)]}
+    single._process_layers()
+
+    np.testing.assert_array_equal(batched.layered_frames[1], single.layered_frames[1])
@@ -0,0 +1,162 @@
+import numpy as np
+
+from nyx.aether_renderer.aether_dimensions import AetherDimensions
+from nyx.aether_renderer.aether_renderer import AetherRenderer
+from nyx.aether_renderer.tilemap_manager import TilemapManager
+
+
+def _make_manager(frame_h: int, frame_w: int, tile_d: int = 4, seed: int = 0):
+    """Create a tilemap manager over a random tileset/tilemap with a fixed frame size."""
+    rng = np.random.default_rng(seed)
+    tiles = {i: rng.integers(1, 256, size=(tile_d, tile_d), dtype=np.uint8) for i in range(8)}
+    ref_tilemap = rng.integers(0, 8, size=(5, 7)).astype(np.uint8)
+    dimensions = AetherDimensions()
+    dimensions.effective_window_h, dimensions.effective_window_w = frame_h, frame_w
+    manager = TilemapManager(dimensions)
+    manager.set_tileset(tiles, tile_d)
+    manager.set_tilemap(ref_tilemap)
+    return manager, tiles, ref_tilemap
+
+
+def _wrapped_render(tiles, ref_tilemap, tile_d, pos_y, pos_x, frame_h, frame_w):
+    """Reference implementation: look up the tile of every frame pixel in the wrapped tilemap."""
+    ys = (np.arange(frame_h) + pos_y)[:, None]
+    xs = (np.arange(frame_w) + pos_x)[None, :]
+    ref_h, ref_w = ref_tilemap.shape
+    tile_ids = ref_tilemap[(ys // tile_d) % ref_h, (xs // tile_d) % ref_w]
+    textures = np.zeros((max(tiles) + 1, tile_d, tile_d), dtype=np.uint8)
+    for tile_id, texture in tiles.items():
+        textures[tile_id] = texture
+    return textures[tile_ids, ys % tile_d, xs % tile_d]
+
+
+def test_scrolling_matches_wrapped_render():
+    """Test that scrolling in every direction matches a brute-force wrapped render."""
+    manager, tiles, ref_tilemap = _make_manager(frame_h=10, frame_w=13)
+    ref_before = ref_tilemap.copy()
+    for dy, dx in [(0, 1)] * 9 + [(1, 0)] * 6 + [(-3, -2)] * 4 + [(0, 25), (-17, 0)]:
+        manager.pos_y += dy
+        manager.pos_x += dx
+        manager.render()
+        np.testing.assert_array_equal(
+            manager.rendered_tilemap,
+            _wrapped_render(tiles, ref_tilemap, 4, manager.pos_y, manager.pos_x, 10, 13),
+        )
+    np.testing.assert_array_equal(manager.ref_tilemap, ref_before)
+
+
+def test_scroll_rasterizes_only_exposed_tiles():
+    """Test that sub-tile scrolls reuse the cache and tile crossings rasterize one column."""
+    manager, _, _ = _make_manager(frame_h=8, frame_w=12)
+    manager.render()
+    assert manager.tiles_rasterized == 3 * 4
+    manager.pos_x += 1
+    manager.render()
+    assert manager.tiles_rasterized == 0
+    manager.pos_x += 3
+    manager.render()
+    assert manager.tiles_rasterized == 3
+
+    manager.set_tilemap(np.zeros((2, 2), dtype=np.uint8))
+    manager.render()
+    assert manager.tiles_rasterized == 3 * 4
+
+
+def test_parallax_layers_merge_and_reuse_caches():
+    """Test that stacked tilemaps scroll by their parallax and unmoved layers are not recomposited."""
+    renderer = AetherRenderer()
+    rng = np.random.default_rng(3)
+    back = TilemapManager(renderer.dimensions, z_index=0, parallax=0.5)
+    back.set_tileset({i: rng.integers(1, 256, size=(4, 4), dtype=np.uint8) for i in range(4)}, 4)
+    back.set_tilemap(rng.integers(0, 4, size=(6, 6)).astype(np.uint8))
+    front = TilemapManager(renderer.dimensions, z_index=1)
+    front.set_tileset({0: np.zeros((4, 4), dtype=np.uint8), 1: np.full((4, 4), 7, np.uint8)}, 4)
+    front.set_tilemap(np.array([[0, 1], [1, 0]], dtype=np.uint8))
+    renderer.add_tilemap(back)
+    renderer.add_tilemap(front)
+
+    renderer.scroll_tilemaps(10, 6)
+    frame = renderer.render()
+    assert (back.pos_x, back.pos_y, front.pos_x, front.pos_y) == (5, 3, 10, 6)
+    np.testing.assert_array_equal(
+        frame,
+        np.where(front.rendered_tilemap == 0, back.rendered_tilemap, front.rendered_tilemap),
+    )
+    assert front.render() is False
+
+    # An opaque top layer still shows the layers below through its color-0 pixels
+    front.transparent = False
+    frame = renderer.render()
+    assert renderer.opaque_z_index == 1
+    np.testing.assert_array_equal(
+        frame,
+        np.where(front.rendered_tilemap == 0, back.rendered_tilemap, front.rendered_tilemap),
+    )
+    # Without color-0 holes, the opaque layer hides everything below it
+    front.set_tilemap(np.ones((2, 2), dtype=np.uint8))
+    frame = renderer.render()
+    np.testing.assert_array_equal(frame, front.rendered_tilemap)
+
+
+def test_animate_rewrites_only_animated_cells():
+    """Test that an animation tick rewrites only the animated cells and matches a full render."""
+    frames = [np.full((4, 4), color, dtype=np.uint8) for color in (50, 60, 70)]
+    manager, tiles, _ = _make_manager(frame_h=8, frame_w=12)
+    ref_tilemap = np.zeros((5, 7), dtype=np.uint8)
+    ref_tilemap[1, 2] = ref_tilemap[3, 5] = 9
+    manager.set_tileset(tiles, 4, animations={9: (frames, 0.5)})
+    manager.set_tilemap(ref_tilemap)
+    manager.pos_x, manager.pos_y = 3, 2
+    manager.render()
+
+    assert manager.animate(0.25) == 0
+    # Only the instance at (1, 2) is inside the cached view; (3, 5) is off-screen
+    assert manager.animate(0.25) == 1
+    animated = {**tiles, 9: frames[1]}
+    np.testing.assert_array_equal(
+        manager.rendered_tilemap, _wrapped_render(animated, ref_tilemap, 4, 2, 3, 8, 12)
+    )
+    # Scrolling after the tick rasterizes newly exposed tiles with the current frame
+    manager.pos_x += 20
+    manager.render()
+    np.testing.assert_array_equal(
+        manager.rendered_tilemap, _wrapped_render(animated, ref_tilemap, 4, 2, 23, 8, 12)
+    )
+
+
+def test_resize_within_the_same_tile_count_recomposes():
+    """Test that a window resize that keeps the tile count still renders at the new frame size."""
+    rng = np.random.default_rng(5)
+    renderer = AetherRenderer(window_h=340, window_w=100)
+    renderer.dimensions.headless = True
+    layer = TilemapManager(renderer.dimensions)
+    layer.set_tileset({i: rng.integers(1, 256, size=(32, 32), dtype=np.uint8) for i in range(4)}, 32)
+    layer.set_tilemap(rng.integers(0, 4, size=(12, 4)).astype(np.uint8))
+    renderer.add_tilemap(layer)
+    renderer.render()
+
+    renderer.dimensions.window_h = 350
+    frame = renderer.render()
+
+    assert frame.shape == layer.rendered_tilemap.shape == (350, 100)
+    np.testing.assert_array_equal(
+        frame, _wrapped_render(layer.tileset_textures, layer.ref_tilemap, 32, 0, 0, 350, 100)
+    )
+
+
+def test_coarse_render_scale_composes_internal_frame():
+    """Test that a coarser render scale composes only the sampled pixels, without re-rasterizing."""
+    manager, tiles, ref_tilemap = _make_manager(frame_h=10, frame_w=13)
+    manager.render()
+    manager.dimensions.render_scale = 3
+    for dx in (0, 2, 5):
+        manager.pos_x += dx
+        assert manager.render()
+        full = _wrapped_render(tiles, ref_tilemap, 4, manager.pos_y, manager.pos_x, 10, 13)
+        np.testing.assert_array_equal(manager.rendered_tilemap, full[::3, ::3])
+    assert manager.rendered_tilemap.shape == (4, 5)
+    assert not manager.render()
+
+    manager.dimensions.render_scale = 1
+    assert manager.render() and manager.tiles_rasterized == 0
+    assert manager.rendered_tilemap.shape == (10, 13)
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from nyx.aether_renderer.tileset import Tileset
+
+
+def _loop_fill(tileset: dict, ref_tilemap: np.ndarray, tile_d: int) -> np.ndarray:
+    """Reference implementation: one slice assignment per tile."""
+    h, w = ref_tilemap.shape
+    filled = np.zeros((h * tile_d, w * tile_d), dtype=np.uint8)
+    for y in range(h):
+        for x in range(w):
+            filled[y * tile_d : (y + 1) * tile_d, x * tile_d : (x + 1) * tile_d] = tileset[
+                ref_tilemap[y, x]
+            ]
+    return filled
+
+
+def test_fill_matches_per_tile_loop():
+    """Test that the vectorized fill produces the same pixels as the per-tile loop."""
+    rng = np.random.default_rng(1)
+    tiles = {i: rng.integers(0, 256, size=(8, 8), dtype=np.uint8) for i in range(1, 17)}
+    ref_tilemap = rng.integers(1, 17, size=(7, 11)).astype(np.uint8)
+    tileset = Tileset.from_dict(tiles)
+    np.testing.assert_array_equal(
+        tileset.fill(ref_tilemap), _loop_fill(tiles, ref_tilemap, 8)
+    )
+
+
+def test_fill_reuses_output_buffer():
+    """Test that a correctly shaped output buffer is written in place."""
+    tileset = Tileset.from_dict({0: np.ones((4, 4), dtype=np.uint8)})
+    buffer = np.empty((8, 12), dtype=np.uint8)
+    assert tileset.fill(np.zeros((2, 3), dtype=np.uint8), out=buffer) is buffer
+    assert (buffer == 1).all()
+
+
+def test_unknown_tile_ids_are_blank():
+    """Test that tile IDs without a texture render as transparent."""
+    tileset = Tileset.from_dict({1: np.full((2, 2), 9, dtype=np.uint8)})
+    filled = tileset.fill(np.array([[1, 200]], dtype=np.uint8))
+    assert (filled[:, :2] == 9).all()
+    assert (filled[:, 2:] == 0).all()
+
+
+def test_non_square_tiles_are_rejected():
+    """Test that tiles must be square uint8 textures."""
+    with pytest.raises(ValueError):
+        Tileset(np.zeros((2, 4, 3), dtype=np.uint8), np.array([0, 1]))
+
+
+def test_uint16_tile_ids():
+    """Test that 16-bit tile IDs are filled and that IDs beyond the table render blank."""
+    tiles = {300: np.full((2, 2), 3, dtype=np.uint8), 65000: np.full((2, 2), 4, dtype=np.uint8)}
+    tileset = Tileset.from_dict(tiles)
+    filled = tileset.fill(np.array([[300, 65000, 65535]], dtype=np.uint16))
+    np.testing.assert_array_equal(filled[0], [3, 3, 4, 4, 0, 0])
+    report = tileset.memory_report()
+    assert report["textures"] == 2 * 3 * 2 and report["total"] == tileset.nbytes
+    with pytest.raises(ValueError):
+        Tileset.from_dict({70000: np.zeros((2, 2), dtype=np.uint8)})
+
+
+def test_sparse_16bit_ids_use_compact_lookup():
+    """Test that the lookup table of a few sparse 16-bit IDs uses one byte per ID."""
+    tile_ids = (3, 900, 12000, 31000, 40000)
+    tiles = {tile_id: np.full((4, 4), i + 1, dtype=np.uint8) for i, tile_id in enumerate(tile_ids)}
+    tileset = Tileset.from_dict(tiles)
+    assert tileset.lookup.dtype == np.uint8
+    assert tileset.memory_report()["lookup"] == 40002
+    frame = tileset.fill(np.array([[40000, 7], [3, 65535]], dtype=np.uint16))
+    assert (frame[0, 0], frame[0, 4], frame[4, 0], frame[4, 4]) == (5, 0, 1, 0)
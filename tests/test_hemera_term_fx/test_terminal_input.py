@@ -0,0 +1,63 @@
+import os
+import pty
+import termios
+import time
+
+import pytest
+
+from nyx.hemera_term_fx.terminal_input import KeyParser, KeyRingBuffer, TerminalInput
+
+
+def wait_for_keys(terminal_input, count, timeout=2.0):
+    """Drain keys until `count` arrived or the timeout expires."""
+    keys = []
+    deadline = time.monotonic() + timeout
+    while len(keys) < count and time.monotonic() < deadline:
+        keys += terminal_input.drain()
+        time.sleep(0.005)
+    return keys
+
+
+@pytest.fixture
+def pty_pair():
+    master, slave = pty.openpty()
+    yield master, slave
+    os.close(master)
+    os.close(slave)
+
+
+def test_key_parser_handles_sequences_split_across_reads():
+    """Test that keys, escape sequences and UTF-8 split across reads parse into key names."""
+    parser = KeyParser()
+
+    assert parser.feed(b"a\r\x7f\x01\x1b[") == ["a", "enter", "backspace", "ctrl+a"]
+    assert parser.feed(b"A\x1b[5~\x1bOP\x1bx\xc3") == ["up", "page-up", "f1", "alt+x"]
+    assert parser.feed(b"\xa9\x1b") == ["é"]
+    assert parser.flush() == ["escape"]
+
+
+def test_key_ring_buffer_drops_when_full():
+    """Test that a full ring buffer drops new keys instead of overwriting unread ones."""
+    ring = KeyRingBuffer(capacity=2)
+
+    assert ring.push("a") and ring.push("b") and not ring.push("c")
+    assert ring.drain() == ["a", "b"] and ring.dropped == 1
+    assert ring.push("d") and ring.drain() == ["d"]
+
+
+def test_terminal_input_reads_keys_from_a_pty(pty_pair):
+    """Test that keys typed on a pseudo-terminal are buffered in cbreak mode and the terminal
+    settings are restored when the reader stops, even on an exception."""
+    master, slave = pty_pair
+    saved = termios.tcgetattr(slave)
+
+    with pytest.raises(RuntimeError):
+        with TerminalInput(fd=slave, escape_timeout=0.01) as terminal_input:
+            assert not termios.tcgetattr(slave)[3] & (termios.ICANON | termios.ECHO)
+            os.write(master, b"q\x1b[B\x1b")
+            keys = wait_for_keys(terminal_input, 3)
+            raise RuntimeError("game crashed")
+
+    assert keys == ["q", "down", "escape"]
+    assert not terminal_input.is_running
+    assert termios.tcgetattr(slave) == saved
@@ -1,3 +1,5 @@
+import threading
+
 from nyx.moirai_ecs.component.component_manager import ComponentManager
 from nyx.moirai_ecs.component.transform_components import (
     DimensionsComponent,
@@ -102,3 +104,41 @@ def test_remove_entity():
 
     for sub_dict in component_manager.component_registry.values():
         assert entity_id not in sub_dict.keys()
+
+
+def test_remove_entity_sweeps_components_written_directly():
+    """Test that components written straight into the registry (bypassing the bitmask) are removed"""
+    component_manager = ComponentManager()
+    registry = component_manager.component_registry
+    component_manager.add_component(
+        entity_id=1, component_name="position", component=PositionComponent(5, 5)
+    )
+    registry["dimensions"][1] = DimensionsComponent(10, 10)
+    registry["z-index"][2] = ZIndexComponent(4)
+    registry["dimensions"][2] = DimensionsComponent(3, 3)
+
+    component_manager.remove_entity(entity_id=1)
+    component_manager.remove_entities([2])
+
+    for sub_dict in registry.values():
+        assert 1 not in sub_dict.keys() and 2 not in sub_dict.keys()
+
+
+def test_concurrent_query_creation_registers_one_query():
+    """Test that threads creating the same new query at once (parallel systems) share one query"""
+    component_manager = ComponentManager()
+    barrier = threading.Barrier(8)
+    results = []
+
+    def create():
+        barrier.wait(timeout=5)
+        results.append(component_manager.query("position", "velocity"))
+
+    threads = [threading.Thread(target=create) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8 and all(query is results[0] for query in results)
+    assert len(component_manager._queries_by_component["position"]) == 1
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from nyx.moirai_ecs.component.component_manager import ComponentManager
+from nyx.moirai_ecs.component.transform_components import (
+    PositionComponent,
+    VelocityComponent,
+    ZIndexComponent,
+)
+
+
+def test_query_is_maintained_incrementally():
+    """Test that a cached query follows component additions and removals."""
+    component_manager = ComponentManager()
+    for entity_id in range(3):
+        component_manager.add_component(entity_id, "position", PositionComponent())
+    component_manager.add_component(1, "velocity", VelocityComponent())
+    query = component_manager.query("position", "velocity")
+    assert query.entity_ids.tolist() == [1]
+    assert component_manager.query("velocity", "position") is query
+
+    component_manager.add_component(2, "velocity", VelocityComponent())
+    component_manager.add_component(2, "z-index", ZIndexComponent(1))
+    component_manager.remove_component(1, "position")
+    assert sorted(query) == [2]
+    component_manager.remove_entity(2)
+    assert len(query) == 0 and query.entity_ids.size == 0
+
+    with pytest.raises(KeyError):
+        component_manager.query("no-such-component")
+
+
+def test_query_ids_are_contiguous_after_removals():
+    """Test that removals swap the last entity into the freed slot."""
+    component_manager = ComponentManager()
+    query = component_manager.query("z-index")
+    for entity_id in range(100):
+        component_manager.add_component(entity_id, "z-index", ZIndexComponent(0))
+    for entity_id in range(0, 100, 2):
+        component_manager.remove_component(entity_id, "z-index")
+    np.testing.assert_array_equal(np.sort(query.entity_ids), np.arange(1, 100, 2))
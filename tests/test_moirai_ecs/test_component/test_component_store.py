@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from nyx.moirai_ecs.component.component_store import ColumnStore
+from nyx.moirai_ecs.component.transform_components import PositionComponent
+
+
+def _position_store() -> ColumnStore:
+    """Create a position store with a small capacity, so adding entities grows it."""
+    return ColumnStore(
+        PositionComponent,
+        {"x_pos": np.float64, "y_pos": np.float64, "render_x_pos": np.int64, "render_y_pos": np.int64},
+        capacity=2,
+    )
+
+
+def test_views_read_and_write_columns():
+    """Test that views and dense columns share the same storage."""
+    store = _position_store()
+    for entity_id in (5, 9, 2):
+        store[entity_id] = PositionComponent(entity_id, 1)
+    view = store[9]
+    assert isinstance(view, PositionComponent)
+    assert view == PositionComponent(9, 1)
+
+    store.column("x_pos")[:] += 0.5
+    view.render_x_pos = 42
+    assert view.x_pos == 9.5
+    assert store.column("render_x_pos")[store.row_of(9)] == 42
+    np.testing.assert_array_equal(store.dense_entity_ids, [5, 9, 2])
+
+
+def test_swap_remove_keeps_views_valid():
+    """Test that removing an entity moves the last row without invalidating other views."""
+    store = _position_store()
+    for entity_id in range(4):
+        store[entity_id] = PositionComponent(entity_id * 10, 0)
+    last_view = store[3]
+    del store[1]
+
+    assert len(store) == 3 and 1 not in store
+    assert store.row_of(3) == 1
+    assert last_view.x_pos == 30
+    assert list(store) == [0, 3, 2]
+    with pytest.raises(KeyError):
+        store[1]
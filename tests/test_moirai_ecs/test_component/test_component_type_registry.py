@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from nyx.moirai_ecs.component.base_components import NyxComponent
+from nyx.moirai_ecs.component.component_manager import ComponentManager
+from nyx.moirai_ecs.component.component_store import ColumnStore
+from nyx.moirai_ecs.component.component_type_registry import ComponentTypeRegistry
+from nyx.moirai_ecs.component.transform_components import PositionComponent, VelocityComponent
+
+
+class HealthComponent(NyxComponent):
+    __slots__ = ("hit_points",)
+
+    def __init__(self, hit_points: int = 3):
+        self.hit_points = hit_points
+
+
+def test_registry_assigns_ids_and_masks():
+    """Test that types get sequential IDs, storage by ID and name-based bitmasks."""
+    registry = ComponentTypeRegistry()
+    assert registry.register("tag") == 0
+    assert registry.register("health", HealthComponent, {"hit_points": np.int64}) == 1
+
+    assert isinstance(registry.stores[1], ColumnStore)
+    assert registry.mask_of("tag", "health") == 0b11
+    assert registry.names_in(0b10) == ["health"]
+    with pytest.raises(ValueError):
+        registry.register("tag")
+    with pytest.raises(KeyError):
+        registry.type_id("missing")
+
+
+def test_dynamic_component_types_in_queries_and_masks():
+    """Test that runtime-registered types are stored, masked and queried like built-in ones."""
+    component_manager = ComponentManager()
+    health_id = component_manager.register_component_type(
+        "health", HealthComponent, {"hit_points": np.int64}
+    )
+    living = component_manager.query("position", "health")
+    component_manager.add_component(1, "position", PositionComponent())
+    component_manager.add_component(1, "health", HealthComponent(5))
+    component_manager.add_component(2, "health", HealthComponent())
+
+    assert component_manager.stores[health_id] is component_manager.component_registry["health"]
+    assert component_manager.get_component(1, "health").hit_points == 5
+    assert list(living) == [1]
+    position_id = component_manager.component_types.type_id("position")
+    assert component_manager.component_mask(1) == (1 << position_id) | (1 << health_id)
+
+    component_manager.add_components(np.array([3, 4]), "velocity", VelocityComponent())
+    component_manager.remove_component(1, "health")
+    component_manager.remove_entities(np.array([2, 3]))
+
+    assert list(living) == []
+    assert component_manager.component_mask(2) == 0
+    assert list(component_manager.component_registry["velocity"]) == [4]
+    assert sorted(component_manager.query("velocity")) == [4]
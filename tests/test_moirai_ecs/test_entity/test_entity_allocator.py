@@ -0,0 +1,55 @@
+import numpy as np
+
+from nyx.moirai_ecs.component.transform_components import PositionComponent
+from nyx.moirai_ecs.component.component_store import ColumnStore
+from nyx.moirai_ecs.entity.entity_allocator import EntityAllocator, EntityId
+from nyx.moirai_ecs.entity.moirai_entity_manager import MoiraiEntityManager
+from nyx.nyx_engine.nyx_engine import NyxEngine
+
+
+def test_allocator_recycles_slots_with_new_generation():
+    """Test that freed slots are reused with a bumped generation and stale IDs are dead."""
+    allocator = EntityAllocator(capacity=2)
+    first, second, third = allocator.allocate(), allocator.allocate(), allocator.allocate()
+    assert [EntityId.index(eid) for eid in (first, second, third)] == [0, 1, 2]
+
+    assert allocator.release(first)
+    assert not allocator.release(first)
+    recycled = allocator.allocate()
+
+    assert EntityId.index(recycled) == 0
+    assert EntityId.generation(recycled) == 1
+    assert recycled != first
+    assert allocator.is_alive(recycled) and not allocator.is_alive(first)
+    assert not allocator.is_alive(-1)
+    assert allocator.slot_count == 3 and allocator.alive_count == 3
+
+
+def test_spawn_churn_keeps_indices_dense():
+    """Test that constant spawning/despawning never grows the slot range past the peak."""
+    manager = MoiraiEntityManager(NyxEngine())
+    live = [manager.create_entity().entity_id for _ in range(8)]
+    for _ in range(1000):
+        manager.destroy_entity(live.pop(0))
+        live.append(manager.create_entity().entity_id)
+
+    assert manager.allocator.slot_count == 8
+    assert all(manager.is_alive(eid) for eid in live)
+
+
+def test_column_store_rejects_stale_ids():
+    """Test that a store indexed by slot never resolves a stale ID to the slot's new owner."""
+    allocator = EntityAllocator()
+    store = ColumnStore(PositionComponent, {"x_pos": np.float64, "y_pos": np.float64})
+    old = allocator.allocate()
+    store[old] = PositionComponent(x_pos=1, y_pos=1)
+    del store[old]
+    allocator.release(old)
+
+    new = allocator.allocate()
+    store[new] = PositionComponent(x_pos=2, y_pos=2)
+
+    assert EntityId.index(new) == EntityId.index(old)
+    assert new in store and old not in store
+    assert store.rows_of(np.array([old, new])).tolist() == [-1, 0]
+    assert store.sparse.size == 64
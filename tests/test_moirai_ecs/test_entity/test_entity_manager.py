@@ -1,4 +1,8 @@
+import numpy as np
 
+from nyx.moirai_ecs.component.component_manager import ComponentManager
+from nyx.moirai_ecs.component.texture_components import TextureComponent
+from nyx.moirai_ecs.component.transform_components import PositionComponent, VelocityComponent
 from nyx.moirai_ecs.entity.moirai_entity_manager import MoiraiEntityManager
 from nyx.moirai_ecs.entity.nyx_entity import NyxEntity
 from nyx.nyx_engine.nyx_engine import NyxEngine
@@ -33,7 +37,7 @@ def test_reset_entity_registry():
     entity_fate_manager.reset_entity_registry()
 
     # Get the cleared registry
-    entity_manager_list = MoiraiEntityManager.entity_registry
+    entity_manager_list = entity_fate_manager.entity_registry
 
     # Remove the entities
     for entity in entity_list:
@@ -51,7 +55,7 @@ def test_destroy_entity():
         entity_list.append(entity_fate_manager.create_entity())
 
     # Get the registry
-    entity_manager_list = MoiraiEntityManager.entity_registry
+    entity_manager_list = entity_fate_manager.entity_registry
 
     # Remove the entities
     for entity in entity_list:
@@ -91,3 +95,33 @@ def test_get_all_entities():
         entity_list.append(entity_fate_manager.create_entity())
 
     assert len(entity_fate_manager.get_all_entities()) == 10
+
+
+def test_spawn_and_destroy_many(fresh_engine):
+    """Test creating entities from a component template and destroying them in batches."""
+    engine = fresh_engine
+    entity_fate_manager = engine.entity_manager
+    moving = engine.query("position", "velocity")
+    template = {
+        "position": PositionComponent(5, 0),
+        "velocity": VelocityComponent(100, 0),
+        "texture": TextureComponent(np.ones((2, 2), dtype=np.uint8)),
+    }
+
+    ids = entity_fate_manager.spawn_many(
+        template, 4, overrides={"position": {"y_pos": np.arange(4.0)}}
+    )
+
+    positions = engine.component_registry["position"]
+    assert [positions[eid].y_pos for eid in ids] == [0.0, 1.0, 2.0, 3.0]
+    assert all(positions[eid].x_pos == 5 for eid in ids)
+    assert sorted(moving) == sorted(ids.tolist())
+    assert all(entity_fate_manager.is_alive(eid) for eid in ids)
+
+    removed = entity_fate_manager.destroy_many(np.append(ids[:2], -1))
+
+    assert removed.tolist() == sorted(ids[:2].tolist())
+    assert sorted(moving) == sorted(ids[2:].tolist())
+    assert list(positions) == ids[2:].tolist()
+    assert ids[0] not in engine.component_registry["texture"]
+    assert not entity_fate_manager.is_alive(ids[0])
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from nyx.moirai_ecs.component.texture_components import TextureComponent
+from nyx.moirai_ecs.component.transform_components import PositionComponent, VelocityComponent
+from nyx.moirai_ecs.entity.entity_allocator import EntityId
+from nyx.moirai_ecs.entity.entity_pool import EntityPool
+
+
+@pytest.fixture
+def entity_manager(fresh_engine):
+    return fresh_engine.entity_manager
+
+
+def make_prefab():
+    return {
+        "position": PositionComponent(1, 2),
+        "velocity": VelocityComponent(600, 0),
+        "texture": TextureComponent(np.ones((1, 3), dtype=np.uint8)),
+    }
+
+
+def test_pool_recycles_entities_and_resets_state(entity_manager):
+    """Test that released entities are reused with their components reset to the prefab."""
+    pool = EntityPool(entity_manager, make_prefab(), capacity=2)
+    registry = entity_manager.component_manager.component_registry
+    first, second = pool.acquire(2, overrides={"position": {"x_pos": [10, 20]}}).tolist()
+
+    assert registry["position"][second].x_pos == 20
+    assert registry["texture"][first] is not registry["texture"][second]
+    registry["texture"][first].texture = None
+    registry["position"][first].x_pos = 99
+
+    entity_manager.destroy_entity(first)
+
+    assert first not in registry["position"] and first not in registry["texture"]
+    assert not entity_manager.is_alive(first)
+    (again,) = pool.acquire().tolist()
+    assert again != first and EntityId.index(again) == EntityId.index(first)
+    assert again in entity_manager.entity_registry and first not in entity_manager.entity_registry
+    assert registry["position"][again].x_pos == 1
+    assert registry["texture"][again].texture is not None
+    assert (pool.capacity, pool.in_use, pool.high_water_mark) == (2, 2, 2)
+
+
+def test_pool_growth_and_limit(entity_manager):
+    """Test that the pool grows on demand, tracks its high water mark and honors max_size."""
+    pool = EntityPool(entity_manager, make_prefab(), capacity=2, max_size=4)
+    ids = pool.acquire(3)
+    entity_manager.destroy_many(ids)
+
+    assert (pool.capacity, pool.in_use, pool.high_water_mark) == (4, 0, 3)
+    with pytest.raises(ValueError):
+        pool.acquire(5)
+
+
+def test_pool_release_invalidates_stale_handles(entity_manager):
+    """Test that a handle to a released entity stays stale after its slot is acquired again."""
+    pool = EntityPool(entity_manager, make_prefab(), capacity=1)
+    registry = entity_manager.component_manager.component_registry
+    (stale,) = pool.acquire().tolist()
+    entity_manager.destroy_entity(stale)
+    (fresh,) = pool.acquire().tolist()
+
+    assert entity_manager.is_alive(fresh) and not entity_manager.is_alive(stale)
+    assert stale not in registry["position"] and fresh in registry["position"]
+    # A command queued against the stale handle does not touch the new occupant
+    entity_manager.destroy_entity(stale)
+    assert pool.in_use == 1 and fresh in registry["position"]
+
+
+def test_destroy_pooled_entities_for_real(entity_manager):
+    """Test that destroy_many(release_pooled=False) removes entities from their pool and kills them."""
+    pool = EntityPool(entity_manager, make_prefab(), capacity=3)
+    registry = entity_manager.component_manager.component_registry
+    ids = pool.acquire(2)
+
+    entity_manager.destroy_many(ids[:1], release_pooled=False)
+
+    assert not entity_manager.is_alive(int(ids[0])) and ids[0] not in registry["position"]
+    assert (pool.capacity, pool.in_use) == (2, 1)
+    assert not pool.owns(ids[:1]).any() and pool.owns(ids[1:]).all()
+    assert len(pool.acquire().tolist()) == 1 and pool.in_use == 2
@@ -1,17 +1,21 @@
+from nyx.moirai_ecs.entity.moirai_entity_manager import MoiraiEntityManager
 from nyx.moirai_ecs.entity.nyx_entity import NyxEntity
+from nyx.nyx_engine.nyx_engine import NyxEngine
 
 
 def test_entity_init():
-    entity = NyxEntity("friendly-name")
+    entity = NyxEntity("friendly-name", entity_id=7)
     assert isinstance(entity, NyxEntity)
     assert entity.friendly_name == "friendly-name"
+    assert entity.entity_id == 7
 
 
 def test_unique_entity_id():
-    """Test if each entity gets a unique ID"""
+    """Test if each entity gets a unique ID from its entity manager"""
+    entity_manager = MoiraiEntityManager(NyxEngine())
     id_list = []
     for _ in range(10):
-        entity = NyxEntity()
+        entity = entity_manager.create_entity()
         id_list.append(entity.entity_id)
 
     assert len(set(id_list)) == len(id_list)
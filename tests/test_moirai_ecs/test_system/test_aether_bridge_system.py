@@ -0,0 +1,57 @@
+import numpy as np
+
+from nyx.aether_renderer.aether_renderer import AetherRenderer
+from nyx.moirai_ecs.component.texture_components import TextureComponent
+from nyx.moirai_ecs.component.transform_components import PositionComponent, ZIndexComponent
+
+
+def test_bridge_batches_sprites_from_query(fresh_engine):
+    """Test that sprites sharing a texture are batched per layer in creation order."""
+    engine = fresh_engine
+    component_manager = engine.component_manager
+    shared, single = np.ones((2, 2), dtype=np.uint8), np.ones((1, 1), dtype=np.uint8)
+    for entity_id, (z_index, texture) in enumerate(
+        [(1, shared), (2, single), (1, shared), (1, shared)]
+    ):
+        for name, component in (
+            ("position", PositionComponent(entity_id, 10 * entity_id)),
+            ("z-index", ZIndexComponent(z_index)),
+            ("texture", TextureComponent(texture)),
+        ):
+            component_manager.add_component(entity_id, name, component)
+    # Entities missing a sprite component are not rendered
+    component_manager.add_component(9, "position", PositionComponent())
+    component_manager.remove_component(3, "texture")
+
+    engine.aether_bridge.update()
+    layers = engine.aether_bridge.renderable_entities
+    assert sorted(layers) == [1, 2]
+    xs, ys, texture = layers[1][0]
+    assert texture is shared and xs.tolist() == [0, 2] and ys.tolist() == [0, 20]
+    assert layers[2] == [(1, 10, single)]
+
+
+def test_bridge_keeps_creation_draw_order(fresh_engine):
+    """Test that overlapping sprites are drawn in creation order, even with recycled IDs."""
+    engine = fresh_engine
+    texture_a, texture_b = np.full((2, 2), 5, dtype=np.uint8), np.full((2, 2), 7, dtype=np.uint8)
+
+    def spawn(texture):
+        template = {
+            "position": PositionComponent(3, 3),
+            "z-index": ZIndexComponent(1),
+            "texture": TextureComponent(texture),
+        }
+        return int(engine.entity_manager.spawn_many(template, 1)[0])
+
+    engine.entity_manager.destroy_many(engine.entity_manager.spawn_many({}, 1))
+    # The first sprite recycles the destroyed slot, so its ID sorts after the later ones
+    first, middle, last = spawn(texture_a), spawn(texture_b), spawn(texture_b)
+    assert first > last > middle
+
+    engine.aether_bridge.update()
+    layer = engine.aether_bridge.renderable_entities[1]
+    assert [batch[2] is texture_b for batch in layer] == [False, True]
+    assert layer[1][0].tolist() == [3, 3]
+    frame = AetherRenderer().accept_entities(engine.aether_bridge.renderable_entities).render()
+    assert frame[3, 3] == 7
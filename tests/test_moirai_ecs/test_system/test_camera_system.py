@@ -0,0 +1,46 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from nyx.moirai_ecs.component.texture_components import TextureComponent
+from nyx.moirai_ecs.component.transform_components import (
+    CameraComponent,
+    PositionComponent,
+    VelocityComponent,
+)
+
+
+def test_camera_rehashes_only_cell_changes(fresh_engine, monkeypatch):
+    """Test that movers are re-hashed only when they cross cells, and visibility stays exact."""
+    engine = fresh_engine
+    camera_system = engine.camera_system
+    viewport = SimpleNamespace(effective_window_w=8, effective_window_h=12)
+    monkeypatch.setattr(engine, "aether_dimensions", viewport)
+    engine.entity_manager.spawn_many({"camera": CameraComponent(0, 0)}, 1)
+    still = engine.entity_manager.spawn_many(
+        {"position": PositionComponent(-30, 5), "texture": TextureComponent(np.ones((2, 2), dtype=np.uint8))}, 1
+    )
+    movers = engine.entity_manager.spawn_many(
+        {"position": PositionComponent(), "velocity": VelocityComponent(1, 0)},
+        3,
+        overrides={"position": {"render_x_pos": np.array([2, 62, 100])}},
+    )
+    camera_system.update()
+    assert camera_system.visible_entities == {int(movers[0])}
+    assert int(still[0]) in camera_system.grid
+
+    rehashed = []
+    update = camera_system.grid.update
+    monkeypatch.setattr(
+        camera_system.grid, "update", lambda eid, *box: rehashed.append(eid) or update(eid, *box)
+    )
+    engine.component_registry["position"].column("render_x_pos")[1:] += 2
+    camera_system.update()
+    # Only the mover crossing from cell 0 (x=62) into cell 1 (x=64) is re-hashed
+    assert rehashed == [int(movers[1])]
+
+    engine.entity_manager.destroy_many(movers[:1])
+    camera_system.camera.x_pos = 60
+    camera_system.update()
+    assert camera_system.visible_entities == {int(movers[1])}
+    assert int(movers[0]) not in camera_system.grid
@@ -0,0 +1,47 @@
+from nyx.moirai_ecs.component.transform_components import PositionComponent, VelocityComponent
+from nyx.moirai_ecs.system.base_systems import BaseSystem
+from nyx.moirai_ecs.system.command_buffer import CommandBuffer
+
+
+class SplitSystem(BaseSystem):
+    """Destroys every entity right of x=10 and spawns two fragments in its place."""
+
+    def update(self):
+        positions = self.engine.component_registry["position"]
+        for entity_id in positions:
+            if positions[entity_id].x_pos > 10:
+                self.commands.destroy(entity_id)
+                self.commands.spawn({"position": PositionComponent(0, 0)}, 2)
+
+
+def test_structural_changes_apply_after_systems(fresh_engine):
+    """Test that commands recorded while iterating are applied once, after every system."""
+    engine = fresh_engine
+    engine.add_system(SplitSystem())
+    ids = engine.entity_manager.spawn_many({"position": PositionComponent(20, 0)}, 3)
+
+    engine.trigger_systems()
+
+    positions = engine.component_registry["position"]
+    assert len(positions) == 6
+    assert all(positions[eid].x_pos == 0 for eid in positions)
+    assert not any(engine.entity_manager.is_alive(eid) for eid in ids)
+    # Three destroys and three spawns, applied in recorded order
+    assert engine.commands.commands_applied == 6 and len(engine.commands) == 0
+
+
+def test_commands_on_dead_entities_are_dropped(fresh_engine):
+    """Test that add/remove commands targeting entities destroyed earlier are skipped."""
+    engine = fresh_engine
+    entity_manager = engine.entity_manager
+    alive, doomed = entity_manager.spawn_many({"position": PositionComponent()}, 2).tolist()
+    commands = CommandBuffer()
+
+    commands.destroy(doomed)
+    commands.add_component(doomed, "velocity", VelocityComponent(1, 1))
+    commands.add_component(alive, "velocity", VelocityComponent(1, 1))
+    commands.remove_component(alive, "dimensions")
+    commands.flush(entity_manager)
+
+    assert list(engine.component_registry["velocity"]) == [alive]
+    assert list(engine.component_registry["position"]) == [alive]
@@ -0,0 +1,27 @@
+import os
+import pty
+import time
+
+from nyx.hemera_term_fx.terminal_input import TerminalInput
+from nyx.moirai_ecs.system.input_system import InputSystem
+
+
+def test_input_system_drains_keys_once_per_tick(fresh_engine):
+    """Test that each tick sees exactly the keys typed since the previous tick."""
+    master, slave = pty.openpty()
+    try:
+        with TerminalInput(fd=slave) as terminal_input:
+            input_system = InputSystem(terminal_input)
+            fresh_engine.add_system(input_system)
+            os.write(master, b"ab")
+            deadline = time.monotonic() + 2.0
+            while len(terminal_input.keys) < 2 and time.monotonic() < deadline:
+                time.sleep(0.005)
+
+            fresh_engine.trigger_systems()
+            assert input_system.keys == ["a", "b"] and input_system.is_pressed("b")
+            fresh_engine.trigger_systems()
+            assert input_system.keys == []
+    finally:
+        os.close(master)
+        os.close(slave)
@@ -0,0 +1,67 @@
+import numpy as np
+
+from nyx.moirai_ecs.component.transform_components import PositionComponent, VelocityComponent
+from nyx.moirai_ecs.system.movement_system import MovementSystem
+
+
+def _registry_with_movers(engine):
+    """Fill the engine's registry with mismatched position/velocity entities."""
+    component_manager = engine.component_manager
+    engine.sec_per_game_loop = 0.1
+    for entity_id in range(4):
+        component_manager.add_component(entity_id, "position", PositionComponent(entity_id, 0))
+    for entity_id in (3, 1, 7):
+        component_manager.add_component(entity_id, "velocity", VelocityComponent(12, -3))
+    return component_manager.component_registry
+
+
+def test_moves_only_entities_with_both_components(fresh_engine):
+    """Test that the vectorized update matches the per-entity formula."""
+    registry = _registry_with_movers(fresh_engine)
+    system = MovementSystem().attach(fresh_engine)
+    system.update()
+    assert system.moved_last_update == 2
+    positions = registry["position"]
+    assert (positions[1].x_pos, positions[1].render_x_pos) == (2.2, 2)
+    assert (positions[3].y_pos, positions[3].render_y_pos) == (-3 * 0.1, 0)
+    assert positions[0].x_pos == 0 and positions[2].x_pos == 2
+
+
+def test_fixed_point_has_no_drift(fresh_engine):
+    """Test that fixed-point positions advance by exact sub-pixel steps."""
+    registry = _registry_with_movers(fresh_engine)
+    registry["velocity"][1] = VelocityComponent(2.56, 0)
+    system = MovementSystem(fixed_point=True, fraction_bits=8).attach(fresh_engine)
+    for _ in range(1000):
+        system.update()
+    # 0.256 px per update is 65.536 sub-pixel units, quantized to 66/256 px
+    assert registry["position"][1].x_pos == 1 + 1000 * 66 / 256
+    np.testing.assert_array_equal(
+        registry["position"].column("render_x_pos")[[1]], [round(1 + 1000 * 66 / 256)]
+    )
+
+
+def test_interpolated_render_positions(fresh_engine):
+    """Test that render positions blend between the previous and the current update."""
+    registry = _registry_with_movers(fresh_engine)
+    registry["velocity"][1] = VelocityComponent(40, 0)
+    system = MovementSystem(interpolate_render=True).attach(fresh_engine)
+    system.update()
+    # Entity 1 moved from x=1 to x=5; a quarter of the way is x=2
+    system.interpolate(0.25)
+    assert registry["position"][1].render_x_pos == 2
+    assert registry["position"][1].x_pos == 5
+
+
+def test_fixed_point_state_is_integer_and_rounds_like_float(fresh_engine):
+    """Test that fixed-point positions persist as integers and round like float mode."""
+    registry = _registry_with_movers(fresh_engine)
+    registry["velocity"][1] = VelocityComponent(15, 0)
+    positions = registry["position"]
+    system = MovementSystem(fixed_point=True).attach(fresh_engine)
+    system.update()
+    # x=2.5 is kept as 640/256 and rounds half to even, as np.rint does in float mode
+    assert positions.column("x_pos_fixed")[positions.row_of(1)] == 640
+    assert (positions[1].x_pos, positions[1].render_x_pos) == (2.5, 2)
+    system.update()
+    assert positions.column("x_pos_fixed")[positions.row_of(1)] == 1024
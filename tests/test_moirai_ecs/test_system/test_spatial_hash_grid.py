@@ -0,0 +1,46 @@
+import numpy as np
+
+from nyx.aether_renderer.aether_renderer import AetherRenderer
+from nyx.moirai_ecs.system.spatial_hash_grid import SpatialHashGrid
+
+
+def test_query_returns_only_intersecting_entities():
+    """Test that a query returns entities overlapping the rectangle and nothing else."""
+    grid = SpatialHashGrid(cell_size=16)
+    grid.update(1, 0, 0, 8, 8)
+    grid.update(2, 100, 100, 8, 8)
+    grid.update(3, 40, 40, 4, 4)
+    assert grid.query(0, 0, 40, 40) == {1}
+    assert grid.query(0, 0, 41, 41) == {1, 3}
+    assert grid.query(1000, 1000, 10, 10) == set()
+
+
+def test_update_moves_entity_between_cells():
+    """Test that moving an entity re-buckets it only when its cell range changes."""
+    grid = SpatialHashGrid(cell_size=16)
+    assert grid.update(1, 0, 0, 4, 4)
+    assert not grid.update(1, 2, 2, 4, 4)
+    assert grid.update(1, 40, 40, 4, 4)
+    assert grid.query(0, 0, 16, 16) == set()
+    assert grid.query(32, 32, 16, 16) == {1}
+
+
+def test_remove_drops_empty_cells():
+    """Test that removing the last entity of a cell removes the cell bucket."""
+    grid = SpatialHashGrid(cell_size=16)
+    grid.update(1, -20, -20, 40, 40)
+    grid.remove(1)
+    assert 1 not in grid
+    assert grid.cells == {}
+
+
+def test_negative_offsets_are_clipped():
+    """Test that sprites hanging off the top/left edges are clipped instead of wrapped."""
+    renderer = AetherRenderer()
+    texture = np.arange(1, 17, dtype=np.uint8).reshape(4, 4)
+    renderer.layered_entities = {1: [(-2, -1, texture)]}
+    renderer._process_layers()
+    subframe = renderer.layered_frames[1]
+    np.testing.assert_array_equal(subframe[:3, :2], texture[1:, 2:])
+    assert subframe[3:, :].sum() == 0
+    assert subframe[:, 2:].sum() == 0
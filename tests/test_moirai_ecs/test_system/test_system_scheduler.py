@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+
+from nyx.moirai_ecs.component.transform_components import PositionComponent
+from nyx.moirai_ecs.system.base_systems import BaseSystem
+from nyx.moirai_ecs.system.command_buffer import CommandBuffer
+from nyx.moirai_ecs.system.system_scheduler import SystemScheduler
+
+
+class DeclaredSystem(BaseSystem):
+    """Records a spawn command once every system of its stage has started."""
+
+    def __init__(self, reads=(), writes=(), barrier=None, fail=False):
+        self.reads = reads
+        self.writes = writes
+        self.barrier = barrier
+        self.fail = fail
+        self.template = {"position": PositionComponent()}
+
+    def update(self):
+        if self.barrier is not None:
+            # Only passes if the whole stage runs concurrently
+            self.barrier.wait(timeout=5)
+        if self.fail:
+            raise RuntimeError("system failed")
+        self.commands.spawn(self.template)
+
+
+class UndeclaredSystem(BaseSystem):
+    def update(self):
+        pass
+
+
+def test_build_stages_orders_conflicts():
+    """Test that conflicting systems are staged in registration order and others share a stage."""
+    movement = DeclaredSystem(reads=("velocity",), writes=("position",))
+    particles = DeclaredSystem(writes=("particle-pools",))
+    bridge = DeclaredSystem(reads=("position", "texture"))
+    legacy = UndeclaredSystem()
+    tiles = DeclaredSystem(writes=("tilemap-layers",))
+
+    stages = SystemScheduler().build_stages([movement, particles, bridge, legacy, tiles])
+
+    assert stages == [[movement, particles], [bridge], [legacy], [tiles]]
+
+
+def test_parallel_stage_merges_commands_in_registration_order():
+    """Test that a stage runs concurrently and its commands are merged deterministically."""
+    barrier = threading.Barrier(3)
+    systems = [DeclaredSystem(writes=(f"resource-{i}",), barrier=barrier) for i in range(3)]
+    commands = CommandBuffer()
+    scheduler = SystemScheduler(max_workers=3)
+
+    scheduler.run(systems, commands)
+    scheduler.shutdown()
+
+    assert [command[1] for command in commands.commands] == [s.template for s in systems]
+    assert len(scheduler.stages) == 1
+    assert "stage 0: 0:DeclaredSystem" in scheduler.describe()
+    assert set(scheduler.timings) == {"0:DeclaredSystem", "1:DeclaredSystem", "2:DeclaredSystem"}
+
+
+def test_system_errors_propagate_after_the_stage():
+    """Test that a failing system raises once its stage finished, keeping recorded commands."""
+    systems = [DeclaredSystem(writes=("a",), fail=True), DeclaredSystem(writes=("b",))]
+    commands = CommandBuffer()
+
+    with pytest.raises(RuntimeError):
+        SystemScheduler().run(systems, commands)
+    assert len(commands) == 1
+    assert not hasattr(systems[0], "_commands")
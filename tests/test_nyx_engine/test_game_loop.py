@@ -0,0 +1,69 @@
+import pytest
+
+from nyx.nyx_engine.game_loop import FramePacer, GameLoop
+
+
+class FakeClock:
+    """A manually advanced clock whose sleep advances time (plus a fixed overshoot)."""
+
+    def __init__(self, overshoot: float = 0.0):
+        self.now = 100.0
+        self.overshoot = overshoot
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds + self.overshoot
+
+
+def test_game_loop_fixed_step_and_render_rate():
+    """Test that updates run at the fixed step and frames at the render rate, independently."""
+    clock = FakeClock()
+    alphas = []
+    loop = GameLoop(
+        update=lambda: None,
+        render=alphas.append,
+        update_interval=1 / 60,
+        render_interval=1 / 30,
+        clock=clock,
+        sleep=clock.sleep,
+    )
+    loop.run(max_ticks=60)
+
+    assert loop.ticks == 60
+    assert clock.now - 100.0 == pytest.approx(1.0)
+    assert loop.frames in (30, 31)
+    assert all(0.0 <= alpha < 1.0 for alpha in alphas)
+
+
+def test_game_loop_catch_up_cap():
+    """Test that a stall runs at most `max_catch_up_steps` updates and drops the rest."""
+    clock = FakeClock()
+    loop = GameLoop(
+        update=lambda: None,
+        render=lambda alpha: None,
+        update_interval=0.01,
+        render_interval=0.05,
+        max_catch_up_steps=3,
+        clock=clock,
+        sleep=clock.sleep,
+    )
+    loop.step()
+    clock.now += 1.0
+    assert loop.step() == 3
+    assert loop.dropped_time == pytest.approx(0.96)
+
+
+def test_frame_pacer_does_not_drift():
+    """Test that sleep overshoot is absorbed by the next deadline instead of accumulating."""
+    clock = FakeClock(overshoot=0.004)
+    pacer = FramePacer(0.1, clock=clock, sleep=clock.sleep)
+    for _ in range(50):
+        pacer.wait()
+
+    # 50 frames end within one overshoot of 5 seconds, rather than 50 overshoots late
+    assert clock.now - 100.0 == pytest.approx(5.0, abs=0.005)
+    assert pacer.missed_deadlines == 0
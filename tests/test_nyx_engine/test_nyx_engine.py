@@ -0,0 +1,139 @@
+import time
+
+import numpy as np
+import pytest
+
+from nyx.hemera_term_fx.terminal_sink import TerminalSink
+from nyx.moirai_ecs.component.texture_components import TextureComponent
+from nyx.moirai_ecs.component.transform_components import (
+    CameraComponent,
+    DimensionsComponent,
+    PositionComponent,
+    VelocityComponent,
+    ZIndexComponent,
+)
+from nyx.moirai_ecs.system.movement_system import MovementSystem
+from nyx.nyx_engine.nyx_engine import NyxEngine
+
+
+def test_kill_entities_culls_every_edge(fresh_engine):
+    """Test that entities beyond any edge of the window (plus bounds) are culled in one pass."""
+    engine = fresh_engine
+    window_w = engine.aether_renderer.dimensions.effective_window_w
+    window_h = engine.aether_renderer.dimensions.effective_window_h
+
+    def spawn(x, y, width=None):
+        template = {"position": PositionComponent(x, y)}
+        if width is not None:
+            template["dimensions"] = DimensionsComponent(2, width)
+        return int(engine.entity_manager.spawn_many(template, 1)[0])
+
+    kept = [
+        spawn(0, 0),
+        spawn(window_w + 9, 0),
+        spawn(-10, window_h + 9),
+        spawn(-15, 0, width=6),
+    ]
+    culled = [
+        spawn(window_w + 10, 0),
+        spawn(0, window_h + 10),
+        spawn(-11, 0),
+        spawn(0, -11),
+        spawn(-17, 0, width=6),
+    ]
+
+    assert sorted(engine.kill_entities().tolist()) == culled
+    assert sorted(engine.component_registry["position"]) == kept
+    assert all(not engine.entity_manager.is_alive(eid) for eid in culled)
+
+
+def test_kill_entities_keeps_off_screen_world_entities(fresh_engine):
+    """Test that a camera world only culls beyond the world bounds (or the viewport, opt-in)."""
+    engine = fresh_engine
+    engine.entity_manager.spawn_many({"camera": CameraComponent(600, 0)}, 1)
+    engine.camera_system.update()
+    ids = engine.entity_manager.spawn_many(
+        {"position": PositionComponent()}, 40, overrides={"position": {"x_pos": np.arange(40) * 50}}
+    )
+    engine.component_registry["position"].column("render_x_pos")[:] = np.arange(40) * 50
+
+    assert engine.kill_entities().size == 0
+    engine.world_bounds = (0, 0, 1500, 1000)
+    assert engine.kill_entities().tolist() == ids[31:].tolist()
+    window_w = engine.aether_renderer.dimensions.effective_window_w
+    kept = engine.component_registry["position"].column("render_x_pos")
+    kept = kept[(kept >= 590) & (kept < 610 + window_w)]
+    engine.kill_entities(viewport=True)
+    np.testing.assert_array_equal(engine.component_registry["position"].column("render_x_pos"), kept)
+
+
+def test_run_headless_is_deterministic_and_reports(fresh_engine):
+    """Test that a headless run sizes frames from the window, encodes into a sink and reports."""
+    engine = fresh_engine
+    engine.add_system(MovementSystem())
+
+    def update():
+        x, y = np.random.randint(0, 40, 2)
+        engine.entity_manager.spawn_many(
+            {
+                "position": PositionComponent(x, y),
+                "velocity": VelocityComponent(30, 0),
+                "dimensions": DimensionsComponent(2, 2),
+                "z-index": ZIndexComponent(1),
+                "texture": TextureComponent(np.full((2, 2), 9, dtype=np.uint8)),
+            },
+            1,
+        )
+        engine.trigger_systems()
+
+    outputs = []
+    for _ in range(2):
+        sink = TerminalSink(keep_output=True)
+        report = engine.run_headless(10, seed=3, window_h=24, window_w=40, update=update, sink=sink)
+        outputs.append(sink.getvalue())
+        engine.entity_manager.destroy_many(engine.component_registry["position"].dense_entity_ids)
+        engine.hemera_term_fx.old_subpixel_frame = None
+
+    assert outputs[0] == outputs[1] and outputs[0]
+    assert (report.ticks, report.frames) == (10, 6)
+    assert report.bytes_per_frame == sink.bytes_written / 6
+    assert {"systems", "commands", "bridge", "compose", "encode"} <= set(report.stage_times)
+    assert engine.aether_renderer.merged_frame.shape == (24, 40)
+    assert engine.hemera_term_fx.output is None and not engine.aether_dimensions.headless
+
+
+def test_engines_do_not_share_state():
+    """Test that two engines have separate entities, components, systems and renderers."""
+    first, second = NyxEngine(), NyxEngine()
+    movers = {"position": PositionComponent(0, 0), "velocity": VelocityComponent(60, 0)}
+    first_ids = first.entity_manager.spawn_many(movers, 3)
+    second_ids = second.entity_manager.spawn_many(movers, 1)
+    system = MovementSystem()
+    first.add_system(system)
+
+    first.trigger_systems()
+
+    assert first_ids[0] == second_ids[0]
+    assert len(first.entity_manager.entity_registry) == 3
+    assert len(second.entity_manager.entity_registry) == 1
+    assert first.component_registry["position"].column("x_pos").tolist() == [1.0] * 3
+    assert second.component_registry["position"].column("x_pos").tolist() == [0.0]
+    assert first.aether_renderer is not second.aether_renderer
+    assert system.engine is first and first.camera_system.engine is first
+    with pytest.raises(ValueError):
+        second.add_system(system)
+
+
+def test_resolution_scaler_ignores_encode_time(fresh_engine, monkeypatch):
+    """Test that only the composition time, against the engine's frame budget, drives the
+    resolution scaler."""
+    engine = fresh_engine
+    engine.aether_renderer.resolution_scaler.enabled = True
+    monkeypatch.setattr(engine.hemera_term_fx, "print", lambda frame: time.sleep(0.2))
+
+    engine.run_headless(2, window_h=24, window_w=40)
+
+    scaler = engine.aether_renderer.resolution_scaler
+    assert scaler.frame_budget == engine.sec_per_frame
+    assert scaler.avg_frame_time < 0.1
+    assert scaler.scale == 1